@@ -23,8 +23,14 @@
 #
 """Test Configuration."""
 
+import os
+from pathlib import Path
+from shutil import copyfile
+
 import pytest
 
+TESTDATA = Path(__file__).parent / "tests" / "testdata"
+
 # https://stackoverflow.com/questions/46962007/how-to-automatically-change-to-pytest-temporary-directory-for-all-doctests
 
 
@@ -43,3 +49,37 @@ def _docdir(request):
     else:
         # For normal tests, we have to yield, since this is a yield-fixture.
         yield
+
+
+@pytest.fixture
+def create_workspace():
+    """Create Workspace With Template Directory ``tpl`` - With ``base.txt.mako``, ``impl.txt.mako`` And ``names``."""
+
+    def create(path: Path, *names: str) -> Path:
+        tpl_path = path / "tpl"
+        tpl_path.mkdir(parents=True)
+        for name in ("base.txt.mako", "impl.txt.mako", *names):
+            copyfile(TESTDATA / name, tpl_path / name)
+        return path
+
+    return create
+
+
+@pytest.fixture
+def tpl_path(tmp_path, create_workspace):
+    """Template Directory Within ``tmp_path``."""
+    return create_workspace(tmp_path) / "tpl"
+
+
+@pytest.fixture
+def update_file():
+    """Update File With A Distinct Modification Time - Independent Of The Timestamp Resolution."""
+
+    def update(path: Path, text: str, append: bool = False) -> None:
+        mtime_ns = path.stat().st_mtime_ns
+        with path.open("a" if append else "w") as file:
+            file.write(text)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, max(stat.st_mtime_ns, mtime_ns + 1_000_000_000)))
+
+    return update
@@ -187,24 +187,57 @@ That's it.
 
 from outputfile import Existing
 
-from .config import Config
+from .buildstate import BuildState
+from .cachebackend import CacheBackend, ChainBackend, FileBackend, HttpBackend
+from .cachemanager import CacheManager
+from .cacheserver import CacheServer
+from .cachestat import CacheStat
+from .config import CacheMode, Config
 from .datamodel import Datamodel
+from .depgraph import DepGraph
+from .digest import Digester, get_digest
 from .escape import tex
-from .exceptions import MakolatorError
+from .exceptions import DigestError, MakolatorError
 from .helper import indent, prefix, run
 from .info import Info, get_cli
 from .makolator import Makolator
+from .manifest import Manifest, ManifestJob
+from .registry import TEMPLATE_REGISTRY, TemplateRegistry
+from .rendercache import RenderCache, RenderEntry
+from .server import Server
 from .tracker import Tracker
+from .watch import Watcher
 
 __all__ = [
+    "TEMPLATE_REGISTRY",
+    "BuildState",
+    "CacheBackend",
+    "CacheManager",
+    "CacheMode",
+    "CacheServer",
+    "CacheStat",
+    "ChainBackend",
     "Config",
     "Datamodel",
+    "DepGraph",
+    "DigestError",
+    "Digester",
     "Existing",
+    "FileBackend",
+    "HttpBackend",
     "Info",
     "Makolator",
     "MakolatorError",
+    "Manifest",
+    "ManifestJob",
+    "RenderCache",
+    "RenderEntry",
+    "Server",
+    "TemplateRegistry",
     "Tracker",
+    "Watcher",
     "get_cli",
+    "get_digest",
     "indent",
     "prefix",
     "run",
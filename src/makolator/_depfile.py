@@ -0,0 +1,69 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Make And Ninja Compatible Dependency Files."""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+DEPFILE_SUFFIX = ".d"
+
+
+def get_depfile(filepath: Path) -> Path:
+    """
+    Dependency File Of ``filepath``.
+
+        >>> get_depfile(Path("file.txt")).name
+        'file.txt.d'
+    """
+    return filepath.with_name(f"{filepath.name}{DEPFILE_SUFFIX}")
+
+
+def format_depfile(target: Path, deps: Iterable[str]) -> str:
+    r"""
+    Format Dependency Rule Of ``target``.
+
+        >>> print(format_depfile(Path("out.txt"), ["b.mako", "a b.mako"]), end="")
+        out.txt: \
+          a\ b.mako \
+          b.mako
+    """
+    lines = [f"{_escape(str(target))}:", *(f"  {_escape(dep)}" for dep in sorted(set(deps)))]
+    return " \\\n".join(lines) + "\n"
+
+
+def write_depfile(target: Path, deps: Iterable[str]) -> Path:
+    """Write Dependency File Of ``target`` - If Its Content Changed."""
+    depfile = get_depfile(target)
+    text = format_depfile(target, deps)
+    try:
+        if depfile.read_text(encoding="utf-8") == text:
+            return depfile
+    except OSError:
+        depfile.parent.mkdir(parents=True, exist_ok=True)
+    depfile.write_text(text, encoding="utf-8")
+    return depfile
+
+
+def _escape(path: str) -> str:
+    return path.replace("\\", "/").replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
@@ -24,18 +24,22 @@
 """Inplace Generation."""
 
 import io
+import mmap
 import os
 import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
 from aligntext import Align
 from attrs import define, field
 from mako.exceptions import text_error_template
-from mako.lookup import TemplateLookup
 from mako.runtime import Context
-from mako.template import Template
+from mako.template import DefTemplate, Template
 
+from ._lookup import MakolatorTemplateLookup
 from ._util import LOGGER, check_indent, fill_marker
 from .config import Config
 from .exceptions import MakolatorError
@@ -62,6 +66,54 @@ class TplInfo:
     lines: list[str] = field(factory=list)
 
 
+@define
+class DefIndex:
+    """
+    Index Of Template Functions (``<%def>``).
+
+    The first template implementing a function wins.
+    """
+
+    _templates: dict[str, Template] = field(factory=dict)
+    _defs: dict[str, DefTemplate] = field(factory=dict)
+
+    @staticmethod
+    def from_templates(templates: Iterable[Template]) -> "DefIndex":
+        """Create Index For ``templates``."""
+        defindex = DefIndex()
+        for template in templates:
+            defindex.add(template)
+        return defindex
+
+    def add(self, template: Template) -> None:
+        """Add Functions Of ``template``, Unless Already Known."""
+        for name in vars(template.module):
+            if name.startswith("render_") and name != "render_body":
+                self._templates.setdefault(name[7:], template)
+
+    def get(self, funcname: str) -> DefTemplate | None:
+        """Retrieve ``funcname``."""
+        try:
+            return self._defs[funcname]
+        except KeyError:
+            pass
+        try:
+            template = self._templates[funcname]
+        except KeyError:
+            return None
+        func = self._defs[funcname] = template.get_def(funcname)
+        return func
+
+    def copy(self) -> "DefIndex":
+        """Copy."""
+        return DefIndex(dict(self._templates), dict(self._defs))
+
+    @property
+    def templates(self) -> dict[str, Template]:
+        """Function Names And Their Templates."""
+        return dict(self._templates)
+
+
 @define
 class InplaceRenderer:
     """Inplace Renderer."""
@@ -70,9 +122,21 @@ class InplaceRenderer:
     templates: tuple[Template, ...]
     ignore_unknown: bool
     eol: str
-
-    def render(self, lookup: TemplateLookup, filepath: Path, outputfile, context: dict):  # noqa: C901
-        """Render."""
+    defindex: DefIndex = field(kw_only=True)
+
+    @defindex.default
+    def _defindex_default(self) -> DefIndex:
+        return DefIndex.from_templates(self.templates)
+
+    def render(  # noqa: C901, PLR0912
+        self,
+        lookup: MakolatorTemplateLookup,
+        filepath: Path,
+        outputfile,
+        context: dict,
+        lines: list[str] | None = None,
+    ):
+        """Render ``lines`` Of ``filepath``, Which Are Read If Not Given."""
         inplace_marker = self.config.inplace_marker
         ibegin = re.compile(rf"(?P<indent>\s*).*{inplace_marker}\s+BEGIN\s(?P<funcname>[a-z_]+)\((?P<args>.*)\)")
         iinfo = None
@@ -80,46 +144,48 @@ class InplaceRenderer:
         template_marker = self.config.template_marker
         tinfo = None
         tbegin = re.compile(rf"(?P<pre>.*)\s*{template_marker}\s+BEGIN")
-        templates = list(self.templates)
-
-        with filepath.open(encoding="utf-8", newline="") as inputfile:
-            inputiter = enumerate(inputfile.readlines(), 1)
-            try:
-                while True:
-                    if iinfo:
-                        # GENERATE INPLACE
-                        self._process_inplace(filepath, outputfile, context, inputiter, iinfo, ibegin)
-                        iinfo = None
-
-                    elif tinfo:
-                        # MAKO TEMPLATE
-                        self._process_template(filepath, lookup, outputfile, templates, inputiter, tinfo, tbegin)
-                        tinfo = None
-
-                    else:
-                        # normal lines
-                        while True:
-                            lineno, line = next(inputiter)
-                            if inplace_marker:
-                                # search for "INPLACE BEGIN <funcname>(<args>)"
-                                beginmatch = ibegin.match(line)
-                                if beginmatch:
-                                    outputfile.write(self._fill_marker(beginmatch))
-                                    # consume INPLACE BEGIN
-                                    iinfo = self._start_inplace(templates, filepath, lineno, **beginmatch.groupdict())
-                                    break
-                            if template_marker:
-                                # search for "TEMPLATE BEGIN"
-                                beginmatch = tbegin.match(line)
-                                if beginmatch:
-                                    outputfile.write(self._fill_marker(beginmatch))
-                                    # consume TEMPLATE BEGIN
-                                    tinfo = TplInfo(lineno, beginmatch.group("pre"))
-                                    break
-                            outputfile.write(line)
-
-            except StopIteration:
-                pass
+        defindex = self.defindex.copy()
+
+        if lines is None:
+            lines = read_lines(filepath)
+        inputiter = LineIter(lines, scan_markers(lines, (inplace_marker, template_marker)))
+        try:
+            while True:
+                if iinfo:
+                    # GENERATE INPLACE
+                    self._process_inplace(filepath, outputfile, context, inputiter, iinfo, ibegin)
+                    iinfo = None
+
+                elif tinfo:
+                    # MAKO TEMPLATE
+                    self._process_template(filepath, lookup, outputfile, defindex, inputiter, tinfo, tbegin)
+                    tinfo = None
+
+                else:
+                    # normal lines
+                    while True:
+                        outputfile.write("".join(inputiter.skip()))
+                        lineno, line = next(inputiter)
+                        if inplace_marker:
+                            # search for "INPLACE BEGIN <funcname>(<args>)"
+                            beginmatch = ibegin.match(line)
+                            if beginmatch:
+                                outputfile.write(self._fill_marker(beginmatch))
+                                # consume INPLACE BEGIN
+                                iinfo = self._start_inplace(defindex, filepath, lineno, **beginmatch.groupdict())
+                                break
+                        if template_marker:
+                            # search for "TEMPLATE BEGIN"
+                            beginmatch = tbegin.match(line)
+                            if beginmatch:
+                                outputfile.write(self._fill_marker(beginmatch))
+                                # consume TEMPLATE BEGIN
+                                tinfo = TplInfo(lineno, beginmatch.group("pre"))
+                                break
+                        outputfile.write(line)
+
+        except StopIteration:
+            pass
         if iinfo:
             raise MakolatorError(f"'{filepath!s}:{iinfo.lineno}' BEGIN {iinfo.funcname}({iinfo.args}) without END.")
         if tinfo:
@@ -128,6 +194,7 @@ class InplaceRenderer:
     def _process_inplace(self, filepath: Path, outputfile, context: dict, inputiter, iinfo, ibegin):
         while True:
             # search for "INPLACE END"
+            inputiter.skip()
             lineno, line = next(inputiter)
 
             beginmatch = ibegin.match(line)
@@ -146,13 +213,15 @@ class InplaceRenderer:
                 break
 
     def _process_template(
-        self, filepath: Path, lookup: TemplateLookup, outputfile, templates, inputiter, tinfo, tbegin
+        self, filepath: Path, lookup: MakolatorTemplateLookup, outputfile, defindex: DefIndex, inputiter, tinfo, tbegin
     ):
         # capture TEMPLATE
         pre = tinfo.pre
         prelen = len(pre)
         tend = re.compile(rf"(?P<pre>.*)\s*{self.config.template_marker}\s+END")
         while True:
+            for line in inputiter.skip():
+                self._capture_template_line(outputfile, tinfo, line, pre, prelen)
             _, line = next(inputiter)
 
             beginmatch = tbegin.match(line)
@@ -165,32 +234,27 @@ class InplaceRenderer:
             if endmatch:
                 outputfile.write(self._fill_marker(endmatch))
                 LOGGER.debug("Template '%s:%d'", str(outputfile), tinfo.lineno)
-                templates.append(Template("".join(tinfo.lines), lookup=lookup))
+                defindex.add(lookup.get_inline_template("".join(tinfo.lines)))
                 break
-            # propagate
-            outputfile.write(line)
+            self._capture_template_line(outputfile, tinfo, line, pre, prelen)
 
-            if line.startswith(pre):
-                line = line[prelen:]
-            tinfo.lines.append(line)
+    @staticmethod
+    def _capture_template_line(outputfile, tinfo: TplInfo, line: str, pre: str, prelen: int):
+        # propagate
+        outputfile.write(line)
+
+        if line.startswith(pre):
+            line = line[prelen:]
+        tinfo.lines.append(line)
 
     def get_func(self, funcname: str):
         """Retrieve `funcname` from templates."""
-        return self._get_func(list(self.templates), funcname)
-
-    @staticmethod
-    def _get_func(templates: list[Template], funcname: str):
-        for template in templates:
-            try:
-                return template.get_def(funcname)
-            except AttributeError:  # noqa: PERF203
-                continue
-        return None
+        return self.defindex.get(funcname)
 
     def _start_inplace(
-        self, templates: list[Template], filepath: Path, lineno: int, indent: str, funcname: str, args: str
+        self, defindex: DefIndex, filepath: Path, lineno: int, indent: str, funcname: str, args: str
     ) -> InplaceInfo | None:
-        func = self._get_func(templates, funcname)
+        func = defindex.get(funcname)
         if func:
             end = re.compile(rf"(?P<indent>\s*).*{self.config.inplace_marker}\s+END\s{funcname}")
             return InplaceInfo(lineno, indent, funcname, args, func, end)
@@ -249,3 +313,110 @@ class InplaceRenderer:
 
 def _extract(*args, **kwargs):
     return (args, kwargs)
+
+
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]()|\\")
+_NEWLINE = "\r\n"
+
+
+@define
+class LineIter:
+    """
+    Iterate Over Numbered Lines And Jump Between Marker Candidates.
+
+    Lines which are not listed in ``candidates`` cannot match any marker regex.
+    :any:`LineIter.skip` consumes them at once.
+    """
+
+    lines: list[str]
+    candidates: list[int]
+    index: int = 0
+
+    def __iter__(self) -> "LineIter":
+        return self
+
+    def __next__(self) -> tuple[int, str]:
+        index = self.index
+        if index >= len(self.lines):
+            raise StopIteration
+        self.index = index + 1
+        return index + 1, self.lines[index]
+
+    def skip(self) -> list[str]:
+        """Consume And Return All Lines Before The Next Candidate."""
+        start = self.index
+        candidates = self.candidates
+        pos = bisect_left(candidates, start)
+        stop = candidates[pos] if pos < len(candidates) else len(self.lines)
+        self.index = stop
+        return self.lines[start:stop]
+
+
+def scan_markers(lines: list[str], markers: Iterable[str | None]) -> list[int]:
+    """
+    Return Indices Of ``lines`` Containing Any Of ``markers``.
+
+    The joined lines are searched at once - plain markers via substring search, others via one combined pattern.
+    Any line matching a full marker regex is returned, additional candidates are harmless.
+    """
+    names = tuple(marker for marker in markers if marker)
+    if not names:
+        return []
+    if any(_REGEX_SPECIAL.intersection(name) for name in names):
+        # unify line endings, so that ``^`` and ``$`` match at every line
+        lines = [f"{line.rstrip(_NEWLINE)}\n" for line in lines]
+        indices: Iterable[int] = _search_lines("".join(lines), list(accumulate(map(len, lines))), names)
+    else:
+        text = "".join(lines)
+        ends = list(accumulate(map(len, lines)))
+        indices = (bisect_right(ends, pos) for name in names for pos in _find_all(text, name))
+    return sorted(set(indices))
+
+
+def _find_all(text: str, marker: str) -> Iterator[int]:
+    pos = text.find(marker)
+    while pos != -1:
+        yield pos
+        pos = text.find(marker, pos + 1)
+
+
+def _search_lines(text: str, ends: list[int], markers: tuple[str, ...]) -> Iterator[int]:
+    search = re.compile("|".join(f"(?:{marker})" for marker in markers), re.MULTILINE).search
+    mat = search(text)
+    while mat:
+        index = bisect_right(ends, mat.start())
+        if index >= len(ends):
+            break
+        yield index
+        # continue on the next line
+        mat = search(text, ends[index])
+
+
+def read_lines(filepath: Path) -> list[str]:
+    """Read Lines Of ``filepath`` Without Newline Translation."""
+    with filepath.open(encoding="utf-8", newline="") as inputfile:
+        return inputfile.readlines()
+
+
+def has_markers(filepath: Path, markers: Iterable[str | None]) -> bool:
+    """
+    Check If ``filepath`` Contains Any Of ``markers``.
+
+    This is a cheap byte-level prefilter: the file is memory mapped and searched for the plain markers,
+    without decoding or splitting it into lines.
+    Markers with regular expression syntax cannot be searched literally and are always reported as found.
+    """
+    names = tuple(marker for marker in markers if marker)
+    if any(_REGEX_SPECIAL.intersection(name) for name in names):
+        return True
+    needles = [name.encode("utf-8") for name in names]
+    if not needles:
+        return False
+    with filepath.open("rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file
+            return False
+        with data:
+            return any(data.find(needle) != -1 for needle in needles)
@@ -0,0 +1,291 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Template Lookup."""
+
+import hashlib
+import os
+import posixpath
+import py_compile
+from collections.abc import Callable
+from importlib.util import cache_from_source
+from pathlib import Path
+from typing import Any
+
+import mako
+from mako import compat
+from mako.lookup import TemplateLookup
+from mako.template import ModuleTemplate, Template
+
+from ._util import LOGGER, _atomic_write, get_version
+from .cachebackend import CacheBackend, create_backend
+from .cachemanager import CacheManager
+from .cachestat import CacheStat
+from .config import CacheMode
+from .registry import TemplateRegistry
+
+
+def create_lookup(
+    directories: list[Path],
+    cache_path: Path | None,
+    cache_mode: CacheMode,
+    registry: TemplateRegistry | None = None,
+    cachestat: CacheStat | None = None,
+    remote: CacheBackend | None = None,
+) -> "MakolatorTemplateLookup":
+    """
+    Create :any:`TemplateLookup` With Makolator Settings.
+
+    Templates are compiled in memory without ``cache_path``, which is only supported with ``registry``.
+    Compiled modules are shared via ``remote`` with ``CacheMode.CONTENT``.
+    """
+    kwargs: dict[str, Any] = {"cache_path": cache_path, "cachestat": cachestat or CacheStat()}
+    if cache_path is None:
+        get_module_filename = None
+    elif cache_mode == CacheMode.CONTENT:
+
+        def get_module_filename(filepath: str, uri: str):
+            return get_content_module_filename(cache_path, Path(filepath), uri)
+
+    else:
+
+        def get_module_filename(filepath: str, uri: str):
+            hash_ = hashlib.sha256()
+            hash_.update(bytes(filepath, encoding="utf-8"))
+            ident = hash_.hexdigest()
+            modulepath = cache_path / f"{Path(filepath).name}_{ident}.py"
+            CacheManager.touch(modulepath)
+            return modulepath
+
+    if registry is not None:
+        cls: type[MakolatorTemplateLookup] = RegistryTemplateLookup
+        kwargs["registry"] = registry
+    elif cache_mode == CacheMode.CONTENT:
+        cls = ContentTemplateLookup
+        kwargs["remote"] = remote
+    else:
+        cls = MakolatorTemplateLookup
+
+    return cls(
+        directories=[str(item) for item in directories],
+        cache_dir=cache_path,
+        input_encoding="utf-8",
+        output_encoding="utf-8",
+        modulename_callable=get_module_filename,
+        strict_undefined=True,
+        **kwargs,
+    )
+
+
+def get_content_module_filename(cache_path: Path, filepath: Path, uri: str) -> Path:
+    """
+    Module Filename Derived From Template Source.
+
+    The name depends on the template source, the ``uri`` (relative includes are resolved against it),
+    the Mako and the Makolator version - but not on the location of the template.
+    """
+    hash_ = hashlib.sha256()
+    hash_.update(f"{mako.__version__}\0{get_version()}\0{uri}\0".encode())
+    hash_.update(filepath.read_bytes())
+    modulepath = cache_path / f"{filepath.name}_{hash_.hexdigest()}.py"
+    try:
+        if modulepath.stat().st_mtime < filepath.stat().st_mtime:
+            # The module matches the source by construction. Refresh its timestamp,
+            # so that Mako does not recompile it for a newer source file.
+            os.utime(modulepath)
+        else:
+            CacheManager.touch(modulepath)
+    except FileNotFoundError:
+        pass
+    return modulepath
+
+
+def compile_template(
+    directories: list[Path], cache_path: Path, cache_mode: CacheMode, uri: str, remote: str | None = None
+) -> Path:
+    """
+    Compile Template ``uri`` To Python Module And Bytecode Within ``cache_path``.
+
+    The bytecode is validated by source hash, so it survives timestamp updates of the module.
+    """
+    backend = create_backend(remote) if remote else None
+    lookup = create_lookup(directories, cache_path, cache_mode, remote=backend)
+    template = lookup.get_template(uri)
+    modulepath = Path(template.module.__file__)
+    py_compile.compile(
+        str(modulepath),
+        cfile=cache_from_source(str(modulepath)),
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+    return modulepath
+
+
+class MakolatorTemplateLookup(TemplateLookup):
+    """
+    Template Lookup With Inline Template Cache.
+
+    Inline templates (``MAKO TEMPLATE`` blocks) are identified by their content.
+    They are kept in memory and their modules are stored in ``cache_path``.
+    """
+
+    recorder: Callable[[str], None] | None = None
+    """Called With The Filename Of Every Requested Template."""
+
+    def __init__(self, *args, cache_path: Path | None, cachestat: CacheStat, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_path = cache_path
+        self.cachestat = cachestat
+        self._inline: dict[str, Template] = {}
+
+    def get_template(self, uri: str) -> Template:
+        """Return Template ``uri`` And Pass Its Filename To ``recorder``."""
+        template = super().get_template(uri)
+        if self.recorder is not None and template.filename:
+            self.recorder(template.filename)
+        return template
+
+    def get_inline_template(self, text: str) -> Template:
+        """Return Compiled Inline Template With Source ``text``."""
+        hash_ = hashlib.sha256()
+        hash_.update(f"{mako.__version__}\0{get_version()}\0".encode())
+        hash_.update(text.encode("utf-8"))
+        uri = f"inline_{hash_.hexdigest()}"
+        try:
+            template = self._inline[uri]
+        except KeyError:
+            self.cachestat.miss("inline")
+        else:
+            self.cachestat.hit("inline")
+            return template
+        template = self._inline[uri] = self._load_inline(uri, text)
+        return template
+
+    def _load_inline(self, uri: str, text: str) -> Template:
+        cache_path = self.cache_path
+        if cache_path is None:
+            return Template(text, lookup=self, uri=uri)
+        modulepath = cache_path / f"{uri}.py"
+        if modulepath.exists():
+            self.cachestat.hit("inline-module")
+            CacheManager.touch(modulepath)
+            module = compat.load_module(uri, str(modulepath))
+            return ModuleTemplate(module, module_filename=str(modulepath), template_source=text, lookup=self)
+        self.cachestat.miss("inline-module")
+        template = Template(text, lookup=self, uri=uri)
+        _atomic_write(modulepath, template.code)
+        return template
+
+
+class ContentTemplateLookup(MakolatorTemplateLookup):
+    """
+    Template Lookup For Content Addressed Modules.
+
+    Mako decides about reloading by comparing the source timestamp with the compile time stored
+    in the module. Modules compiled elsewhere are older than a fresh checkout and would be reloaded
+    on every access. Compare against the source timestamp seen on load instead.
+    """
+
+    def __init__(self, *args, remote: CacheBackend | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.remote = remote
+        self._mtimes: dict[str, float] = {}
+
+    def _load(self, filename, uri):
+        mtime = os.stat(filename).st_mtime  # noqa: PTH116
+        if self.remote is None or self.cache_path is None:
+            template = super()._load(filename, uri)
+        else:
+            template = self._load_remote(self.remote, self.cache_path, filename, uri)
+        self._mtimes[uri] = mtime
+        return template
+
+    def _load_remote(self, remote: CacheBackend, cache_path: Path, filename: str, uri: str) -> Template:
+        """Fetch Missing Module From ``remote`` Before Loading And Upload Compiled Ones."""
+        modulepath = get_content_module_filename(cache_path, Path(filename), uri)
+        key = f"modules/{modulepath.name}"
+        exists = modulepath.exists()
+        if not exists:
+            data = _unpack_module(key, remote.get(key))
+            if data is None:
+                self.cachestat.miss("remote-module")
+            else:
+                self.cachestat.hit("remote-module")
+                _atomic_write(modulepath, data)
+                exists = True
+        template = super()._load(filename, uri)
+        if not exists and modulepath.exists():
+            remote.put(key, _pack_module(modulepath.read_bytes()))
+        return template
+
+    def _check(self, uri, template):
+        if template.filename is None:
+            return template
+        try:
+            mtime = os.stat(template.filename).st_mtime  # noqa: PTH116
+        except OSError:
+            return super()._check(uri, template)
+        if self._mtimes.get(uri) == mtime:
+            return template
+        self._collection.pop(uri, None)
+        return self._load(template.filename, uri)
+
+
+_MODULE_HEADER = b"# sha256:"
+
+
+def _pack_module(data: bytes) -> bytes:
+    """Prefix Module With Digest Of Its Content."""
+    return _MODULE_HEADER + hashlib.sha256(data).hexdigest().encode() + b"\n" + data
+
+
+def _unpack_module(key: str, packed: bytes | None) -> bytes | None:
+    """Return Module Content Or ``None`` If It Does Not Match Its Digest."""
+    if packed is None:
+        return None
+    header, _, data = packed.partition(b"\n")
+    if header != _MODULE_HEADER + hashlib.sha256(data).hexdigest().encode():
+        LOGGER.warning("Ignoring corrupted remote module '%s'", key)
+        return None
+    return data
+
+
+class RegistryTemplateLookup(ContentTemplateLookup):
+    """Template Lookup Sharing Compiled Templates Via :any:`TemplateRegistry`."""
+
+    def __init__(self, *args, registry: TemplateRegistry, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.registry = registry
+
+    def _load(self, filename, uri):
+        filename = posixpath.normpath(filename)
+        mtime = os.stat(filename).st_mtime  # noqa: PTH116
+        with self._mutex:
+            try:
+                # concurrent thread already loaded
+                return self._collection[uri]
+            except KeyError:
+                pass
+            template = self._collection[uri] = self.registry.get_template(self, filename, uri)
+        self._mtimes[uri] = mtime
+        return template
@@ -0,0 +1,110 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Template Search Path Index."""
+
+import os
+from pathlib import Path
+
+from attrs import define, field
+
+from .cachestat import CacheStat
+
+
+@define
+class _Listing:
+    mtime_ns: int
+    names: frozenset[str]
+
+
+@define
+class SearchIndex:
+    """
+    Directory Listing Index Of Template Search Paths.
+
+    Every directory is listed once. Resolution is a dictionary lookup instead of a ``stat`` per candidate.
+    With ``check`` the directory modification time is verified, which costs one ``stat`` per directory.
+
+        >>> searchindex = SearchIndex()
+        >>> Path("templates").mkdir()
+        >>> searchindex.exists(Path("templates") / "test.txt.mako")
+        False
+        >>> _ = (Path("templates") / "test.txt.mako").write_text("")
+        >>> searchindex.exists(Path("templates") / "test.txt.mako")
+        False
+        >>> searchindex.exists(Path("templates") / "test.txt.mako", check=True)
+        True
+    """
+
+    cachestat: CacheStat | None = None
+    _listings: dict[str, _Listing | None] = field(factory=dict, init=False)
+
+    def exists(self, filepath: Path, check: bool = False) -> bool:
+        """Return ``True`` if ``filepath`` exists - like ``Path.exists``."""
+        dirpath = os.path.normcase(str(filepath.parent))
+        listing = self._get_listing(dirpath, check)
+        if listing is None:
+            return False
+        return os.path.normcase(filepath.name) in listing.names
+
+    def clear(self):
+        """Forget All Directory Listings."""
+        self._listings.clear()
+
+    def _get_listing(self, dirpath: str, check: bool) -> _Listing | None:
+        try:
+            listing = self._listings[dirpath]
+        except KeyError:
+            pass
+        else:
+            if not check or self._get_mtime_ns(dirpath) == (listing.mtime_ns if listing else None):
+                self._count(True)
+                return listing
+        self._count(False)
+        listing = self._listings[dirpath] = self._list(dirpath)
+        return listing
+
+    @staticmethod
+    def _get_mtime_ns(dirpath: str) -> int | None:
+        try:
+            return os.stat(dirpath).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            return None
+
+    @staticmethod
+    def _list(dirpath: str) -> _Listing | None:
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns  # noqa: PTH116
+            with os.scandir(dirpath) as entries:
+                names = frozenset(os.path.normcase(entry.name) for entry in entries)
+        except OSError:
+            return None
+        return _Listing(mtime_ns=mtime_ns, names=names)
+
+    def _count(self, hit: bool):
+        cachestat = self.cachestat
+        if cachestat is not None:
+            if hit:
+                cachestat.hit("searchindex")
+            else:
+                cachestat.miss("searchindex")
@@ -95,16 +95,25 @@ class StaticCode:
 
 
 @contextmanager
-def read(filepath: Path | None, comment_sep: str, config: Config) -> Iterator[StaticCode]:
-    """Read from ``filepath``."""
-    staticcodemap: StaticCodeMap = {}
-    _read(filepath, config.static_marker, staticcodemap)
+def read(
+    filepath: Path | None, comment_sep: str, config: Config, staticcodemap: StaticCodeMap | None = None
+) -> Iterator[StaticCode]:
+    """Read from ``filepath`` - unless ``staticcodemap`` has been read in advance by :any:`read_map`."""
+    if staticcodemap is None:
+        staticcodemap = read_map(filepath, config)
     yield StaticCode.from_config(config, comment_sep, staticcodemap=staticcodemap)
     if staticcodemap:
         names = humanify(staticcodemap)
         raise MakolatorError(f"'{filepath!s}': unknown static code {names}")
 
 
+def read_map(filepath: Path | None, config: Config) -> StaticCodeMap:
+    """Read Static Code from ``filepath``."""
+    staticcodemap: StaticCodeMap = {}
+    _read(filepath, config.static_marker, staticcodemap)
+    return staticcodemap
+
+
 def _read(filepath: Path | None, marker: str, staticcodemap: StaticCodeMap):
     if filepath and marker:
         begin = re.compile(rf"(?P<indent>\s*).*{marker}\s+BEGIN\s+(?P<name>\S+)\s*")
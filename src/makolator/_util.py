@@ -25,15 +25,32 @@
 Utilities.
 """
 
+import glob
 import logging
-from collections.abc import Iterable
+import os
+import re
+from collections.abc import Iterable, Iterator
+from functools import cache
+from importlib import metadata
+from itertools import islice
 from pathlib import Path
-from typing import TypeAlias
+from typing import TypeAlias, TypeVar
 
 Paths: TypeAlias = Path | Iterable[Path]
+T = TypeVar("T")
+_GLOB_MAGIC = re.compile(r"[*?[]")
 LOGGER = logging.getLogger("makolator")
 
 
+@cache
+def get_version() -> str:
+    """Makolator Version."""
+    try:
+        return metadata.version("makolator")
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        return "0.0.0"
+
+
 def norm_paths(paths: Paths) -> list[Path]:
     """Normalize Single Path or List of Paths to List of Paths."""
     try:
@@ -43,11 +60,53 @@ def norm_paths(paths: Paths) -> list[Path]:
 
 
 def iter_files(paths: Iterable[Path]) -> Iterable[Path]:
+    """Iterate Over Files And Files Within Directories In Sorted Order."""
     for path in paths:
         if path.is_file():
             yield path
         elif path.is_dir():
-            yield from iter_files(sorted(path.iterdir()))
+            yield from _scan_files(str(path))
+
+
+def _scan_files(dirpath: str) -> Iterator[Path]:
+    # ``DirEntry`` caches the file type from the directory listing - no ``stat`` per entry
+    with os.scandir(dirpath) as items:
+        entries = sorted(items, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_file():
+            yield Path(entry.path)
+        elif entry.is_dir():
+            yield from _scan_files(entry.path)
+
+
+def expand_paths(paths: Iterable[str]) -> Iterator[Path]:
+    """Expand Glob Patterns And Directories To Files, Except Templates. Other Paths Are Kept."""
+    for path in paths:
+        if _GLOB_MAGIC.search(path):
+            found = [Path(item) for item in sorted(glob.glob(path, recursive=True))]  # noqa: PTH207
+        elif Path(path).is_dir():
+            found = [Path(path)]
+        else:
+            yield Path(path)
+            continue
+        yield from (filepath for filepath in iter_files(found) if filepath.suffix != ".mako")
+
+
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split ``items`` Into Lists Of ``size`` Elements."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _atomic_write(filepath: Path, data: str | bytes) -> None:
+    """Write ``data`` To ``filepath`` Atomically, As Other Processes May Share The File."""
+    tmppath = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    if isinstance(data, str):
+        tmppath.write_text(data, encoding="utf-8")
+    else:
+        tmppath.write_bytes(data)
+    tmppath.replace(filepath)
 
 
 def check_indent(filepath: Path, lineno: int, beginindent, endindent):
@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Build State Database.
+
+Remembers a fingerprint for every generated file.
+Outputs are skipped as long as their fingerprint matches and they are not modified.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from attrs import define, field
+from mako.exceptions import TemplateLookupException
+from mako.lookup import TemplateLookup
+from mako.template import Template
+
+_SCHEMA = """CREATE TABLE IF NOT EXISTS outputs (
+    output TEXT PRIMARY KEY, fingerprint TEXT, deps TEXT, mtime_ns INTEGER, size INTEGER
+)"""
+_INLINE_URI = re.compile(r"<%(?:inherit|include|namespace)\b[^>]*?\bfile\s*=\s*\"([^\"$]+)\"")
+
+
+@define
+class BuildState:
+    """
+    Fingerprints Of Generated Files, Stored Within An SQLite Database.
+
+    A fingerprint combines a digest of all rendering inputs with the modification time and size of all used
+    templates. Multiple processes may share one database.
+    """
+
+    filepath: Path
+    """Database File."""
+
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False, eq=False)
+
+    def is_unchanged(self, output: Path, digest: str) -> bool:
+        """
+        Return ``True`` If ``output`` Was Generated With ``digest`` And Unchanged Templates And Is Unmodified Since.
+
+        Args:
+            output: Output File.
+            digest: Digest Of Rendering Inputs.
+        """
+        query = "SELECT fingerprint, deps, mtime_ns, size FROM outputs WHERE output = ?"
+        row = self._get_connection().execute(query, (str(output),)).fetchone()
+        if row is None:
+            return False
+        fingerprint, deps, mtime_ns, size = row
+        if _get_stat(str(output)) != (mtime_ns, size):
+            return False
+        return fingerprint == get_fingerprint(digest, json.loads(deps))
+
+    def add(self, output: Path, digest: str, deps: Iterable[str]) -> None:
+        """
+        Remember ``output`` Generated With ``digest`` From Templates ``deps``.
+
+        Args:
+            output: Output File.
+            digest: Digest Of Rendering Inputs.
+            deps: Filenames Of All Used Templates.
+        """
+        stat = _get_stat(str(output))
+        if stat is None:
+            self.remove(output)
+            return
+        deps = sorted(deps)
+        with self._get_connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?)",
+                (str(output), get_fingerprint(digest, deps), json.dumps(deps), *stat),
+            )
+
+    def remove(self, output: Path) -> None:
+        """Forget ``output``."""
+        with self._get_connection() as connection:
+            connection.execute("DELETE FROM outputs WHERE output = ?", (str(output),))
+
+    def clear(self) -> None:
+        """Forget All Outputs."""
+        with self._get_connection() as connection:
+            connection.execute("DELETE FROM outputs")
+
+    def close(self) -> None:
+        """Close Database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection = self._connection
+        if connection is None:
+            connection = sqlite3.connect(self.filepath, timeout=60, check_same_thread=False)
+            # the database is a cache - losing it on power loss is fine
+            connection.execute("PRAGMA synchronous=OFF")
+            with connection:
+                connection.execute(_SCHEMA)
+            self._connection = connection
+        return connection
+
+
+def get_fingerprint(digest: str, deps: Iterable[str]) -> str:
+    """Return Fingerprint Of ``digest`` And The Modification Time And Size Of ``deps``."""
+    hasher = hashlib.sha256(digest.encode())
+    for dep in deps:
+        hasher.update(f"\0{dep}\0{_get_stat(dep)}".encode())
+    return hasher.hexdigest()
+
+
+def get_inline_templates(lookup: TemplateLookup, filepath: Path) -> list[Template]:
+    """Return Templates Referred By Inline Templates Within ``filepath``."""
+    templates = []
+    text = filepath.read_text(encoding="utf-8")
+    for uri in dict.fromkeys(_INLINE_URI.findall(text)):
+        template = _get_template(lookup, uri)
+        if template is not None:
+            templates.append(template)
+    return templates
+
+
+def _get_template(lookup: TemplateLookup, uri: str) -> Template | None:
+    try:
+        return lookup.get_template(lookup.adjust_uri(uri, ""))
+    except TemplateLookupException:
+        return None
+
+
+def _get_stat(filename: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(filename)  # noqa: PTH116
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
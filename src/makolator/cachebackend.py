@@ -0,0 +1,230 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Cache Backends.
+
+Key-value stores for cache entries shared between processes, workspaces and machines.
+Keys are relative POSIX paths, i.e. ``render/ab/abcd.json``.
+
+* :any:`FileBackend` stores entries within a directory - i.e. on a shared disk.
+* :any:`HttpBackend` stores entries on an HTTP server supporting ``GET``, ``HEAD`` and ``PUT`` -
+  i.e. :any:`CacheServer`, nginx with WebDAV or a bazel-remote instance.
+* :any:`ChainBackend` combines a local and a remote backend.
+
+Remote failures are logged and treated as misses. They never break the generation.
+An unreachable HTTP server is skipped for the rest of the process.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+from attrs import define, field
+
+from ._util import LOGGER, _atomic_write
+from .cachemanager import CacheManager
+
+
+class CacheBackend(ABC):
+    """Cache Backend Interface."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return Entry ``key`` Or ``None`` If It Does Not Exist."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` As Entry ``key``."""
+
+    @abstractmethod
+    def contains(self, key: str) -> bool:
+        """Return ``True`` If Entry ``key`` Exists."""
+
+
+@define
+class FileBackend(CacheBackend):
+    """
+    Cache Entries Within Directory ``path``.
+
+        >>> backend = FileBackend(Path("store"))
+        >>> backend.contains("render/ab/abcd.json")
+        False
+        >>> backend.put("render/ab/abcd.json", b"data")
+        >>> backend.contains("render/ab/abcd.json")
+        True
+        >>> backend.get("render/ab/abcd.json")
+        b'data'
+        >>> backend.get("../outside")
+        Traceback (most recent call last):
+          ...
+        ValueError: Invalid cache key '../outside'
+    """
+
+    path: Path
+    """Cache Directory."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return Entry ``key`` Or ``None`` If It Does Not Exist."""
+        filepath = self.get_filepath(key)
+        try:
+            data = filepath.read_bytes()
+        except FileNotFoundError:
+            return None
+        CacheManager.touch(filepath)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` As Entry ``key``."""
+        filepath = self.get_filepath(key)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(filepath, data)
+
+    def contains(self, key: str) -> bool:
+        """Return ``True`` If Entry ``key`` Exists."""
+        return self.get_filepath(key).is_file()
+
+    def get_filepath(self, key: str) -> Path:
+        """Return Path Of Entry ``key``."""
+        parts = PurePosixPath(key).parts
+        if not parts or key.startswith("/") or any(part in (".", "..") or "\\" in part for part in parts):
+            raise ValueError(f"Invalid cache key {key!r}")
+        return self.path.joinpath(*parts)
+
+
+# Base URLs of unreachable servers - skipped for the rest of the process
+_UNREACHABLE: set[str] = set()
+
+
+@define
+class HttpBackend(CacheBackend):
+    """
+    Cache Entries On HTTP Server ``url``, Accessed Via ``GET``, ``HEAD`` And ``PUT``.
+
+    The backend is disabled for the rest of the process after the first connection failure.
+    """
+
+    url: str
+    """Base URL."""
+
+    timeout: float = 10.0
+    """Timeout In Seconds."""
+
+    @property
+    def is_reachable(self) -> bool:
+        """``False`` After A Connection Failure."""
+        return self.url not in _UNREACHABLE
+
+    def get(self, key: str) -> bytes | None:
+        """Return Entry ``key`` Or ``None`` If It Does Not Exist Or The Server Fails."""
+        if not self.is_reachable:
+            return None
+        try:
+            with urlopen(Request(self._get_url(key)), timeout=self.timeout) as response:  # noqa: S310
+                return response.read()
+        except (URLError, OSError) as exc:
+            self._fail("GET", key, exc)
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` As Entry ``key`` - Failures Are Logged Only."""
+        if not self.is_reachable:
+            return
+        headers = {"Content-Type": "application/octet-stream"}
+        request = Request(self._get_url(key), data=data, method="PUT", headers=headers)  # noqa: S310
+        try:
+            with urlopen(request, timeout=self.timeout):  # noqa: S310
+                pass
+        except (URLError, OSError) as exc:
+            self._fail("PUT", key, exc)
+
+    def contains(self, key: str) -> bool:
+        """Return ``True`` If Entry ``key`` Exists."""
+        if not self.is_reachable:
+            return False
+        try:
+            with urlopen(Request(self._get_url(key), method="HEAD"), timeout=self.timeout):  # noqa: S310
+                return True
+        except (URLError, OSError) as exc:
+            self._fail("HEAD", key, exc)
+        return False
+
+    def _get_url(self, key: str) -> str:
+        return f"{self.url.rstrip('/')}/{quote(key)}"
+
+    def _fail(self, method: str, key: str, exc: OSError) -> None:
+        if isinstance(exc, HTTPError):
+            # the server answered
+            if exc.code != 404:  # noqa: PLR2004
+                LOGGER.warning("Cache %s '%s' failed: %r", method, key, exc)
+            return
+        _UNREACHABLE.add(self.url)
+        LOGGER.warning("Cache %s '%s' failed: %r. Remote cache '%s' disabled.", method, key, exc, self.url)
+
+
+@define
+class ChainBackend(CacheBackend):
+    """
+    Cache Entries Within Multiple Backends, I.e. A Local And A Remote One.
+
+    Entries are taken from the first backend having them and copied to all backends before.
+    New entries are stored in all backends.
+    """
+
+    backends: list[CacheBackend] = field(factory=list)
+    """Backends, Fastest First."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return Entry ``key`` Or ``None`` If It Does Not Exist."""
+        for idx, backend in enumerate(self.backends):
+            data = backend.get(key)
+            if data is not None:
+                for faster in self.backends[:idx]:
+                    faster.put(key, data)
+                return data
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` As Entry ``key``."""
+        for backend in self.backends:
+            backend.put(key, data)
+
+    def contains(self, key: str) -> bool:
+        """Return ``True`` If Entry ``key`` Exists."""
+        return any(backend.contains(key) for backend in self.backends)
+
+
+def create_backend(location: str) -> CacheBackend:
+    """
+    Create Backend For ``location`` - An ``http://`` Or ``https://`` URL Or A Directory.
+
+        >>> create_backend("http://localhost:8080/cache")
+        HttpBackend(url='http://localhost:8080/cache', timeout=10.0)
+        >>> create_backend("store").path.name
+        'store'
+    """
+    if location.startswith(("http://", "https://")):
+        return HttpBackend(location)
+    return FileBackend(Path(location.removeprefix("file://")))
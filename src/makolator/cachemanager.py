@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Persistent Cache Management."""
+
+import os
+import time
+from importlib.util import cache_from_source
+from pathlib import Path
+
+from attrs import define
+
+DEPGRAPH_FILENAME = "depgraph.json"
+BUILDSTATE_FILENAME = "buildstate.sqlite"
+# State files kept open or rewritten by other processes - never pruned
+_METADATA = frozenset((DEPGRAPH_FILENAME, BUILDSTATE_FILENAME))
+# Files written right now by other processes
+_TRANSIENT = (".tmp", "-journal", "-wal", "-shm")
+
+
+@define
+class CacheEntry:
+    """Cache Entry - A Compiled Template And Its Bytecode Or A Rendered Output."""
+
+    path: Path
+    """File Path."""
+
+    size: int
+    """Size In Bytes Including Bytecode."""
+
+    atime: float
+    """Last Access Time."""
+
+    @property
+    def paths(self) -> tuple[Path, ...]:
+        """All Files Of The Entry."""
+        if self.path.suffix == ".py":
+            return (self.path, Path(cache_from_source(str(self.path))))
+        return (self.path,)
+
+
+@define
+class CacheManager:
+    """
+    Persistent Cache Manager.
+
+    Limits the cache to ``max_size`` bytes and ``max_entries`` entries.
+    Entries are compiled templates and rendered outputs (``render/``).
+    Least recently used entries are removed first.
+    The dependency graph and the build state are no entries - they are neither counted nor removed.
+
+        >>> cachemanager = CacheManager(Path("cache"), max_entries=1)
+        >>> cachemanager.path.mkdir()
+        >>> for name in ("a.py", "b.py"):
+        ...     _ = (cachemanager.path / name).write_text("pass")
+        >>> cachemanager.stat
+        '2 entries. 8 bytes.'
+        >>> cachemanager.touch(cachemanager.path / "a.py")
+        >>> [path.name for path in cachemanager.prune()]
+        ['b.py']
+        >>> [path.name for path in cachemanager.clear()]
+        ['a.py']
+        >>> cachemanager.stat
+        '0 entries. 0 bytes.'
+    """
+
+    path: Path
+    """Cache Directory."""
+
+    max_size: int | None = None
+    """Maximum Size In Bytes."""
+
+    max_entries: int | None = None
+    """Maximum Number Of Entries."""
+
+    @property
+    def entries(self) -> list[CacheEntry]:
+        """Cache Entries, Most Recently Used First."""
+        entries: list[CacheEntry] = []
+        _scan(self.path, entries, _METADATA)
+        return sorted(entries, key=lambda entry: (-entry.atime, entry.path))
+
+    @property
+    def stat(self) -> str:
+        """Statistics Summary."""
+        entries = self.entries
+        size = sum(entry.size for entry in entries)
+        return f"{len(entries)} entries. {size} bytes."
+
+    @staticmethod
+    def touch(path: Path) -> None:
+        """Record Access On Module ``path`` - Without Modifying Its Timestamp."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+
+    def prune(self) -> list[Path]:
+        """Remove Least Recently Used Entries Exceeding ``max_size`` Or ``max_entries``."""
+        max_size = self.max_size
+        max_entries = self.max_entries
+        if max_size is None and max_entries is None:
+            return []
+        removed = []
+        size = count = 0
+        for entry in self.entries:
+            size += entry.size
+            count += 1
+            if (max_size is not None and size > max_size) or (max_entries is not None and count > max_entries):
+                self._remove(entry)
+                removed.append(entry.path)
+        return removed
+
+    def clear(self) -> list[Path]:
+        """Remove All Entries."""
+        removed = []
+        for entry in self.entries:
+            self._remove(entry)
+            removed.append(entry.path)
+        return removed
+
+    @staticmethod
+    def _remove(entry: CacheEntry) -> None:
+        for path in entry.paths:
+            path.unlink(missing_ok=True)
+
+
+def _scan(path: Path | str, entries: list[CacheEntry], skip: frozenset[str] = frozenset()) -> None:
+    try:
+        with os.scandir(path) as items:
+            for item in items:
+                name = item.name
+                if item.is_dir(follow_symlinks=False):
+                    # bytecode belongs to its module
+                    if name != "__pycache__":
+                        _scan(item.path, entries)
+                elif item.is_file() and not name.endswith(_TRANSIENT) and name not in skip:
+                    stat = item.stat()
+                    size = stat.st_size
+                    if name.endswith(".py"):
+                        try:
+                            size += Path(cache_from_source(item.path)).stat().st_size
+                        except FileNotFoundError:
+                            pass
+                    entries.append(CacheEntry(Path(item.path), size, max(stat.st_atime, stat.st_mtime)))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,124 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Minimal HTTP Cache Server.
+
+Serves a :any:`FileBackend` via ``GET``, ``HEAD`` and ``PUT`` - the protocol of :any:`HttpBackend`.
+Intended for tests and small setups without authentication.
+"""
+
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from ._util import LOGGER
+from .cachebackend import FileBackend
+
+
+class CacheServer(ThreadingHTTPServer):
+    """
+    Minimal HTTP Cache Server Storing Entries Within ``path``.
+
+    Args:
+        path: Cache Directory.
+
+    Keyword Args:
+        address: Host And Port. Port ``0`` selects a free port.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, address: tuple[str, int] = ("127.0.0.1", 0)):
+        self.backend = FileBackend(path)
+        super().__init__(address, _Handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve Within A Background Thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop Serving."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: CacheServer
+
+    def do_GET(self):
+        self._get(body=True)
+
+    def do_HEAD(self):
+        self._get(body=False)
+
+    def do_PUT(self):
+        try:
+            key = self._get_key()
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST)
+            return
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.backend.put(key, data)
+        self.send_response(HTTPStatus.CREATED)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _get(self, body: bool):
+        try:
+            data = self.server.backend.get(self._get_key())
+        except (ValueError, IsADirectoryError):
+            data = None
+        if data is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if body:
+            self.wfile.write(data)
+
+    def _get_key(self) -> str:
+        key = unquote(urlsplit(self.path).path).lstrip("/")
+        # validate
+        self.server.backend.get_filepath(key)
+        return key
+
+    def log_message(self, format, *args):
+        LOGGER.debug("cacheserver: " + format, *args)
@@ -0,0 +1,79 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Cache Statistics."""
+
+from attrs import define, field
+
+
+@define
+class CacheStat:
+    """
+    Cache Statistics.
+
+    Counts hits and misses per cache.
+
+        >>> cachestat = CacheStat()
+        >>> cachestat.hit("lookup")
+        >>> cachestat.miss("lookup")
+        >>> cachestat.hit("lookup")
+        >>> cachestat.stat
+        'lookup: 2 hits 1 misses.'
+        >>> cachestat.hits
+        {'lookup': 2}
+        >>> cachestat.clear()
+        >>> cachestat.stat
+        ''
+    """
+
+    _hits: dict[str, int] = field(factory=dict)
+    _misses: dict[str, int] = field(factory=dict)
+
+    def hit(self, name: str) -> None:
+        """Count Hit On Cache ``name``."""
+        self._hits[name] = self._hits.get(name, 0) + 1
+
+    def miss(self, name: str) -> None:
+        """Count Miss On Cache ``name``."""
+        self._misses[name] = self._misses.get(name, 0) + 1
+
+    def clear(self):
+        """Clear Information."""
+        self._hits.clear()
+        self._misses.clear()
+
+    @property
+    def hits(self) -> dict[str, int]:
+        """Hits Per Cache."""
+        return dict(self._hits)
+
+    @property
+    def misses(self) -> dict[str, int]:
+        """Misses Per Cache."""
+        return dict(self._misses)
+
+    @property
+    def stat(self) -> str:
+        """Statistics Summary."""
+        names = sorted(set(self._hits) | set(self._misses))
+        return " ".join(f"{name}: {self._hits.get(name, 0)} hits {self._misses.get(name, 0)} misses." for name in names)
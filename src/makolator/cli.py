@@ -28,11 +28,49 @@ Command Line Interface.
 import argparse
 from pathlib import Path
 
-from makolator import Config, Existing, Info, Makolator, get_cli
+from attrs import evolve
+
+from makolator import CacheMode, Config, Existing, Info, Makolator, Manifest, Server, Watcher, get_cli
+
+from ._util import expand_paths
 
 
 def main(args=None):
     """Command Line Interface Processing."""
+    parser = _create_parser()
+    args = parser.parse_args(args=args)
+    if args.cmd:
+        config = _create_config(args)
+        info = Info(cli=get_cli())
+        mklt = Makolator(config=config, info=info)
+        _run(mklt, args)
+        if config.track:
+            print(mklt.tracker.stat)
+    else:
+        parser.print_help()
+
+
+def _run(mklt: Makolator, args):
+    if args.cmd == "gen":
+        mklt.gen(args.templates, args.output, workers=args.jobs or None)
+    elif args.cmd == "inplace":
+        _inplace(mklt, args)
+    elif args.cmd == "clean":
+        mklt.clean(args.paths, workers=args.jobs or None)
+    elif args.cmd == "compile":
+        _compile(mklt, args)
+    elif args.cmd == "cache":
+        _cache(mklt, args.action)
+    elif args.cmd == "run":
+        args.manifest.run(mklt, workers=args.jobs or None)
+    elif args.cmd == "serve":
+        Server(mklt, args.socket, workers=args.jobs or None).serve()
+    elif args.cmd == "watch":
+        watcher = Watcher(mklt, args.manifest, inputs=args.input, interval=args.interval, workers=args.jobs or None)
+        watcher.run()
+
+
+def _create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="makolator",
         description="Mako Templates (https://www.makotemplates.org/) extended.",
@@ -57,6 +95,13 @@ Generate a file from a template and fallback to 'default.txt.mako' if 'test.txt.
     )
     gen.add_argument("templates", nargs="+", type=Path, help="Template Files. At least one must exist")
     gen.add_argument("output", type=Path, help="Output File")
+    gen.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel jobs on template directories. Default is 1. 0 is the number of CPUs.",
+    )
 
     inplace = subparsers.add_parser(
         "inplace",
@@ -74,10 +119,35 @@ Update a file from a template:
 Update a file from a template and fallback to 'default.txt.mako' if 'test.txt.mako' is missing:
 
     makolator inplace test.txt.mako default.txt.mako test.txt
+
+Update all files within 'src' and all '*.sv' files within 'rtl' using 4 parallel jobs:
+
+    makolator inplace -t test.txt.mako src 'rtl/**/*.sv' --jobs 4
 """,
     )
-    inplace.add_argument("templates", nargs="*", type=Path, help="Optional Template Files")
-    inplace.add_argument("inplace", type=Path, help="Updated File")
+    inplace.add_argument(
+        "paths",
+        nargs="+",
+        help=(
+            "Optional Template Files, followed by the Updated File. "
+            "With --template: Updated Files, Directories or Glob Patterns"
+        ),
+    )
+    inplace.add_argument(
+        "--template",
+        "-t",
+        type=Path,
+        default=[],
+        action="append",
+        help="Template File. All positional paths are updated then.",
+    )
+    inplace.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel jobs. Default is 1. 0 is the number of CPUs.",
+    )
     inplace.add_argument(
         "--ignore-unknown",
         "-i",
@@ -98,17 +168,165 @@ The number of inspected lines at the top of a file is defined by --tag_lines.
 """,
     )
     clean.add_argument("paths", nargs="+", type=Path, help="Paths to look for files.")
+    clean.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Number of parallel file reads. Default is 0, which derives it from the number of CPUs.",
+    )
 
-    for sub in (gen, inplace, clean):
-        sub.add_argument("--verbose", "-v", action="store_true", help="Tell what happens to the file.")
-        sub.add_argument("--show-diff", "-s", action="store_true", help="Show what lines changed.")
+    compile_ = subparsers.add_parser(
+        "compile",
+        help="Compile Templates Into Cache",
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="""\
+Compile all templates within 'templates' and share the cache with subsequent runs:
+
+    makolator compile templates --cache-path .cache
+    makolator gen test.txt.mako test.txt -T templates --cache-path .cache
+
+""",
+    )
+    compile_.add_argument("paths", nargs="*", type=Path, help="Directories with templates.")
+    compile_.add_argument(
+        "--template-path",
+        "-T",
+        type=Path,
+        default=[],
+        action="append",
+        help="Directories with templates referred by include/inherit/...",
+    )
+    compile_.add_argument("--jobs", "-j", type=int, help="Number of parallel jobs. Default is the number of CPUs.")
+    compile_.add_argument("--verbose", "-v", action="store_true", help="Tell which templates are compiled.")
+
+    cache = subparsers.add_parser(
+        "cache",
+        help="Manage Template Cache",
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="""\
+Show size of the template cache:
+
+    makolator cache stats --cache-path .cache
+
+Remove least recently used templates until the cache fits into 10MB:
+
+    makolator cache prune --cache-path .cache --max-size 10000000
+
+""",
+    )
+    cache.add_argument("action", choices=["stats", "prune", "clear"], help="Action.")
+    cache.add_argument("--max-size", type=int, help="Maximum cache size in bytes on 'prune'.")
+    cache.add_argument("--max-entries", type=int, help="Maximum number of cache entries on 'prune'.")
+    cache.add_argument("--verbose", "-v", action="store_true", help="Tell which templates are removed.")
+
+    run = subparsers.add_parser(
+        "run",
+        help="Run Jobs Of Manifest",
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="""\
+Run all gen, inplace and clean jobs listed by 'jobs.toml' (or JSON) within one process:
+
+    makolator run jobs.toml
+
+'jobs.toml':
+
+    template_paths = ["templates"]
+    cache_path = ".cache"
+
+    [[jobs]]
+    cmd = "gen"
+    templates = ["test.txt.mako"]
+    output = "test.txt"
+    context = { name = "test" }
+
+    [[jobs]]
+    cmd = "inplace"
+    templates = ["inplace.txt.mako"]
+    files = ["src/**/*.txt"]
+
+    [[jobs]]
+    cmd = "clean"
+    paths = ["gen"]
+
+""",
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Serve Jobs With Warm Templates",
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="""\
+Keep templates compiled and serve gen, inplace and clean jobs via a UNIX socket:
+
+    makolator serve makolator.sock -T templates
+
+Every request is one line of JSON, answered by one line of JSON:
+
+    echo '{"cmd": "gen", "templates": ["test.txt.mako"], "output": "test.txt", "cwd": "'$PWD'"}' | \\
+        socat - UNIX-CONNECT:makolator.sock
+
+Stop the server:
+
+    echo '{"cmd": "shutdown"}' | socat - UNIX-CONNECT:makolator.sock
+
+""",
+    )
+    serve.add_argument("socket", type=Path, help="UNIX Socket.")
+    serve.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel jobs per request. Default is 1. 0 is the number of CPUs.",
+    )
+
+    watch = subparsers.add_parser(
+        "watch",
+        help="Run Jobs Of Manifest On Changes",
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="""\
+Run all jobs of 'jobs.toml' (see 'makolator run') and re-run jobs as soon as their
+templates or updated files change. Any change of 'model.json' re-runs all jobs:
+
+    makolator watch jobs.toml -I model.json
+
+""",
+    )
+    for sub in (run, watch):
         sub.add_argument(
-            "--tag_lines",
-            default=default_config.tag_lines,
-            help=f"Number of Inspected Lines on 'clean'. Default is {default_config.tag_lines}.",
+            "manifest", type=lambda path: Manifest.load(Path(path)), help="Manifest File (*.toml or *.json)."
         )
+    run.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Number of parallel jobs. Default is 0, which is the number of CPUs.",
+    )
+    watch.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel jobs. Default is 1. 0 is the number of CPUs.",
+    )
+    watch.add_argument(
+        "--input", "-I", type=Path, default=[], action="append", help="Input file. Changes re-run all jobs."
+    )
+    watch.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds. Default is 1.0.")
+
+    for sub in (gen, inplace, clean, run, serve, watch):
+        sub.add_argument("--verbose", "-v", action="store_true", help="Tell what happens to the file.")
+        sub.add_argument("--show-diff", "-s", action="store_true", help="Show what lines changed.")
+        if sub not in (run, watch):
+            sub.add_argument(
+                "--tag_lines",
+                default=default_config.tag_lines,
+                help=f"Number of Inspected Lines on 'clean'. Default is {default_config.tag_lines}.",
+            )
         sub.add_argument("--stat", "-S", action="store_true", help="Print Statistics")
-    for sub in (gen, inplace):
+    for sub in (gen, inplace, serve):
         sub.add_argument(
             "--existing",
             "-e",
@@ -139,38 +357,113 @@ The number of inspected lines at the top of a file is defined by --tag_lines.
         )
         sub.add_argument("--eol", "-E", help="EOL comment on generated lines")
         sub.add_argument("--create", "-c", action="store_true", default=False, help="Create Missing Inplace File")
+        sub.add_argument(
+            "--depfile",
+            "-M",
+            action="store_true",
+            default=False,
+            help="Write a Make/Ninja dependency file '<output>.d' listing all used templates.",
+        )
+    for sub in (gen, inplace, serve, compile_, cache):
+        sub.add_argument(
+            "--cache-path",
+            type=Path,
+            required=sub in (compile_, cache),
+            help="Directory to store compiled templates. Share it between runs.",
+        )
+    for sub in (gen, inplace, serve, compile_):
+        sub.add_argument(
+            "--remote-cache",
+            help="Shared cache for compiled templates and rendered outputs. An 'http://' URL or a directory.",
+        )
+        sub.add_argument(
+            "--cache-mode",
+            default=default_config.cache_mode.value,
+            choices=[item.value for item in CacheMode],
+            help=(
+                f"Naming of compiled templates. Default is '{default_config.cache_mode.value}'. "
+                "Use 'content' to share --cache-path between workspaces."
+            ),
+        )
+    return parser
 
-    args = parser.parse_args(args=args)
-    if args.cmd:
-        if args.cmd == "clean":
-            config = Config(
-                verbose=args.verbose,
-                diffout=print if args.show_diff else None,
-                tag_lines=args.tag_lines,
-                track=args.stat,
-            )
-        else:
-            config = Config(
-                verbose=args.verbose,
-                create=args.create,
-                diffout=print if args.show_diff else None,
-                existing=args.existing,
-                template_paths=[*args.template_path, Path()],
-                marker_fill=args.marker_fill,
-                marker_linelength=args.marker_linelength,
-                inplace_eol_comment=args.eol,
-                tag_lines=args.tag_lines,
-                track=args.stat,
-            )
-        info = Info(cli=get_cli())
-        mklt = Makolator(config=config, info=info)
-        if args.cmd == "gen":
-            mklt.gen(args.templates, args.output)
-        elif args.cmd == "inplace":
-            mklt.inplace(args.templates, args.inplace, ignore_unknown=args.ignore_unknown)
-        elif args.cmd == "clean":
-            mklt.clean(args.paths)
-        if config.track:
-            print(mklt.tracker.stat)
+
+def _create_config(args) -> Config:
+    if args.cmd in ("run", "watch"):
+        return evolve(
+            args.manifest.config,
+            verbose=args.verbose,
+            diffout=print if args.show_diff else None,
+            track=args.stat,
+        )
+    if args.cmd == "clean":
+        return Config(
+            verbose=args.verbose,
+            diffout=print if args.show_diff else None,
+            tag_lines=args.tag_lines,
+            track=args.stat,
+        )
+    if args.cmd == "cache":
+        return Config(
+            verbose=args.verbose,
+            cache_path=args.cache_path,
+            cache_max_size=args.max_size,
+            cache_max_entries=args.max_entries,
+        )
+    if args.cmd == "compile":
+        return Config(
+            verbose=args.verbose,
+            template_paths=args.template_path,
+            cache_path=args.cache_path,
+            cache_mode=CacheMode(args.cache_mode),
+            remote_cache=args.remote_cache,
+        )
+    return Config(
+        verbose=args.verbose,
+        create=args.create,
+        diffout=print if args.show_diff else None,
+        existing=args.existing,
+        template_paths=[*args.template_path, Path()],
+        marker_fill=args.marker_fill,
+        marker_linelength=args.marker_linelength,
+        inplace_eol_comment=args.eol,
+        cache_path=args.cache_path,
+        cache_mode=CacheMode(args.cache_mode),
+        tag_lines=args.tag_lines,
+        track=args.stat,
+        depfile=args.depfile,
+        remote_cache=args.remote_cache,
+    )
+
+
+def _compile(mklt: Makolator, args):
+    modulepaths = mklt.precompile(args.paths, workers=args.jobs)
+    if mklt.config.verbose:
+        for modulepath in modulepaths:
+            print(f"'{modulepath!s}'... COMPILED.")
+
+
+def _inplace(mklt: Makolator, args):
+    if args.template:
+        templates, paths = args.template, args.paths
     else:
-        parser.print_help()
+        templates, paths = [Path(path) for path in args.paths[:-1]], args.paths[-1:]
+    filepaths = list(expand_paths(paths))
+    if args.jobs == 1 and paths == [str(filepath) for filepath in filepaths] and len(filepaths) == 1:
+        mklt.inplace(templates, filepaths[0], ignore_unknown=args.ignore_unknown)
+    else:
+        mklt.inplace_many(templates, filepaths, ignore_unknown=args.ignore_unknown, workers=args.jobs or None)
+
+
+def _cache(mklt: Makolator, action: str):
+    cachemanager = mklt.cachemanager
+    if action == "prune":
+        removed = cachemanager.prune()
+    elif action == "clear":
+        removed = cachemanager.clear()
+    else:
+        removed = []
+    if mklt.config.verbose:
+        for path in removed:
+            print(f"'{path!s}'... REMOVED.")
+    print(cachemanager.stat)
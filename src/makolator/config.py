@@ -24,6 +24,7 @@
 """Configuration Handling."""
 
 from collections.abc import Callable
+from enum import Enum
 from pathlib import Path
 
 from attrs import define
@@ -44,6 +45,16 @@ COMMENT_MAP_DEFAULT = {
 }
 
 
+class CacheMode(Enum):
+    """Naming Scheme Of Compiled Templates Within ``cache_path``."""
+
+    PATH = "path"
+    """Compiled Templates Are Named By Template Path."""
+
+    CONTENT = "content"
+    """Compiled Templates Are Named By Template Source, Mako and Makolator Version."""
+
+
 @define
 class Config:
     """
@@ -71,6 +82,14 @@ class Config:
     template_paths: list[Path] = []  # noqa: RUF008
     """Default Search Paths for Templates."""
 
+    template_paths_check: bool = False
+    """
+    Verify Directory Modification Time On Template Search.
+
+    Directory listings of ``template_paths`` are indexed once per :any:`Makolator` instance.
+    Enable if templates are created or removed while the instance is in use.
+    """
+
     existing: Existing = Existing.KEEP_TIMESTAMP
     """Behaviour in case of existing files."""
 
@@ -106,6 +125,64 @@ class Config:
     Speeds up rendering. Share it between runs.
     """
 
+    cache_mode: CacheMode = CacheMode.PATH
+    """
+    Cache Mode.
+
+    Use ``CacheMode.CONTENT`` to share ``cache_path`` between workspaces, i.e. on CI.
+    """
+
+    template_registry: bool = False
+    """
+    Share Compiled Templates Between All Makolator Instances Of The Process.
+
+    See :any:`TEMPLATE_REGISTRY`. Templates are compiled in memory if ``cache_path`` is not set.
+    """
+
+    depgraph: bool = False
+    """Track Template Dependencies And Used Templates Per Output File Within ``cache_path``."""
+
+    depfile: bool = False
+    """
+    Write A Make/Ninja Compatible Dependency File ``<output>.d`` For Every Generated Output.
+
+    It lists all loaded templates and all files registered via :any:`Makolator.add_dependency`.
+    """
+
+    buildstate: bool = False
+    """
+    Skip Rendering Of Unchanged Outputs.
+
+    A fingerprint of templates, context, datamodel and configuration is stored per output within ``cache_path``.
+    Outputs with a matching fingerprint, which have not been modified since, are reported as identical
+    without rendering. Only applies with ``existing=Existing.KEEP_TIMESTAMP``.
+    """
+
+    render_cache: bool = False
+    """
+    Cache Rendered Outputs Within ``cache_path``.
+
+    Outputs are stored by a digest of template sources, context, datamodel, static code and configuration.
+    Share ``cache_path`` between workspaces or runs to take outputs from the cache instead of rendering.
+    """
+
+    remote_cache: str | None = None
+    """
+    Shared Cache - An ``http://`` URL Or A Directory.
+
+    Rendered outputs (``render_cache``) and compiled templates (``CacheMode.CONTENT``) are taken from
+    and stored to it in addition to ``cache_path``. See :any:`makolator.cachebackend`.
+    """
+
+    cache_max_size: int | None = None
+    """Maximum Size Of ``cache_path`` In Bytes. Least Recently Used Entries Are Removed."""
+
+    cache_max_entries: int | None = None
+    """Maximum Number Of Entries In ``cache_path``. Least Recently Used Entries Are Removed."""
+
+    async_limit: int = 8
+    """Maximum Number Of Concurrent File Operations Of ``agen``, ``ainplace`` And ``aclean``."""
+
     comment_map: dict[str, str] = COMMENT_MAP_DEFAULT
     """
     Line Comment Symbols.
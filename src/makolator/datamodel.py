@@ -23,6 +23,27 @@
 #
 """Data Model."""
 
+import hashlib
+from typing import Any
+from weakref import finalize
+
+from attrs import define, field
+
+from .digest import Digester, get_slotnames
+
+
+@define
+class _DigestState:
+    frozen: set[str] = field(factory=set)
+    digests: dict[str, str] = field(factory=dict)
+    digester: Digester = field(factory=Digester)
+
+
+_UNSET = object()
+
+# keyed by id(), as datamodels are not required to be hashable
+_DIGESTSTATES: dict[int, _DigestState] = {}
+
 
 class Datamodel:
     """
@@ -50,3 +71,78 @@ class Datamodel:
     def __repr__(self):
         kwargs = ", ".join(f"{key}={value!r}" for key, value in self.__dict__.items())
         return f"{self.__class__.__name__}({kwargs})"
+
+    def __setattr__(self, name, value):
+        state = _DIGESTSTATES.get(id(self))
+        if state is not None:
+            state.digests.pop(name, None)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        state = _DIGESTSTATES.get(id(self))
+        if state is not None:
+            state.digests.pop(name, None)
+        super().__delattr__(name)
+
+    def freeze(self, *names: str) -> None:
+        """
+        Mark Attributes ``names`` As Frozen.
+
+        The digest of a frozen attribute is calculated once and kept until the attribute is reassigned.
+        Modifications within the attribute value are not detected.
+
+            >>> datamodel = Datamodel(large=[1, 2, 3], small=4)
+            >>> datamodel.freeze("large")
+            >>> digest = datamodel.get_digest()
+            >>> datamodel.large.append(4)
+            >>> datamodel.get_digest() == digest
+            True
+            >>> datamodel.large = [1, 2, 3, 4]
+            >>> datamodel.get_digest() == digest
+            False
+        """
+        self._get_digest_state().frozen.update(names)
+
+    def get_digest(self) -> str:
+        """
+        Deterministic Digest Of All Attributes.
+
+        See :any:`get_digest` for the supported values. Digests of immutable subtrees are cached.
+
+            >>> Datamodel(a=1, b=[2]).get_digest() == Datamodel(b=[2], a=1).get_digest()
+            True
+            >>> Datamodel(a=1).get_digest() == Datamodel(a=2).get_digest()
+            False
+        """
+        state = self._get_digest_state()
+        digester = state.digester
+        hasher = hashlib.sha256(f"{self.__class__.__module__}.{self.__class__.__qualname__}(".encode())
+        for name, value in sorted(self._get_items().items()):
+            if name in state.frozen:
+                try:
+                    digest = state.digests[name]
+                except KeyError:
+                    digest = state.digests[name] = digester.get_digest(value)
+            else:
+                digest = digester.get_digest(value)
+            hasher.update(f"{name}={digest};".encode())
+        return hasher.hexdigest()
+
+    def _get_items(self) -> dict[str, Any]:
+        items = dict(self.__dict__)
+        # slot attributes of subclasses, i.e. attrs classes
+        for name in get_slotnames(type(self)):
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET:
+                items[name] = value
+        return items
+
+    def _get_digest_state(self) -> _DigestState:
+        ident = id(self)
+        try:
+            return _DIGESTSTATES[ident]
+        except KeyError:
+            pass
+        state = _DIGESTSTATES[ident] = _DigestState()
+        finalize(self, _DIGESTSTATES.pop, ident, None)
+        return state
@@ -0,0 +1,242 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Template Dependency Graph."""
+
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from attrs import asdict, define, field
+from mako import parsetree
+from mako.exceptions import TemplateLookupException
+from mako.lexer import Lexer
+from mako.lookup import TemplateLookup
+from mako.template import Template
+
+from ._util import LOGGER, _atomic_write
+
+_DEPTAGS = (parsetree.InheritTag, parsetree.IncludeTag, parsetree.NamespaceTag)
+
+
+@define
+class DepNode:
+    """Template Within Dependency Graph."""
+
+    uri: str
+    """Template URI."""
+
+    mtime_ns: int
+    """Modification Time At Analysis."""
+
+    size: int
+    """Size At Analysis."""
+
+    deps: list[str] = field(factory=list)
+    """Filenames Of Inherited, Included And Imported Templates."""
+
+
+@define
+class DepGraph:
+    """
+    Template Dependency Graph.
+
+    Tracks ``<%inherit>``, ``<%include>`` and ``<%namespace>`` dependencies between templates
+    and the templates used for every output file.
+    """
+
+    templates: dict[str, DepNode] = field(factory=dict)
+    """Templates By Filename."""
+
+    outputs: dict[str, list[str]] = field(factory=dict)
+    """Template Filenames By Output File."""
+
+    is_modified: bool = field(default=False, eq=False)
+    """Graph Has Been Modified Since Loading."""
+
+    @staticmethod
+    def load(filepath: Path) -> "DepGraph":
+        """Load Dependency Graph From ``filepath``. Broken Or Missing Files Result In An Empty Graph."""
+        try:
+            data = json.loads(filepath.read_text(encoding="utf-8"))
+            templates = {filename: DepNode(**node) for filename, node in data["templates"].items()}
+            return DepGraph(templates=templates, outputs=data["outputs"])
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring broken dependency graph '%s': %r", filepath, exc)
+        return DepGraph()
+
+    def save(self, filepath: Path) -> None:
+        """Save Dependency Graph To ``filepath``."""
+        data = {
+            "templates": {filename: asdict(node) for filename, node in sorted(self.templates.items())},
+            "outputs": dict(sorted(self.outputs.items())),
+        }
+        _atomic_write(filepath, json.dumps(data, indent=1))
+        self.is_modified = False
+
+    def update(self, other: "DepGraph") -> None:
+        """Add Templates And Outputs From ``other``."""
+        for filename, node in other.templates.items():
+            if self.templates.get(filename) != node:
+                self.templates[filename] = node
+                self.is_modified = True
+        for output, filenames in other.outputs.items():
+            if self.outputs.get(output) != filenames:
+                self.outputs[output] = filenames
+                self.is_modified = True
+
+    def pop_outputs(self) -> "DepGraph":
+        """Remove Outputs And Return Them Together With Their Templates."""
+        outputs = dict(self.outputs)
+        self.outputs.clear()
+        closure = self.get_closure(filename for filenames in outputs.values() for filename in filenames)
+        templates = {filename: node for filename, node in self.templates.items() if filename in closure}
+        return DepGraph(templates=templates, outputs=outputs)
+
+    def add(self, lookup: TemplateLookup, templates: Iterable[Template], output: Path | None = None) -> list[str]:
+        """
+        Add ``templates`` And Their Dependencies Resolved By ``lookup``.
+
+        Args:
+            lookup: Lookup of the templates.
+            templates: Templates.
+
+        Keyword Args:
+            output: Output file rendered from ``templates``.
+
+        Returns:
+            Template Filenames.
+        """
+        visited: set[str] = set()
+        filenames = []
+        for template in templates:
+            if template.filename:
+                self._add(lookup, template.filename, template.uri, visited)
+                filenames.append(template.filename)
+        if output is not None:
+            key = str(output)
+            if self.outputs.get(key) != filenames:
+                self.outputs[key] = filenames
+                self.is_modified = True
+        return filenames
+
+    def _add(self, lookup: TemplateLookup, filename: str, uri: str, visited: set[str]) -> None:
+        if filename in visited:
+            return
+        visited.add(filename)
+        try:
+            stat = os.stat(filename)  # noqa: PTH116
+        except OSError:
+            if self.templates.pop(filename, None):
+                self.is_modified = True
+            return
+        node = self.templates.get(filename)
+        if node is None or node.mtime_ns != stat.st_mtime_ns or node.size != stat.st_size:
+            depuris = {}
+            for depuri in _get_uris(Path(filename).read_text(encoding="utf-8")):
+                try:
+                    dep = lookup.get_template(lookup.adjust_uri(depuri, uri))
+                except TemplateLookupException:
+                    continue
+                if dep.filename:
+                    depuris[dep.filename] = dep.uri
+            node = self.templates[filename] = DepNode(uri, stat.st_mtime_ns, stat.st_size, list(depuris))
+            self.is_modified = True
+            for depfilename, depuri in depuris.items():
+                self._add(lookup, depfilename, depuri, visited)
+        else:
+            for depfilename in node.deps:
+                depnode = self.templates.get(depfilename)
+                self._add(lookup, depfilename, depnode.uri if depnode else "", visited)
+
+    def get_closure(self, filenames: Iterable[str]) -> set[str]:
+        """Return ``filenames`` And All Their Dependencies."""
+        closure: set[str] = set()
+        pending = list(filenames)
+        while pending:
+            filename = pending.pop()
+            if filename not in closure:
+                closure.add(filename)
+                node = self.templates.get(filename)
+                if node:
+                    pending.extend(node.deps)
+        return closure
+
+    def get_dependents(self, filenames: Iterable[str]) -> set[str]:
+        """Return ``filenames`` And All Templates Depending On Them."""
+        reverse: dict[str, list[str]] = {}
+        for filename, node in self.templates.items():
+            for dep in node.deps:
+                reverse.setdefault(dep, []).append(filename)
+        dependents: set[str] = set()
+        pending = list(filenames)
+        while pending:
+            filename = pending.pop()
+            if filename not in dependents:
+                dependents.add(filename)
+                pending.extend(reverse.get(filename, ()))
+        return dependents
+
+    def get_changed(self) -> set[str]:
+        """Return Templates Modified Since Their Analysis."""
+        changed = set()
+        for filename, node in self.templates.items():
+            try:
+                stat = os.stat(filename)  # noqa: PTH116
+            except OSError:
+                changed.add(filename)
+                continue
+            if node.mtime_ns != stat.st_mtime_ns or node.size != stat.st_size:
+                changed.add(filename)
+        return changed
+
+    def get_stale_outputs(self, filenames: Iterable[str] | None = None) -> list[str]:
+        """
+        Return Outputs Depending On ``filenames``.
+
+        Keyword Args:
+            filenames: Changed Templates. Templates modified since their analysis by default.
+        """
+        if filenames is None:
+            filenames = self.get_changed()
+        dependents = self.get_dependents(filenames)
+        return sorted(output for output, templates in self.outputs.items() if dependents.intersection(templates))
+
+
+def _get_uris(text: str) -> list[str]:
+    """Return Static URIs Referred By ``<%inherit>``, ``<%include>`` And ``<%namespace>`` Within Template ``text``."""
+    uris: list[str] = []
+
+    def visit(node):
+        if isinstance(node, _DEPTAGS):
+            uri = node.attributes.get("file")
+            if uri and "${" not in uri:
+                uris.append(uri)
+        for child in node.get_children():
+            visit(child)
+
+    visit(Lexer(text).parse())
+    return uris
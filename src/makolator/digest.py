@@ -0,0 +1,312 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Deterministic Digest Of Python Values."""
+
+import hashlib
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from enum import Enum
+from functools import partial
+from inspect import ismodule
+from pathlib import PurePath
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType
+from typing import Any
+
+from attrs import define, field
+from attrs import fields as attrs_fields
+from attrs import has as attrs_has
+
+from .exceptions import DigestError
+
+_UNSET = object()
+_SCALARS = (bool, int, float, complex, str, bytes, type(None))
+_SCALARTYPES = frozenset(_SCALARS)
+_STRTYPES = frozenset((str,))
+_CYCLE = hashlib.sha256(b"cycle").digest()
+
+
+def get_digest(obj: Any) -> str:
+    """
+    Return Deterministic Digest Of ``obj``.
+
+    Nested dictionaries, lists, tuples, sets, attrs classes, dataclasses and objects are walked.
+    Functions are digested by their code, defaults and closure, partials by their function and arguments.
+    Dictionary and set order does not matter.
+    :any:`DigestError` is raised on objects, which are only distinguishable by their identity.
+
+        >>> get_digest({"a": [1, 2], "b": None}) == get_digest({"b": None, "a": [1, 2]})
+        True
+        >>> get_digest([1, 2]) == get_digest([2, 1])
+        False
+        >>> get_digest(1) == get_digest("1")
+        False
+    """
+    return Digester().get_digest(obj)
+
+
+@define
+class Digester:
+    """
+    Deterministic Digest Calculator.
+
+    Digests of immutable subtrees - tuples, frozensets, frozen attrs classes and frozen dataclasses
+    containing immutable values only - are cached by object identity. The cached objects are kept alive
+    by the digester, the least recently used ones are dropped beyond ``maxsize`` entries.
+    """
+
+    maxsize: int = 4096
+    _cache: dict[int, tuple[Any, bytes]] = field(factory=dict, init=False, repr=False)
+
+    def get_digest(self, obj: Any) -> str:
+        """Return Deterministic Digest Of ``obj``."""
+        hasher = hashlib.sha256()
+        self._feed(hasher, obj, set())
+        return hasher.hexdigest()
+
+    def clear(self) -> None:
+        """Clear Cache."""
+        self._cache.clear()
+
+    def _feed(self, hasher, obj: Any, stack: set[int]) -> bool:
+        """Feed ``obj`` Into ``hasher`` And Return Whether It Is Immutable."""
+        cls = type(obj)
+        if cls in _SCALARTYPES:
+            # the representation of built-in scalars is unambiguous
+            hasher.update(f"{obj!r};".encode())
+            return True
+        if cls is dict and _STRTYPES.issuperset(map(type, obj)) and _SCALARTYPES.issuperset(map(type, obj.values())):
+            # fast path for string keys and scalar values
+            hasher.update(f"dict={sorted(obj.items())!r};".encode())
+            return False
+        if cls is dict or cls is list:
+            return self._feed_mutable(hasher, obj, stack)
+        if cls is tuple:
+            return self._feed_immutable(hasher, obj, stack)
+        return self._feed_other(hasher, obj, stack)
+
+    def _feed_other(self, hasher, obj: Any, stack: set[int]) -> bool:
+        cls = type(obj)
+        if isinstance(obj, _SCALARS):
+            # subclasses of scalar types
+            hasher.update(f"{cls.__qualname__}:{obj!r};".encode())
+            return True
+        if isinstance(obj, (PurePath, Enum)):
+            hasher.update(f"{cls.__qualname__}:{obj!s};".encode())
+            return True
+        if isinstance(obj, type) or (
+            isinstance(obj, BuiltinFunctionType) and (obj.__self__ is None or ismodule(obj.__self__))
+        ):
+            # classes and builtin functions
+            hasher.update(f"callable:{obj.__module__}.{obj.__qualname__};".encode())
+            return True
+        if isinstance(obj, (FunctionType, MethodType, BuiltinFunctionType, partial)):
+            # closures, bound methods and partial arguments may change
+            return self._feed_mutable(hasher, obj, stack)
+        if isinstance(obj, (tuple, frozenset)) or _get_fields(cls)[1]:
+            return self._feed_immutable(hasher, obj, stack)
+        return self._feed_mutable(hasher, obj, stack)
+
+    def _feed_mutable(self, hasher, obj: Any, stack: set[int]) -> bool:
+        ident = id(obj)
+        if ident in stack:
+            hasher.update(_CYCLE)
+            return False
+        stack.add(ident)
+        try:
+            self._feed_node(hasher, obj, stack)
+        finally:
+            stack.discard(ident)
+        return False
+
+    def _feed_immutable(self, hasher, obj: Any, stack: set[int]) -> bool:
+        # immutable candidates get their own digest, which is cached
+        ident = id(obj)
+        cache = self._cache
+        cached = cache.pop(ident, None)
+        if cached is not None and cached[0] is obj:
+            # keep most recently used entries last
+            cache[ident] = cached
+            hasher.update(cached[1])
+            return True
+        if ident in stack:
+            hasher.update(_CYCLE)
+            return False
+        stack.add(ident)
+        try:
+            nodehasher = hashlib.sha256()
+            immutable = self._feed_node(nodehasher, obj, stack)
+        finally:
+            stack.discard(ident)
+        digest = nodehasher.digest()
+        if immutable:
+            if len(cache) >= self.maxsize:
+                del cache[next(iter(cache))]
+            cache[ident] = (obj, digest)
+        hasher.update(digest)
+        return immutable
+
+    def _feed_node(self, hasher, obj: Any, stack: set[int]) -> bool:
+        if isinstance(obj, dict):
+            self._feed_dict(hasher, obj, stack)
+            return False
+        if isinstance(obj, (list, tuple)):
+            return self._feed_sequence(hasher, obj, stack)
+        if isinstance(obj, (set, frozenset)):
+            hasher.update(f"set{{{''.join(sorted(self.get_digest(item) for item in obj))}}}".encode())
+            return isinstance(obj, frozenset)
+        if isinstance(obj, (FunctionType, MethodType, BuiltinFunctionType, partial)):
+            self._feed_callable(hasher, obj, stack)
+            return False
+        cls = type(obj)
+        fieldnames, frozen = _get_fields(cls)
+        names: list[str] | tuple[str, ...]
+        if fieldnames is None:
+            names = sorted({*getattr(obj, "__dict__", ()), *get_slotnames(cls)})
+            if not names and not hasattr(obj, "__dict__"):
+                if cls.__repr__ is object.__repr__:
+                    # the default representation contains the memory address
+                    raise DigestError(f"Cannot digest {cls.__module__}.{cls.__qualname__} object")
+                hasher.update(f"{cls.__qualname__}:{obj!r};".encode())
+                return False
+        else:
+            names = fieldnames
+        hasher.update(f"{cls.__module__}.{cls.__qualname__}(".encode())
+        immutable = frozen
+        for name in names:
+            value = getattr(obj, name, _UNSET)
+            if value is _UNSET:
+                # unset slot
+                continue
+            hasher.update(f"{name}=".encode())
+            immutable = self._feed(hasher, value, stack) and immutable
+        hasher.update(b")")
+        return immutable
+
+    def _feed_callable(self, hasher, obj: FunctionType | MethodType | BuiltinFunctionType | partial, stack: set[int]):
+        if isinstance(obj, partial):
+            hasher.update(b"partial(")
+            for item in (obj.func, obj.args, obj.keywords):
+                self._feed(hasher, item, stack)
+        elif isinstance(obj, FunctionType):
+            hasher.update(f"function:{obj.__module__}.{obj.__qualname__}(".encode())
+            self._feed_code(hasher, obj.__code__, stack)
+            cells = [_get_cell_contents(cell) for cell in obj.__closure__ or ()]
+            self._feed(hasher, (obj.__defaults__, obj.__kwdefaults__, cells), stack)
+        else:
+            # bound methods
+            hasher.update(f"method:{obj.__qualname__}(".encode())
+            self._feed(hasher, getattr(obj, "__func__", None), stack)
+            self._feed(hasher, obj.__self__, stack)
+        hasher.update(b")")
+
+    def _feed_code(self, hasher, code: CodeType, stack: set[int]) -> None:
+        hasher.update(f"code:{code.co_code.hex()}:{code.co_names!r}:{len(code.co_consts)}[".encode())
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                self._feed_code(hasher, const, stack)
+            else:
+                self._feed(hasher, const, stack)
+        hasher.update(b"]")
+
+    def _feed_dict(self, hasher, obj: dict, stack: set[int]) -> None:
+        if _STRTYPES.issuperset(map(type, obj)):
+            if _SCALARTYPES.issuperset(map(type, obj.values())):
+                hasher.update(f"dict={sorted(obj.items())!r};".encode())
+                return
+            items = sorted(obj.items())
+        else:
+            items = sorted((self.get_digest(key), value) for key, value in obj.items())
+        hasher.update(b"dict{")
+        for key, value in items:
+            hasher.update(f"{key!r}:".encode())
+            self._feed(hasher, value, stack)
+        hasher.update(b"}")
+
+    def _feed_sequence(self, hasher, obj: list | tuple, stack: set[int]) -> bool:
+        name = type(obj).__name__
+        if _SCALARTYPES.issuperset(map(type, obj)):
+            # fast path for scalars
+            hasher.update(f"{name}={obj!r};".encode())
+            return isinstance(obj, tuple)
+        hasher.update(f"{name}[".encode())
+        immutable = isinstance(obj, tuple)
+        for item in obj:
+            immutable = self._feed(hasher, item, stack) and immutable
+        hasher.update(b"]")
+        return immutable
+
+
+class _EmptyCell:
+    """Placeholder For Closure Cells Without Value."""
+
+
+def _get_cell_contents(cell) -> Any:
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EmptyCell()
+
+
+_Fields = tuple[tuple[str, ...] | None, bool]
+_FIELDS: dict[type, _Fields] = {}
+
+
+def _get_fields(cls: type) -> _Fields:
+    """Field Names And Frozen State Of Attrs Classes And Dataclasses."""
+    try:
+        return _FIELDS[cls]
+    except KeyError:
+        pass
+    result: _Fields = None, False
+    if attrs_has(cls):
+        # attrs does not provide a public API for frozen classes
+        frozen = getattr(cls.__setattr__, "__name__", "") == "_frozen_setattrs"
+        result = tuple(item.name for item in attrs_fields(cls)), frozen
+    elif is_dataclass(cls):
+        result = tuple(item.name for item in dataclass_fields(cls)), cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+    _FIELDS[cls] = result
+    return result
+
+
+_SLOTNAMES: dict[type, tuple[str, ...]] = {}
+
+
+def get_slotnames(cls: type) -> tuple[str, ...]:
+    """Names Of All Slot Attributes Of ``cls`` And Its Base Classes."""
+    try:
+        return _SLOTNAMES[cls]
+    except KeyError:
+        pass
+    names: dict[str, None] = {}
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                # private name mangling
+                name = f"_{base.__name__.lstrip('_')}{name}"  # noqa: PLW2901
+            names[name] = None
+    result = _SLOTNAMES[cls] = tuple(names)
+    return result
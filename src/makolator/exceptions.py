@@ -26,3 +26,7 @@
 
 class MakolatorError(RuntimeError):
     """Just a Helper to Distinguish our Error."""
+
+
+class DigestError(MakolatorError):
+    """Value Cannot Be Digested Deterministically."""
@@ -27,34 +27,68 @@ The Makolator.
 A simple API to an improved Mako.
 """
 
+import asyncio
+import codecs
 import hashlib
 import io
+import os
 import tempfile
-from collections.abc import Generator, Iterator
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
 from pathlib import Path
 from shutil import rmtree
 from tempfile import TemporaryFile
+from typing import TypeAlias
 
-from attrs import define, field
-from mako.exceptions import text_error_template
-from mako.lookup import TemplateLookup
+import mako
+from attrs import asdict, define, evolve, field
+from mako.exceptions import MakoException, text_error_template
 from mako.runtime import Context
 from mako.template import Template
 from outputfile import Existing, State, open_
 from uniquer import uniquelist
 
 from . import escape, helper
-from ._inplace import InplaceRenderer
-from ._staticcode import StaticCode, read
-from ._util import LOGGER, Paths, humanify, iter_files, norm_paths
-from .config import Config
+from ._depfile import write_depfile
+from ._inplace import DefIndex, InplaceRenderer, has_markers, read_lines
+from ._lookup import MakolatorTemplateLookup, compile_template, create_lookup
+from ._searchindex import SearchIndex
+from ._staticcode import StaticCode, StaticCodeMap, read, read_map
+from ._util import LOGGER, Paths, get_version, humanify, iter_batches, iter_files, norm_paths
+from .buildstate import BuildState, get_inline_templates
+from .cachebackend import CacheBackend, ChainBackend, FileBackend, create_backend
+from .cachemanager import BUILDSTATE_FILENAME, DEPGRAPH_FILENAME, CacheManager
+from .cachestat import CacheStat
+from .config import CacheMode, Config
 from .datamodel import Datamodel
-from .exceptions import MakolatorError
+from .depgraph import DepGraph
+from .digest import get_digest
+from .exceptions import DigestError, MakolatorError
 from .info import Info
+from .registry import TEMPLATE_REGISTRY
+from .rendercache import RenderCache, RenderEntry
 from .tags import Tag
 from .tracker import AddState, Tracker
 
+GenJob: TypeAlias = tuple[Paths, Path | None, dict | None]
+"""Templates, Output File And Context Of One :any:`Makolator.gen_many` Job."""
+
+InplaceJob: TypeAlias = tuple[Paths, Path, dict | None, bool]
+"""Templates, Updated File, Context And ``ignore_unknown`` Of One :any:`Makolator.inplace_jobs` Job."""
+
+CLEAN_BATCHSIZE = 1024
+"""Number Of Files Checked At Once By :any:`Makolator.clean`."""
+
+CLEAN_LINESIZE = 4096
+"""Maximum Inspected Line Length On :any:`Makolator.clean` - Longer Lines Count As Several Lines."""
+
+INPLACE_ERRORS = (MakolatorError, MakoException, OSError, ValueError)
+"""Errors Collected By :any:`Makolator.inplace_many`."""
+
 HELPER = {
     "indent": helper.indent,
     "prefix": helper.prefix,
@@ -62,6 +96,63 @@ HELPER = {
     "tex": escape.tex,
 }
 
+HELPER_TEMPLATE = """<%! from makolator import helper %>
+<%def name="run(*args, **kwargs)">\
+${helper.run(*args, **kwargs)}\
+</%def>"""
+_HELPER_TEMPLATES: dict[str, Template] = {}
+_FULLY_GENERATED = Tag.FULLY_GENERATED.value.encode()
+# Config options without impact on the rendered content - the resolved template search path is digested separately
+_NOBUILD = frozenset(
+    (
+        "async_limit",
+        "buildstate",
+        "cache_max_entries",
+        "cache_max_size",
+        "cache_mode",
+        "cache_path",
+        "depgraph",
+        "diffout",
+        "post_create",
+        "post_remove",
+        "post_update",
+        "pre_create",
+        "pre_remove",
+        "pre_update",
+        "remote_cache",
+        "render_cache",
+        "template_paths",
+        "template_paths_check",
+        "template_registry",
+        "track",
+        "verbose",
+    )
+)
+
+
+def _get_helper_template(cachestat: CacheStat) -> Template:
+    """Built-In Helper Template - Compiled Once Per Process."""
+    try:
+        template = _HELPER_TEMPLATES["helper"]
+    except KeyError:
+        cachestat.miss("helper")
+        template = _HELPER_TEMPLATES.setdefault("helper", Template(HELPER_TEMPLATE))
+    else:
+        cachestat.hit("helper")
+    return template
+
+
+@define
+class _Recording:
+    """Dependencies And Further Outputs Recorded While Rendering."""
+
+    deps: set[str] = field(factory=set)
+    outputs: set[str] = field(factory=set)
+
+
+# Recordings of the renders running within the current thread or asyncio task, innermost last
+_RECORDINGS: "ContextVar[tuple[tuple[Makolator, _Recording], ...]]" = ContextVar("_RECORDINGS", default=())
+
 
 @define
 class Makolator:
@@ -83,10 +174,31 @@ class Makolator:
     tracker: Tracker = field(factory=Tracker)
     """File Change Tracker."""
 
+    cachestat: CacheStat = field(factory=CacheStat)
+    """Cache Statistics."""
+
     __cache_path: Path | None = None
+    _cache_pid: int = field(default=0, init=False, repr=False, eq=False)
+    _cache_pruned: bool = field(default=False, init=False, repr=False, eq=False)
+    _depgraph: DepGraph | None = field(default=None, init=False, repr=False, eq=False)
+    _buildstate: BuildState | None = field(default=None, init=False, repr=False, eq=False)
+    _commondigest: str | None = field(default=None, init=False, repr=False, eq=False)
+    _tracklock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
+    _filedigests: dict[str, tuple[int, int, str]] = field(factory=dict, init=False, repr=False, eq=False)
+    _lookups: dict[tuple[str, ...], MakolatorTemplateLookup] = field(factory=dict, init=False, repr=False, eq=False)
+    _searchindex: SearchIndex = field(init=False, repr=False, eq=False)
+    _defindexes: dict[tuple[Template, ...], DefIndex] = field(factory=dict, init=False, repr=False, eq=False)
+    _asynclocks: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore, asyncio.Lock] | None = field(
+        default=None, init=False, repr=False, eq=False
+    )
+
+    @_searchindex.default
+    def _searchindex_default(self) -> SearchIndex:
+        return SearchIndex(cachestat=self.cachestat)
 
     def __del__(self):
-        if self.__cache_path:
+        # forked worker processes inherit the temporary cache of their parent
+        if self.__cache_path and self._cache_pid == os.getpid():
             rmtree(self.__cache_path)
             self.__cache_path = None
 
@@ -96,12 +208,230 @@ class Makolator:
         cache_path = self.config.cache_path
         if cache_path:
             cache_path.mkdir(parents=True, exist_ok=True)
+            if not self._cache_pruned:
+                self._cache_pruned = True
+                self.cachemanager.prune()
             return cache_path
 
         if not self.__cache_path:
             self.__cache_path = Path(tempfile.mkdtemp(prefix="makolator"))
+            self._cache_pid = os.getpid()
         return self.__cache_path
 
+    @property
+    def cachemanager(self) -> CacheManager:
+        """Manager of the persistent cache at ``Config.cache_path``."""
+        config = self.config
+        return CacheManager(
+            config.cache_path or self.cache_path,
+            max_size=config.cache_max_size,
+            max_entries=config.cache_max_entries,
+        )
+
+    @property
+    def depgraph(self) -> DepGraph:
+        """Template Dependency Graph, Stored Within ``cache_path`` If ``Config.depgraph`` Is Set."""
+        depgraph = self._depgraph
+        if depgraph is None:
+            depgraph = self._depgraph = DepGraph.load(self.cache_path / DEPGRAPH_FILENAME)
+        return depgraph
+
+    def _add_deps(self, lookup: MakolatorTemplateLookup, templates: Iterable[Template], output: Path | None):
+        config = self.config
+        if config.depgraph or config.buildstate:
+            self.depgraph.add(lookup, templates, output)
+
+    def _save_deps(self):
+        depgraph = self._depgraph
+        if depgraph is not None and depgraph.is_modified:
+            depgraph.save(self.cache_path / DEPGRAPH_FILENAME)
+
+    @property
+    def buildstate(self) -> BuildState:
+        """Build State Database Within ``cache_path``, Used If ``Config.buildstate`` Is Set."""
+        buildstate = self._buildstate
+        if buildstate is None:
+            buildstate = self._buildstate = BuildState(self.cache_path / BUILDSTATE_FILENAME)
+        return buildstate
+
+    def _get_build_digest(self, *args) -> str | None:
+        """Digest Of All Rendering Inputs Or ``None`` If Build State Is Not Used."""
+        config = self.config
+        if not config.buildstate or config.existing != Existing.KEEP_TIMESTAMP:
+            return None
+        try:
+            return get_digest((self._get_common_digest(), *args))
+        except DigestError as exc:
+            LOGGER.info("not skippable: %s", exc)
+            return None
+
+    def _get_common_digest(self) -> str:
+        """Digest Of Versions, Configuration, Info And Datamodel."""
+        # datamodel may be modified between API calls
+        common = self._commondigest
+        if common is None:
+            config = self.config
+            options = {name: value for name, value in asdict(config, recurse=False).items() if name not in _NOBUILD}
+            datamodel = self.datamodel
+            datadigest = datamodel.get_digest() if isinstance(datamodel, Datamodel) else get_digest(datamodel)
+            common = self._commondigest = get_digest((mako.__version__, get_version(), options, self.info, datadigest))
+        return common
+
+    def _get_file_digest(self, filename: str) -> str | None:
+        """Content Digest Of ``filename`` - Cached Until Modification."""
+        try:
+            stat = os.stat(filename)  # noqa: PTH116
+        except OSError:
+            return None
+        cached = self._filedigests.get(filename)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        with open(filename, "rb") as file:  # noqa: PTH123
+            digest = hashlib.sha256(file.read()).hexdigest()
+        self._filedigests[filename] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    @property
+    def remote(self) -> CacheBackend | None:
+        """Backend Of ``Config.remote_cache``."""
+        remote_cache = self.config.remote_cache
+        return create_backend(remote_cache) if remote_cache else None
+
+    @property
+    def rendercache(self) -> RenderCache:
+        """Render Output Cache Within ``cache_path`` And ``Config.remote_cache``, Used With ``Config.render_cache``."""
+        backend: CacheBackend = FileBackend(self.cache_path)
+        remote = self.remote
+        if remote is not None:
+            backend = ChainBackend([backend, remote])
+        return RenderCache(backend)
+
+    def _render_cached(
+        self, lookup: MakolatorTemplateLookup, templates: Iterable[Template], output: Path, render: Callable, *args
+    ) -> str:
+        """Return Output From Render Cache Or ``render`` And Store It."""
+        depgraph = self.depgraph
+        closure = depgraph.get_closure(depgraph.add(lookup, templates))
+        sources = sorted(
+            (
+                depgraph.templates[filename].uri if filename in depgraph.templates else "",
+                self._get_file_digest(filename),
+            )
+            for filename in closure
+        )
+        try:
+            key = get_digest((self._get_common_digest(), str(output), sources, *args))
+        except DigestError as exc:
+            LOGGER.info("not cacheable: %s", exc)
+            return render()
+        rendercache = self.rendercache
+        entry = rendercache.get(key)
+        if entry is not None and all(self._get_file_digest(dep) == digest for dep, digest in entry.deps.items()):
+            self.cachestat.hit("render")
+            for dep in (*closure, *entry.deps):
+                self.add_dependency(dep)
+            return entry.text
+        self.cachestat.miss("render")
+        with self._record(None) as recording:
+            text = render()
+        if recording.outputs:
+            # further outputs are not restored on hits
+            return text
+        depdigests = {dep: self._get_file_digest(dep) for dep in sorted(recording.deps - closure)}
+        rendercache.put(key, RenderEntry({dep: digest for dep, digest in depdigests.items() if digest}, text))
+        return text
+
+    def _get_gen_digest(self, lookup: MakolatorTemplateLookup, tplfilepaths: list[Path], context: dict) -> str | None:
+        return self._get_build_digest("gen", lookup.directories, str(tplfilepaths[0]), context)
+
+    def _get_inplace_digest(
+        self, lookup: MakolatorTemplateLookup, tplfilepaths: list[Path], context: dict, ignore_unknown: bool
+    ) -> str | None:
+        return self._get_build_digest(
+            "inplace", lookup.directories, [str(path) for path in tplfilepaths], context, ignore_unknown
+        )
+
+    def _check_gen_build(
+        self, template_filepaths: list[Path], dest: Path, context: dict | None
+    ) -> tuple[MakolatorTemplateLookup, str | None] | None:
+        """Return Lookup And Build Digest For ``dest`` - Or ``None`` If It Is Unchanged."""
+        tplfilepaths, lookup = self._create_template_lookup(
+            template_filepaths, self.config.template_paths, required=True
+        )
+        digest = self._get_gen_digest(lookup, tplfilepaths, context or {})
+        if self._is_built(dest, digest):
+            return None
+        return lookup, digest
+
+    def _check_inplace_build(
+        self, template_filepaths: list[Path], filepath: Path, context: dict | None, ignore_unknown: bool
+    ) -> tuple[MakolatorTemplateLookup, str | None] | None:
+        """Return Lookup And Build Digest For ``filepath`` - Or ``None`` If It Is Unchanged."""
+        tplfilepaths, lookup, _, _ = self._prepare_inplace(template_filepaths, filepath, ignore_unknown)
+        digest = self._get_inplace_digest(lookup, tplfilepaths, context or {}, ignore_unknown)
+        if self._is_built(filepath, digest):
+            return None
+        return lookup, digest
+
+    def _is_built(self, output: Path, digest: str | None) -> bool:
+        if digest is None or not self.buildstate.is_unchanged(output, digest):
+            return False
+        LOGGER.info("unchanged(%r)", str(output))
+        self._track_state(output, State.IDENTICAL)
+        return True
+
+    def _add_build(
+        self,
+        lookup: MakolatorTemplateLookup,
+        output: Path,
+        digest: str | None,
+        recording: _Recording,
+        inline: bool = False,
+    ):
+        if digest is None:
+            return
+        buildstate = self.buildstate
+        if recording.outputs:
+            # further outputs are only created or checked while rendering
+            buildstate.remove(output)
+            return
+        depgraph = self.depgraph
+        filenames = [*depgraph.outputs.get(str(output), ()), *recording.deps]
+        if inline and output.exists():
+            filenames += depgraph.add(lookup, get_inline_templates(lookup, output))
+        buildstate.add(output, digest, depgraph.get_closure(filenames))
+
+    def add_dependency(self, filepath: Path | str) -> None:
+        """
+        Register ``filepath`` As Dependency Of The Output Rendered Right Now.
+
+        To be used by templates reading further files, i.e. ``<% makolator.add_dependency(filepath) %>``.
+        Dependencies are listed within the dependency files written with ``Config.depfile``
+        and checked by ``Config.buildstate``.
+        """
+        for owner, recording in _RECORDINGS.get():
+            if owner is self:
+                recording.deps.add(str(filepath))
+
+    @contextmanager
+    def _record(self, output: Path | None, templates: Iterable[Template] = ()) -> Iterator[_Recording]:
+        """Record Dependencies And Further Outputs While Rendering ``output`` And Write Its Depfile."""
+        recording = _Recording({template.filename for template in templates if template.filename})
+        token = _RECORDINGS.set((*_RECORDINGS.get(), (self, recording)))
+        try:
+            yield recording
+        finally:
+            _RECORDINGS.reset(token)
+        if output is not None:
+            recording.outputs.discard(str(output))
+            if self.config.depfile:
+                write_depfile(output, recording.deps)
+
+    def _add_output(self, name: str) -> None:
+        for owner, recording in _RECORDINGS.get():
+            if owner is self:
+                recording.outputs.add(name)
+
     def remove(self, filepaths: Paths):
         """Remove files or files in given directories."""
         for filepath in iter_files(norm_paths(filepaths)):
@@ -164,14 +494,23 @@ class Makolator:
             self._track_state(filepath, state)
 
     def _track_state(self, filepath: Path, state: State) -> None:
+        self._add_output(str(filepath))
         # Track State
         config = self.config
-        if config.track:
-            self.tracker.add(filepath, state)
-        if config.verbose:
-            print(f"'{filepath!s}'... {state.value}")
+        # async file operations run within threads
+        with self._tracklock:
+            if config.track:
+                self.tracker.add(filepath, state)
+            if config.verbose:
+                print(f"'{filepath!s}'... {state.value}")
 
-    def gen(self, template_filepaths: Paths, dest: Path | None = None, context: dict | None = None):
+    def gen(
+        self,
+        template_filepaths: Paths,
+        dest: Path | None = None,
+        context: dict | None = None,
+        workers: int | None = 1,
+    ):
         """
         Render template file.
 
@@ -181,33 +520,139 @@ class Makolator:
         Keyword Args:
             dest: Output File.
             context: Key-Value Pairs pairs forwarded to the template.
+            workers: Number of Worker Processes on template directories. ``None`` is the number of CPUs.
         """
-        template_filepaths = norm_paths(template_filepaths)
+        self._commondigest = None
+        self._gen(norm_paths(template_filepaths), dest, context, workers=workers)
+        self._save_deps()
+
+    def gen_many(self, jobs: Iterable[GenJob], workers: int | None = None):
+        """
+        Render Many Template Files In Parallel.
+
+        Each job is rendered like :any:`Makolator.gen` by a pool of worker processes.
+        Every worker keeps its template lookup between the jobs and shares ``cache_path``.
+        ``config``, ``datamodel``, ``info`` and the job contexts must be picklable.
+        Tracked states are merged in job order.
+
+        Args:
+            jobs: Tuples of templates, output file and context.
+
+        Keyword Args:
+            workers: Number of Worker Processes. Default is the number of CPUs. ``1`` renders in-process.
+        """
+        normjobs = [(norm_paths(templates), dest, context) for templates, dest, context in jobs]
+        LOGGER.info("gen_many(%d jobs)", len(normjobs))
+        self._commondigest = None
+        if workers == 1:
+            for template_filepaths, dest, context in normjobs:
+                self._gen(template_filepaths, dest, context)
+        else:
+            self._run_workers(_gen_worker, normjobs, workers)
+        self._save_deps()
+
+    def _run_workers(self, func: Callable, jobs: list[tuple], workers: int | None) -> list:
+        config = evolve(self.config, cache_path=self.cache_path, track=True, verbose=False)
+        initargs = (config, self.datamodel, self.info)
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+            futures = [executor.submit(func, *job) for job in jobs]
+            try:
+                for future in futures:
+                    tracker, depgraph, result = future.result()
+                    for filepath, state in tracker.items:
+                        self._track_state(filepath, state)
+                    if depgraph is not None:
+                        self.depgraph.update(depgraph)
+                    results.append(result)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
+    def _gen(
+        self,
+        template_filepaths: list[Path],
+        dest: Path | None = None,
+        context: dict | None = None,
+        workers: int | None = 1,
+    ):
         LOGGER.debug("_gen(%r, %r)", [str(filepath) for filepath in template_filepaths], str(dest or "STDOUT"))
         is_recursive = any(path.is_dir() for path in template_filepaths)
         if is_recursive:
             self._check_recursive(template_filepaths, dest)
             datamodel = self.datamodel
-            for tplbasepath, path in self._iter_recursive(template_filepaths):
-                tplpath = tplbasepath / path
-                outpath = dest / Template(str(path).removesuffix(".mako")).render(datamodel=datamodel)
-                if tplpath.name.endswith(".mako"):
-                    self._gen_file([tplpath], outpath, context)
-                else:
-                    # automatically detect binary mode
-                    try:
-                        text = tplpath.read_text()
-                    except ValueError:
-                        text = None
-                    if text is None:
-                        with self.open_outputfile(outpath, mode="wb", encoding=None) as output:  # type: ignore[arg-type]
-                            output.write(tplpath.read_bytes())
-                    else:
-                        with self.open_outputfile(outpath, mode="w") as output:
-                            output.write(text)
+            jobs = [
+                (tplbasepath / path, dest / Template(str(path).removesuffix(".mako")).render(datamodel=datamodel))
+                for tplbasepath, path in self._iter_recursive(template_filepaths)
+            ]
+            if workers == 1:
+                for tplpath, outpath in jobs:
+                    self._gen_recursive_file(tplpath, outpath, context)
+            else:
+                self._run_workers(_gen_recursive_worker, [(*job, context) for job in jobs], workers)
         else:
             self._gen_file(template_filepaths, dest, context)
 
+    def _gen_recursive_file(self, tplpath: Path, outpath: Path, context: dict | None):
+        if tplpath.name.endswith(".mako"):
+            self._gen_file([tplpath], outpath, context)
+        else:
+            # automatically detect binary mode
+            try:
+                text = tplpath.read_text()
+            except ValueError:
+                text = None
+            if text is None:
+                with self.open_outputfile(outpath, mode="wb", encoding=None) as output:  # type: ignore[arg-type]
+                    output.write(tplpath.read_bytes())
+            else:
+                with self.open_outputfile(outpath, mode="w") as output:
+                    output.write(text)
+
+    def precompile(self, paths: Paths | None = None, workers: int | None = None) -> list[Path]:
+        """
+        Compile Templates Into ``cache_path``.
+
+        All templates (``*.mako``) within the given directories and ``Config.template_paths`` are compiled
+        to python modules and their bytecode. Subsequent runs sharing ``cache_path`` skip the compilation.
+
+        Keyword Args:
+            paths: Additional Template Directories.
+            workers: Number of Worker Processes. Default is the number of CPUs. ``1`` compiles in-process.
+
+        Returns:
+            Compiled Modules.
+        """
+        config = self.config
+        cache_path = self.cache_path
+        searchpaths = config.template_paths
+        jobs: list[tuple[list[Path], str]] = []
+        for basepath in uniquelist([*norm_paths(paths or []), *searchpaths]):
+            for filepath in sorted(basepath.glob("**/*.mako")):
+                # uri as used by include/inherit/namespace
+                jobs.append((uniquelist([basepath, *searchpaths]), filepath.relative_to(basepath).as_posix()))
+                if config.cache_mode == CacheMode.CONTENT and filepath.parent != basepath:
+                    # uri as used by gen/inplace, which is part of the content addressed module name
+                    jobs.append((uniquelist([filepath.parent, *searchpaths]), filepath.name))
+        LOGGER.info("precompile(%d templates, %r)", len(jobs), str(cache_path))
+        if workers == 1:
+            modulepaths = [
+                compile_template(directories, cache_path, config.cache_mode, uri, config.remote_cache)
+                for directories, uri in jobs
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        compile_template, directories, cache_path, config.cache_mode, uri, config.remote_cache
+                    )
+                    for directories, uri in jobs
+                ]
+                modulepaths = [future.result() for future in futures]
+        return uniquelist(modulepaths)
+
     @staticmethod
     def _check_recursive(template_filepaths: list[Path], dest: Path | None = None):
         if dest:
@@ -236,22 +681,40 @@ class Makolator:
         comment_sep = self._get_comment_sep(dest)
         if dest is None:
             # newlines may be broken on STDOUT under windows - WON'T FIX
+            self._add_output("STDOUT")
             with TemporaryFile(mode="w+", newline="") as out:
                 with read(dest, comment_sep, self.config) as staticcode:
                     template = next(templates)  # Load template
                     LOGGER.info("gen(%r, STDOUT)", template.filename)
+                    self._add_deps(lookup, [template], None)
                     self._render(template, out, None, context, staticcode, comment_sep)
                 out.seek(0)
                 for line in out:
                     print(line.rstrip())
         else:
-            # Mako takes care about proper newline handling. Therefore we deactivate
-            # the universal newline mode, by setting newline="".
-            with self.open_outputfile(dest, newline="") as output:
-                with read(dest, comment_sep, self.config) as staticcode:
-                    template = next(templates)  # Load template
-                    LOGGER.info("gen(%r, %r)", template.filename, str(dest))
-                    self._render(template, output, dest, context, staticcode, comment_sep)
+            digest = self._get_gen_digest(lookup, tplfilepaths, context)
+            if self._is_built(dest, digest):
+                return
+            if self.config.render_cache:
+                try:
+                    staticcodemap = read_map(dest, self.config)
+                    text, recording = self._render_file_cached(
+                        template_filepaths, dest, context, comment_sep, staticcodemap
+                    )
+                except BaseException:
+                    self._track_state(dest, State.FAILED)
+                    raise
+                self._write_file(dest, text)
+            else:
+                # Mako takes care about proper newline handling. Therefore we deactivate
+                # the universal newline mode, by setting newline="".
+                with self._record(dest) as recording, self.open_outputfile(dest, newline="") as output:
+                    with read(dest, comment_sep, self.config) as staticcode:
+                        template = next(templates)  # Load template
+                        LOGGER.info("gen(%r, %r)", template.filename, str(dest))
+                        self._add_deps(lookup, [template], dest)
+                        self._render(template, output, dest, context, staticcode, comment_sep)
+            self._add_build(lookup, dest, digest, recording)
 
     def _render(
         self, template: Template, output, dest: Path | None, context: dict, staticcode: StaticCode, comment_sep: str
@@ -277,26 +740,155 @@ class Makolator:
             context: Key-Value Pairs pairs forwarded to the template.
             ignore_unknown: Ignore unknown inplace markers, instead of raising an error.
         """
+        self._commondigest = None
+        self._inplace(norm_paths(template_filepaths), filepath, context, ignore_unknown)
+        self._save_deps()
+
+    def inplace_many(
+        self,
+        template_filepaths: Paths,
+        filepaths: Iterable[Path],
+        context: dict | None = None,
+        ignore_unknown: bool = False,
+        workers: int | None = 1,
+    ):
+        """
+        Update generated code within many files between BEGIN/END markers.
+
+        All files are processed. Failures are collected and raised together at the end.
+
+        Args:
+            template_filepaths: Templates.
+            filepaths: Files to update.
+
+        Keyword Args:
+            context: Key-Value Pairs pairs forwarded to the template.
+            ignore_unknown: Ignore unknown inplace markers, instead of raising an error.
+            workers: Number of Worker Processes. ``None`` is the number of CPUs.
+        """
         template_filepaths = norm_paths(template_filepaths)
+        jobs = [(template_filepaths, filepath, context, ignore_unknown) for filepath in filepaths]
+        self.inplace_jobs(jobs, workers=workers)
+
+    def inplace_jobs(self, jobs: Iterable[InplaceJob], workers: int | None = 1):
+        """
+        Update Many Files With Their Own Templates And Context.
+
+        Like :any:`Makolator.inplace_many`, but all jobs share one pool of worker processes.
+        All files are processed. Failures are collected and raised together at the end.
+
+        Args:
+            jobs: Tuples of templates, updated file, context and ``ignore_unknown``.
+
+        Keyword Args:
+            workers: Number of Worker Processes. ``None`` is the number of CPUs.
+        """
+        normjobs = [
+            (norm_paths(templates), filepath, context, ignore_unknown)
+            for templates, filepath, context, ignore_unknown in jobs
+        ]
+        LOGGER.info("inplace_many(%d files)", len(normjobs))
+        self._commondigest = None
+        if workers == 1:
+            errors = [self._try_inplace(*job) for job in normjobs]
+        else:
+            # Workers load the templates compiled here from the shared ``cache_path``
+            for template_filepaths in uniquelist(tuple(job[0]) for job in normjobs):
+                tplfilepaths, lookup = self._create_template_lookup(
+                    list(template_filepaths), self.config.template_paths
+                )
+                tuple(self._create_templates(tplfilepaths, lookup))
+            errors = self._run_workers(_inplace_worker, normjobs, workers)
+        self._save_deps()
+        msgs = [f"{job[1]!s}: {error}" for job, error in zip(normjobs, errors, strict=True) if error]
+        if msgs:
+            raise MakolatorError("\n".join((f"{len(msgs)} of {len(normjobs)} files failed.", *msgs)))
+
+    def _try_inplace(
+        self, template_filepaths: list[Path], filepath: Path, context: dict | None, ignore_unknown: bool
+    ) -> Exception | None:
+        try:
+            self._inplace(template_filepaths, filepath, context, ignore_unknown)
+        except INPLACE_ERRORS as exc:
+            return exc
+        return None
+
+    def _inplace(self, template_filepaths: list[Path], filepath: Path, context: dict | None, ignore_unknown: bool):
         LOGGER.debug("_inplace(%r, %r)", [str(filepath) for filepath in template_filepaths], str(filepath))
-        tplfilepaths, lookup = self._create_template_lookup(template_filepaths, self.config.template_paths)
-        templates = tuple(self._create_templates(tplfilepaths, lookup))
         config = self.config
         context = context or {}
         comment_sep = self._get_comment_sep(filepath)
-
-        eol = self._get_eol(filepath, config.inplace_eol_comment)
-        inplace = InplaceRenderer(config, templates, ignore_unknown, eol)
+        tplfilepaths, lookup, templates, inplace = self._prepare_inplace(template_filepaths, filepath, ignore_unknown)
+        if self._is_markerless(filepath):
+            return
+        digest = self._get_inplace_digest(lookup, tplfilepaths, context, ignore_unknown)
+        if self._is_built(filepath, digest):
+            return
 
         if not filepath.exists() and config.create:
             LOGGER.info("create inplace(%r, %r)", str(tplfilepaths[0]) if tplfilepaths else None, str(filepath))
             self._create_inplace(inplace, filepath, config, comment_sep, context)
 
-        LOGGER.info("inplace(%r, %r)", str(tplfilepaths[0]) if tplfilepaths else None, str(filepath))
-        with self.open_outputfile(filepath, existing=Existing.KEEP_TIMESTAMP, newline="") as outputfile:
-            with read(filepath, comment_sep, config) as staticcode:
-                rendercontext = self._get_render_context(filepath, context, staticcode, comment_sep, inplace=True)
-                inplace.render(lookup, filepath, outputfile, rendercontext)
+        if config.render_cache:
+            try:
+                lines = read_lines(filepath)
+                staticcodemap = read_map(filepath, config)
+                text, recording = self._render_inplace_cached(
+                    template_filepaths, filepath, context, ignore_unknown, lines, staticcodemap
+                )
+            except BaseException:
+                self._track_state(filepath, State.FAILED)
+                raise
+            self._write_file(filepath, text, existing=Existing.KEEP_TIMESTAMP)
+        else:
+            LOGGER.info("inplace(%r, %r)", str(tplfilepaths[0]) if tplfilepaths else None, str(filepath))
+            with (
+                self._record(filepath, templates) as recording,
+                self.open_outputfile(filepath, existing=Existing.KEEP_TIMESTAMP, newline="") as outputfile,
+            ):
+                with read(filepath, comment_sep, config) as staticcode:
+                    rendercontext = self._get_render_context(filepath, context, staticcode, comment_sep, inplace=True)
+                    inplace.render(lookup, filepath, outputfile, rendercontext)
+            self._add_deps(lookup, templates, filepath)
+        self._add_build(lookup, filepath, digest, recording, inline=True)
+
+    def _is_markerless(self, filepath: Path) -> bool:
+        """Skip Existing Files Without Any Marker - They Stay Untouched."""
+        config = self.config
+        markers = (config.inplace_marker, config.template_marker, config.static_marker)
+        if not filepath.exists() or has_markers(filepath, markers):
+            return False
+        LOGGER.info("inplace(%r) no markers", str(filepath))
+        self._track_state(filepath, State.IDENTICAL)
+        return True
+
+    def _prepare_inplace(
+        self, template_filepaths: list[Path], filepath: Path, ignore_unknown: bool
+    ) -> tuple[list[Path], MakolatorTemplateLookup, tuple[Template, ...], InplaceRenderer]:
+        config = self.config
+        tplfilepaths, lookup = self._create_template_lookup(template_filepaths, config.template_paths)
+        templates = tuple(self._create_templates(tplfilepaths, lookup))
+        eol = self._get_eol(filepath, config.inplace_eol_comment)
+        try:
+            defindex = self._defindexes[templates]
+        except KeyError:
+            defindex = self._defindexes[templates] = DefIndex.from_templates(templates)
+        inplace = InplaceRenderer(config, templates, ignore_unknown, eol, defindex=defindex)
+        return tplfilepaths, lookup, templates, inplace
+
+    def get_inplace_funcs(self, template_filepaths: Paths) -> dict[str, str | None]:
+        """
+        Functions Available For Inplace Rendering.
+
+        Args:
+            template_filepaths: Templates.
+
+        Returns:
+            Function names and the filename of the implementing template.
+        """
+        tplfilepaths, lookup = self._create_template_lookup(norm_paths(template_filepaths), self.config.template_paths)
+        defindex = DefIndex.from_templates(self._create_templates(tplfilepaths, lookup))
+        return {funcname: template.filename for funcname, template in sorted(defindex.templates.items())}
 
     def _create_inplace(
         self, inplace: InplaceRenderer, filepath: Path, config: Config, comment_sep: str, context: dict
@@ -316,44 +908,51 @@ class Makolator:
         else:
             raise MakolatorError("None of the templates implements 'create_inplace'")
 
-    def _create_templates(self, tplfilepaths: list[Path], lookup: TemplateLookup) -> Generator[Template, None, None]:
+    def _create_templates(
+        self, tplfilepaths: list[Path], lookup: MakolatorTemplateLookup
+    ) -> Generator[Template, None, None]:
         for tplfilepath in tplfilepaths:
             yield lookup.get_template(tplfilepath.name)
-        yield Template(
-            """<%! from makolator import helper %>
-<%def name="run(*args, **kwargs)">\
-${helper.run(*args, **kwargs)}\
-</%def>"""
-        )
+        yield _get_helper_template(self.cachestat)
 
     def _create_template_lookup(
         self, template_filepaths: list[Path], searchpaths: list[Path], required: bool = False
-    ) -> tuple[list[Path], TemplateLookup]:
-        cache_path = self.cache_path
+    ) -> tuple[list[Path], MakolatorTemplateLookup]:
+        config = self.config
+        registry = TEMPLATE_REGISTRY if config.template_registry else None
+        # The registry compiles in memory - no need for a temporary cache directory
+        cache_path = self.cache_path if registry is None or config.cache_path else None
         tplfilepaths = list(self._find_files(template_filepaths, searchpaths, required=required))
         lookuppaths = uniquelist([tplfilepath.parent for tplfilepath in tplfilepaths] + searchpaths)
 
-        def get_module_filename(filepath: str, uri: str):
-            hash_ = hashlib.sha256()
-            hash_.update(bytes(filepath, encoding="utf-8"))
-            ident = hash_.hexdigest()
-            return cache_path / f"{Path(filepath).name}_{ident}.py"
-
-        lookup = TemplateLookup(
-            directories=[str(item) for item in lookuppaths],
-            cache_dir=self.cache_path,
-            input_encoding="utf-8",
-            output_encoding="utf-8",
-            modulename_callable=get_module_filename,
-            strict_undefined=True,
+        # Reuse lookup (and its loaded templates) for identical search paths
+        key = (
+            str(cache_path),
+            config.cache_mode.value,
+            str(registry is not None),
+            *(str(item) for item in lookuppaths),
+        )
+        try:
+            lookup = self._lookups[key]
+        except KeyError:
+            self.cachestat.miss("lookup")
+        else:
+            self.cachestat.hit("lookup")
+            return tplfilepaths, lookup
+
+        lookup = create_lookup(
+            lookuppaths, cache_path, config.cache_mode, registry=registry, cachestat=self.cachestat, remote=self.remote
         )
+        lookup.recorder = self.add_dependency
+        self._lookups[key] = lookup
         return tplfilepaths, lookup
 
-    @staticmethod
     def _find_files(
-        filepaths: list[Path], searchpaths: list[Path], required: bool = False
+        self, filepaths: list[Path], searchpaths: list[Path], required: bool = False
     ) -> Generator[Path, None, None]:
         """Find `filepath` in `searchpaths` and return first match."""
+        searchindex = self._searchindex
+        check = self.config.template_paths_check
         found = False
         for filepath in filepaths:
             if filepath.is_absolute():
@@ -365,7 +964,7 @@ ${helper.run(*args, **kwargs)}\
                 # relative
                 for searchpath in searchpaths:
                     joined = searchpath / filepath
-                    if joined.exists():
+                    if searchindex.exists(joined, check=check):
                         yield joined
                         found = True
         if not found and required:
@@ -407,22 +1006,293 @@ ${helper.run(*args, **kwargs)}\
             return f"{sep} {eol_comment}"
         return ""
 
-    def clean(self, filepaths: Paths):
-        """Remove Fully-Generated Files from Filepaths."""
-        for filepath in iter_files(norm_paths(filepaths)):
-            is_fully_generated = self.is_fully_generated(filepath)
+    def clean(self, filepaths: Paths, workers: int | None = None):
+        """
+        Remove Fully-Generated Files from Filepaths.
+
+        Args:
+            filepaths: Files and Directories.
+
+        Keyword Args:
+            workers: Number of Threads Reading The File Headers. Default is derived from the number of CPUs.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch in iter_batches(iter_files(norm_paths(filepaths)), CLEAN_BATCHSIZE):
+                self._clean_batch(batch, tuple(executor.map(self.is_fully_generated, batch)))
+
+    def _clean_batch(self, filepaths: list[Path], states: Iterable[bool | None]):
+        for filepath, is_fully_generated in zip(filepaths, states, strict=True):
             if is_fully_generated:
                 self._remove_file(filepath)
             elif is_fully_generated is False:
                 self._track_state(filepath, State.IDENTICAL)
 
     def is_fully_generated(self, filepath: Path) -> bool | None:
-        """Check If File Is Fully Generated."""
-        try:
-            with filepath.open("r") as file:
-                for _, line in zip(range(self.config.tag_lines), file, strict=False):
-                    if Tag.FULLY_GENERATED.value in line:
-                        return True
-            return False
-        except UnicodeDecodeError:  # binary files
-            return None
+        """Check If File Is Fully Generated. ``None`` On Binary Files."""
+        # at most tag_lines * CLEAN_LINESIZE bytes are read
+        header = bytearray()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with filepath.open("rb") as file:
+            for _ in range(self.config.tag_lines):
+                line = file.readline(CLEAN_LINESIZE)
+                if not line:
+                    break
+                try:
+                    decoder.decode(line)
+                except UnicodeDecodeError:  # binary files
+                    return None
+                header += line
+        return _FULLY_GENERATED in header
+
+    async def agen(self, template_filepaths: Paths, dest: Path | None = None, context: dict | None = None):
+        """
+        Render template file within an asyncio event loop - like :any:`Makolator.gen`.
+
+        At most ``Config.async_limit`` file operations run concurrently.
+        Reading and writing files is done by threads, while templates are rendered one after another
+        in order of request.
+
+        Args:
+            template_filepaths: Templates.
+
+        Keyword Args:
+            dest: Output File.
+            context: Key-Value Pairs pairs forwarded to the template.
+        """
+        template_filepaths = norm_paths(template_filepaths)
+        self._commondigest = None
+        semaphore, renderlock = self._get_async_locks()
+        async with semaphore:
+            if dest is None or any(path.is_dir() for path in template_filepaths):
+                async with renderlock:
+                    await asyncio.to_thread(self._gen, template_filepaths, dest, context)
+            else:
+                comment_sep = self._get_comment_sep(dest)
+                try:
+                    async with renderlock:
+                        build = await asyncio.to_thread(self._check_gen_build, template_filepaths, dest, context)
+                    if build is not None:
+                        staticcodemap = await asyncio.to_thread(read_map, dest, self.config)
+                        async with renderlock:
+                            text, recording = await asyncio.to_thread(
+                                self._render_file_cached, template_filepaths, dest, context, comment_sep, staticcodemap
+                            )
+                except BaseException:
+                    self._track_state(dest, State.FAILED)
+                    raise
+                if build is not None:
+                    await asyncio.to_thread(self._write_file, dest, text)
+                    async with renderlock:
+                        await asyncio.to_thread(self._add_build, build[0], dest, build[1], recording)
+            async with renderlock:
+                await asyncio.to_thread(self._save_deps)
+
+    async def ainplace(
+        self,
+        template_filepaths: Paths,
+        filepath: Path,
+        context: dict | None = None,
+        ignore_unknown: bool = False,
+    ):
+        """
+        Update generated code within `filename` within an asyncio event loop - like :any:`Makolator.inplace`.
+
+        See :any:`Makolator.agen` for concurrency.
+
+        Args:
+            template_filepaths: Templates.
+            filepath: File to update.
+
+        Keyword Args:
+            context: Key-Value Pairs pairs forwarded to the template.
+            ignore_unknown: Ignore unknown inplace markers, instead of raising an error.
+        """
+        template_filepaths = norm_paths(template_filepaths)
+        self._commondigest = None
+        semaphore, renderlock = self._get_async_locks()
+        async with semaphore:
+            if self.config.create and not filepath.exists():
+                async with renderlock:
+                    await asyncio.to_thread(self._inplace, template_filepaths, filepath, context, ignore_unknown)
+            elif not await asyncio.to_thread(self._is_markerless, filepath):
+                try:
+                    async with renderlock:
+                        build = await asyncio.to_thread(
+                            self._check_inplace_build, template_filepaths, filepath, context, ignore_unknown
+                        )
+                    if build is not None:
+                        lines = await asyncio.to_thread(read_lines, filepath)
+                        staticcodemap = await asyncio.to_thread(read_map, filepath, self.config)
+                        async with renderlock:
+                            text, recording = await asyncio.to_thread(
+                                self._render_inplace_cached,
+                                template_filepaths,
+                                filepath,
+                                context,
+                                ignore_unknown,
+                                lines,
+                                staticcodemap,
+                            )
+                except BaseException:
+                    self._track_state(filepath, State.FAILED)
+                    raise
+                if build is not None:
+                    await asyncio.to_thread(self._write_file, filepath, text, existing=Existing.KEEP_TIMESTAMP)
+                    async with renderlock:
+                        await asyncio.to_thread(self._add_build, build[0], filepath, build[1], recording, True)
+            async with renderlock:
+                await asyncio.to_thread(self._save_deps)
+
+    async def aclean(self, filepaths: Paths):
+        """
+        Remove Fully-Generated Files from Filepaths within an asyncio event loop - like :any:`Makolator.clean`.
+
+        At most ``Config.async_limit`` file headers are read concurrently.
+
+        Args:
+            filepaths: Files and Directories.
+        """
+        semaphore, _ = self._get_async_locks()
+
+        async def check(filepath: Path) -> bool | None:
+            async with semaphore:
+                return await asyncio.to_thread(self.is_fully_generated, filepath)
+
+        filepaths = await asyncio.to_thread(lambda: list(iter_files(norm_paths(filepaths))))
+        states = await asyncio.gather(*(check(filepath) for filepath in filepaths))
+        await asyncio.to_thread(self._clean_batch, filepaths, states)
+
+    def _get_async_locks(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        asynclocks = self._asynclocks
+        if asynclocks is None or asynclocks[0] is not loop:
+            asynclocks = self._asynclocks = (loop, asyncio.Semaphore(self.config.async_limit), asyncio.Lock())
+        return asynclocks[1], asynclocks[2]
+
+    def _render_file_cached(
+        self,
+        template_filepaths: list[Path],
+        dest: Path,
+        context: dict | None,
+        comment_sep: str,
+        staticcodemap: StaticCodeMap,
+    ) -> tuple[str, _Recording]:
+        render = partial(self._render_file, template_filepaths, dest, context, comment_sep, staticcodemap)
+        with self._record(dest) as recording:
+            if not self.config.render_cache:
+                return render(), recording
+            tplfilepaths, lookup = self._create_template_lookup(
+                template_filepaths, self.config.template_paths, required=True
+            )
+            template = next(self._create_templates(tplfilepaths, lookup))
+            text = self._render_cached(lookup, [template], dest, render, "gen", context or {}, staticcodemap)
+        return text, recording
+
+    def _render_inplace_cached(
+        self,
+        template_filepaths: list[Path],
+        filepath: Path,
+        context: dict | None,
+        ignore_unknown: bool,
+        lines: list[str],
+        staticcodemap: StaticCodeMap,
+    ) -> tuple[str, _Recording]:
+        render = partial(
+            self._render_inplace, template_filepaths, filepath, context, ignore_unknown, lines, staticcodemap
+        )
+        with self._record(filepath) as recording:
+            if not self.config.render_cache:
+                return render(), recording
+            _, lookup, templates, _ = self._prepare_inplace(template_filepaths, filepath, ignore_unknown)
+            # lines contain the inline templates and the static code
+            text = self._render_cached(
+                lookup, templates, filepath, render, "inplace", context or {}, ignore_unknown, lines
+            )
+        return text, recording
+
+    def _render_file(
+        self,
+        template_filepaths: list[Path],
+        dest: Path,
+        context: dict | None,
+        comment_sep: str,
+        staticcodemap: StaticCodeMap,
+    ) -> str:
+        tplfilepaths, lookup = self._create_template_lookup(
+            template_filepaths, self.config.template_paths, required=True
+        )
+        template = next(self._create_templates(tplfilepaths, lookup))  # Load template
+        LOGGER.info("gen(%r, %r)", template.filename, str(dest))
+        self._add_deps(lookup, [template], dest)
+        buffer = io.StringIO(newline="")
+        with read(dest, comment_sep, self.config, staticcodemap=staticcodemap) as staticcode:
+            self._render(template, buffer, dest, context or {}, staticcode, comment_sep)
+        return buffer.getvalue()
+
+    def _render_inplace(
+        self,
+        template_filepaths: list[Path],
+        filepath: Path,
+        context: dict | None,
+        ignore_unknown: bool,
+        lines: list[str],
+        staticcodemap: StaticCodeMap,
+    ) -> str:
+        tplfilepaths, lookup, templates, inplace = self._prepare_inplace(template_filepaths, filepath, ignore_unknown)
+        LOGGER.info("inplace(%r, %r)", str(tplfilepaths[0]) if tplfilepaths else None, str(filepath))
+        comment_sep = self._get_comment_sep(filepath)
+        buffer = io.StringIO(newline="")
+        with read(filepath, comment_sep, self.config, staticcodemap=staticcodemap) as staticcode:
+            rendercontext = self._get_render_context(filepath, context or {}, staticcode, comment_sep, inplace=True)
+            inplace.render(lookup, filepath, buffer, rendercontext, lines=lines)
+        self._add_deps(lookup, templates, filepath)
+        return buffer.getvalue()
+
+    def _write_file(self, filepath: Path, text: str, **kwargs):
+        # Mako takes care about proper newline handling - no universal newline mode
+        with self.open_outputfile(filepath, newline="", **kwargs) as output:
+            output.write(text)
+
+
+_WORKER: Makolator | None = None
+
+
+def _init_worker(config: Config, datamodel: Datamodel, info: Info):
+    global _WORKER  # noqa: PLW0603
+    _WORKER = Makolator(config=config, datamodel=datamodel, info=info)
+    if config.depgraph or config.buildstate:
+        # Dependencies are merged into the graph of the parent
+        _WORKER._depgraph = DepGraph()
+
+
+def _gen_worker(
+    template_filepaths: list[Path], dest: Path | None, context: dict | None
+) -> tuple[Tracker, DepGraph | None, None]:
+    mklt = _WORKER
+    assert mklt is not None
+    mklt._gen(template_filepaths, dest, context)
+    return (*_pop_worker_result(mklt), None)
+
+
+def _gen_recursive_worker(tplpath: Path, outpath: Path, context: dict | None) -> tuple[Tracker, DepGraph | None, None]:
+    mklt = _WORKER
+    assert mklt is not None
+    mklt._gen_recursive_file(tplpath, outpath, context)
+    return (*_pop_worker_result(mklt), None)
+
+
+def _inplace_worker(
+    template_filepaths: list[Path], filepath: Path, context: dict | None, ignore_unknown: bool
+) -> tuple[Tracker, DepGraph | None, Exception | None]:
+    mklt = _WORKER
+    assert mklt is not None
+    error = mklt._try_inplace(template_filepaths, filepath, context, ignore_unknown)
+    return (*_pop_worker_result(mklt), error)
+
+
+def _pop_worker_result(mklt: Makolator) -> tuple[Tracker, DepGraph | None]:
+    tracker = Tracker()
+    tracker.update(mklt.tracker)
+    mklt.tracker.clear()
+    depgraph = mklt._depgraph
+    return tracker, depgraph.pop_outputs() if depgraph is not None else None
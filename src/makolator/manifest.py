@@ -0,0 +1,236 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Job Manifest.
+
+Many ``gen``, ``inplace`` and ``clean`` jobs described by one TOML or JSON file::
+
+    template_paths = ["templates"]
+    cache_path = ".cache"
+
+    [[jobs]]
+    cmd = "gen"
+    templates = ["regs.sv.mako"]
+    output = "rtl/regs.sv"
+    context = { width = 32 }
+
+    [[jobs]]
+    cmd = "inplace"
+    templates = ["inplace.sv.mako"]
+    files = ["rtl/**/*.sv"]
+    ignore_unknown = true
+
+    [[jobs]]
+    cmd = "clean"
+    paths = ["gen"]
+
+Files, outputs and directories are relative to the manifest.
+Templates are searched within ``template_paths`` and the directory of the manifest.
+"""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+from outputfile import Existing
+
+from ._util import expand_paths
+from .config import CacheMode, Config
+from .exceptions import MakolatorError
+from .makolator import Makolator
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    tomllib = None  # type: ignore[assignment]
+
+_CONFIG_PATHS = ("template_paths", "cache_path")
+_CONFIG_KEYS = (
+    *_CONFIG_PATHS,
+    "cache_mode",
+    "existing",
+    "create",
+    "marker_fill",
+    "marker_linelength",
+    "inplace_eol_comment",
+    "tag_lines",
+    "depgraph",
+    "depfile",
+    "buildstate",
+    "render_cache",
+    "remote_cache",
+)
+_JOB_KEYS = {
+    "gen": ("templates", "output", "context"),
+    "inplace": ("templates", "files", "context", "ignore_unknown"),
+    "clean": ("paths",),
+}
+
+
+@define
+class ManifestJob:
+    """Job Within Manifest."""
+
+    cmd: str
+    """Command: ``gen``, ``inplace`` or ``clean``."""
+
+    templates: list[Path] = field(factory=list)
+    """Templates."""
+
+    paths: list[Path] = field(factory=list)
+    """Output File On ``gen``, Updated Files On ``inplace`` and Cleaned Paths On ``clean``."""
+
+    context: dict[str, Any] = field(factory=dict)
+    """Key-Value Pairs pairs forwarded to the template."""
+
+    ignore_unknown: bool = False
+    """Ignore unknown inplace markers."""
+
+    @staticmethod
+    def from_dict(data: dict[str, Any], basepath: Path, source: str) -> "ManifestJob":
+        """
+        Create Job From ``data``.
+
+        Args:
+            data: Job Description.
+            basepath: Files, outputs and directories are relative to this directory.
+            source: Origin of ``data`` used within error messages.
+        """
+        data = dict(data)
+        cmd = data.pop("cmd", None)
+        try:
+            keys = _JOB_KEYS[cmd]
+        except KeyError:
+            raise MakolatorError(f"'{source}': unknown cmd {cmd!r}. Use one of {list(_JOB_KEYS)}.") from None
+        unknown = sorted(set(data) - set(keys))
+        if unknown:
+            raise MakolatorError(f"'{source}': unknown {cmd} settings {unknown}.")
+        templates = [Path(template) for template in data.get("templates", [])]
+        if cmd == "gen":
+            if "output" not in data:
+                raise MakolatorError(f"'{source}': gen job without output.")
+            paths = [basepath / data["output"]]
+        elif cmd == "inplace":
+            paths = list(expand_paths(str(basepath / path) for path in data.get("files", [])))
+        else:
+            paths = [basepath / path for path in data.get("paths", [])]
+        return ManifestJob(
+            cmd=cmd,
+            templates=templates,
+            paths=paths,
+            context=data.get("context", {}),
+            ignore_unknown=data.get("ignore_unknown", False),
+        )
+
+
+@define
+class Manifest:
+    """
+    Job Manifest.
+
+    Runs all jobs within one process. Consecutive ``gen`` jobs are rendered in parallel by
+    :any:`Makolator.gen_many`, ``inplace`` jobs by :any:`Makolator.inplace_jobs`.
+    All of them share the template lookup and ``cache_path``.
+    """
+
+    config: Config = field(factory=Config)
+    """Configuration."""
+
+    jobs: list[ManifestJob] = field(factory=list)
+    """Jobs In Order Of Execution."""
+
+    @staticmethod
+    def load(filepath: Path) -> "Manifest":
+        """Load Manifest From TOML Or JSON ``filepath``."""
+        try:
+            if filepath.suffix == ".toml":
+                if tomllib is None:  # pragma: no cover
+                    raise MakolatorError(f"'{filepath!s}': TOML manifests require python 3.11 or newer.")
+                data = tomllib.loads(filepath.read_text(encoding="utf-8"))
+            else:
+                data = json.loads(filepath.read_text(encoding="utf-8"))
+        except ValueError as exc:
+            raise MakolatorError(f"'{filepath!s}': {exc}") from exc
+        if not isinstance(data, dict):
+            raise MakolatorError(f"'{filepath!s}': manifest must be a table/object.")
+        basepath = filepath.parent
+        jobs = data.pop("jobs", [])
+        config = _create_config(filepath, basepath, data)
+        return Manifest(config=config, jobs=[ManifestJob.from_dict(job, basepath, str(filepath)) for job in jobs])
+
+    def run(self, mklt: Makolator, workers: int | None = None):
+        """
+        Run All Jobs.
+
+        Args:
+            mklt: Makolator, usually created with ``config``.
+
+        Keyword Args:
+            workers: Number of Worker Processes. ``None`` is the number of CPUs.
+        """
+        for cmd, jobs in self._iter_groups():
+            if cmd == "gen":
+                mklt.gen_many([(job.templates, job.paths[0], job.context) for job in jobs], workers=workers)
+            elif cmd == "inplace":
+                mklt.inplace_jobs(
+                    [
+                        (job.templates, filepath, job.context, job.ignore_unknown)
+                        for job in jobs
+                        for filepath in job.paths
+                    ],
+                    workers=workers,
+                )
+            else:
+                for job in jobs:
+                    mklt.clean(job.paths)
+
+    def _iter_groups(self) -> Iterator[tuple[str, list[ManifestJob]]]:
+        group: list[ManifestJob] = []
+        for job in self.jobs:
+            if group and group[0].cmd != job.cmd:
+                yield group[0].cmd, group
+                group = []
+            group.append(job)
+        if group:
+            yield group[0].cmd, group
+
+
+def _create_config(filepath: Path, basepath: Path, data: dict[str, Any]) -> Config:
+    unknown = sorted(set(data) - set(_CONFIG_KEYS))
+    if unknown:
+        raise MakolatorError(f"'{filepath!s}': unknown settings {unknown}.")
+    kwargs = dict(data)
+    kwargs["template_paths"] = [basepath / path for path in kwargs.get("template_paths", [])] + [basepath]
+    if "cache_path" in kwargs:
+        kwargs["cache_path"] = basepath / kwargs["cache_path"]
+    try:
+        if "cache_mode" in kwargs:
+            kwargs["cache_mode"] = CacheMode(kwargs["cache_mode"])
+        if "existing" in kwargs:
+            kwargs["existing"] = Existing(kwargs["existing"])
+    except ValueError as exc:
+        raise MakolatorError(f"'{filepath!s}': {exc}") from exc
+    return Config(**kwargs)
@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Process-Wide Registry Of Compiled Templates."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+
+import mako
+from attrs import define, field
+from mako.lookup import TemplateLookup
+from mako.template import ModuleTemplate, Template, _get_module_info_from_callable
+
+from ._util import get_version
+from .cachestat import CacheStat
+
+_COMPILE_ARGS = (
+    "input_encoding",
+    "strict_undefined",
+    "default_filters",
+    "buffer_filters",
+    "imports",
+    "future_imports",
+    "enable_loop",
+    "preprocessor",
+)
+
+
+@define
+class RegistryEntry:
+    """Registry Entry."""
+
+    module: ModuleType
+    """Compiled Template Module."""
+
+    module_filename: str | None
+    """Module File If Compiled to ``cache_path``."""
+
+    module_source: str | None
+    """Module Source If Compiled In Memory."""
+
+
+@define
+class TemplateRegistry:
+    """
+    Process-Wide Registry Of Compiled Templates.
+
+    Compiled templates are identified by their source, their uri and the lookup settings
+    and are shared between all :any:`Makolator` instances with ``Config.template_registry`` set.
+    The least recently used templates are dropped if the registry exceeds ``max_entries``.
+    """
+
+    max_entries: int = 1024
+    """Maximum Number Of Compiled Templates."""
+
+    cachestat: CacheStat = field(factory=CacheStat)
+    """Cache Statistics."""
+
+    _entries: OrderedDict[str, RegistryEntry] = field(factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop All Compiled Templates."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_template(self, lookup: TemplateLookup, filename: str, uri: str) -> Template:
+        """Return :any:`Template` For ``filename`` Bound To ``lookup`` - Compile It Only If Needed."""
+        template_args = lookup.template_args
+        key = self.get_key(uri, Path(filename).read_bytes(), template_args)
+        entry = self._get(key)
+        if entry is None:
+            self.cachestat.miss("registry")
+            template = self._compile(lookup, filename, uri)
+            info = _get_module_info_from_callable(template.callable_)
+            self._put(key, RegistryEntry(template.module, info.module_filename, info.module_source))
+            return template
+        self.cachestat.hit("registry")
+        return ModuleTemplate(
+            entry.module,
+            module_filename=entry.module_filename,
+            module_source=entry.module_source,
+            template_filename=filename,
+            lookup=lookup,
+            output_encoding=template_args.get("output_encoding"),
+        )
+
+    @staticmethod
+    def get_key(uri: str, source: bytes, template_args: dict) -> str:
+        """Registry Key Of Template With ``uri``, ``source`` and ``template_args``."""
+        hash_ = hashlib.sha256()
+        hash_.update(f"{mako.__version__}\0{get_version()}\0{uri}\0".encode())
+        for name in _COMPILE_ARGS:
+            hash_.update(f"{name}={template_args.get(name)!r}\0".encode())
+        hash_.update(source)
+        return hash_.hexdigest()
+
+    def _get(self, key: str) -> RegistryEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: str, entry: RegistryEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _compile(lookup: TemplateLookup, filename: str, uri: str) -> Template:
+        modulename_callable = lookup.modulename_callable
+        if modulename_callable is not None:
+            module_filename = modulename_callable(filename, uri)
+            return Template(
+                uri=uri, filename=filename, lookup=lookup, module_filename=module_filename, **lookup.template_args
+            )
+        text = Path(filename).read_text(encoding=lookup.template_args.get("input_encoding") or "utf-8")
+        return Template(text=text, uri=uri, filename=filename, lookup=lookup, **lookup.template_args)
+
+
+TEMPLATE_REGISTRY = TemplateRegistry()
+"""The Process-Wide Template Registry."""
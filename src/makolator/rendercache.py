@@ -0,0 +1,90 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Content Addressed Render Output Cache.
+
+Rendered outputs are stored by a digest of all rendering inputs.
+Workspaces sharing the cache directory get outputs without rendering.
+"""
+
+import json
+
+from attrs import define
+
+from ._util import LOGGER
+from .cachebackend import CacheBackend
+
+
+@define
+class RenderEntry:
+    """Cached Rendered Output."""
+
+    deps: dict[str, str]
+    """Content Digests Of Files Loaded Or Registered While Rendering, Not Covered By The Key."""
+
+    text: str
+    """Rendered Output."""
+
+
+@define
+class RenderCache:
+    """
+    Content Addressed Render Output Cache Within A :any:`CacheBackend`.
+
+        >>> from pathlib import Path
+        >>> from makolator.cachebackend import FileBackend
+        >>> cache = RenderCache(FileBackend(Path("cache")))
+        >>> cache.get("0123abcd") is None
+        True
+        >>> cache.put("0123abcd", RenderEntry({}, "text"))
+        >>> cache.get("0123abcd")
+        RenderEntry(deps={}, text='text')
+        >>> Path("cache/render/01/0123abcd.json").exists()
+        True
+    """
+
+    backend: CacheBackend
+    """Storage."""
+
+    def get(self, key: str) -> RenderEntry | None:
+        """Return Entry Stored For ``key`` Or ``None``."""
+        entrykey = self._get_key(key)
+        data = self.backend.get(entrykey)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+            return RenderEntry(deps=entry["deps"], text=entry["text"])
+        except (ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring broken render cache entry '%s': %r", entrykey, exc)
+        return None
+
+    def put(self, key: str, entry: RenderEntry) -> None:
+        """Store ``entry`` For ``key``."""
+        data = json.dumps({"deps": entry.deps, "text": entry.text})
+        self.backend.put(self._get_key(key), data.encode("utf-8"))
+
+    @staticmethod
+    def _get_key(key: str) -> str:
+        return f"render/{key[:2]}/{key}.json"
@@ -0,0 +1,178 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Generation Server.
+
+Keeps a :any:`Makolator` - with its compiled templates and datamodel - alive and serves
+``gen``, ``inplace`` and ``clean`` jobs via a local UNIX socket.
+
+Every request and response is one line of JSON. Requests are jobs as described by :any:`Manifest`,
+with an optional ``cwd`` for relative paths. Templates are searched within the ``template_paths``
+of the server and ``cwd``::
+
+    {"cmd": "gen", "templates": ["test.txt.mako"], "output": "test.txt", "cwd": "/path/to/project"}
+
+Responses report the state of all touched files::
+
+    {"ok": true, "files": [["/path/to/project/test.txt", "CREATED."]], "stat": "1 files. 1 CREATED."}
+
+Any client speaking this protocol works, i.e. ``socat - UNIX-CONNECT:makolator.sock``.
+``{"cmd": "stat"}`` reports cache statistics and ``{"cmd": "shutdown"}`` stops the server.
+"""
+
+import json
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+from uniquer import uniquelist
+
+from ._util import LOGGER
+from .exceptions import MakolatorError
+from .makolator import Makolator
+from .manifest import Manifest, ManifestJob
+
+
+@define
+class Server:
+    """
+    Generation Server.
+
+    Jobs are processed one after another by ``mklt``.
+    """
+
+    mklt: Makolator
+    """Makolator Processing All Jobs."""
+
+    path: Path
+    """UNIX Socket."""
+
+    workers: int | None = 1
+    """Number of Worker Processes Per Job."""
+
+    requests: int = field(default=0, init=False)
+    """Number of Processed Requests."""
+
+    _stop: bool = field(default=False, init=False)
+
+    def serve(self, timeout: float = 0.5):
+        """
+        Serve Until Shutdown Request.
+
+        Keyword Args:
+            timeout: Interval in seconds to check for shutdown.
+        """
+        if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+            raise MakolatorError("UNIX sockets are not supported on this platform.")
+        path = self.path
+        _remove_stale_socket(path)
+        self.mklt.config.track = True
+        with _UnixServer(str(path), _Handler) as server:
+            server.owner = self
+            server.timeout = timeout
+            LOGGER.info("serve(%r)", str(path))
+            try:
+                while not self._stop:
+                    server.handle_request()
+            finally:
+                path.unlink(missing_ok=True)
+
+    def process(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Process Request ``data`` And Return Response."""
+        self.requests += 1
+        cmd = data.get("cmd")
+        if cmd == "shutdown":
+            self._stop = True
+            return {"ok": True}
+        if cmd == "stat":
+            return {"ok": True, "requests": self.requests, "stat": self.mklt.cachestat.stat}
+        mklt = self.mklt
+        config = mklt.config
+        template_paths = config.template_paths
+        tracker = mklt.tracker
+        tracker.clear()
+        # templates may have been added or removed since the last request
+        mklt._searchindex.clear()
+        response: dict[str, Any] = {"ok": True}
+        try:
+            data = dict(data)
+            basepath = Path(data.pop("cwd", "."))
+            job = ManifestJob.from_dict(data, basepath, "request")
+            config.template_paths = uniquelist([*template_paths, basepath])
+            Manifest(config=config, jobs=[job]).run(mklt, workers=self.workers)
+        except Exception as exc:
+            # template errors must not break the connection
+            LOGGER.warning("request failed: %r", exc)
+            response = {"ok": False, "error": str(exc)}
+        finally:
+            config.template_paths = template_paths
+        response["files"] = [[str(filepath), state.value] for filepath, state in tracker.items]
+        response["stat"] = tracker.stat
+        return response
+
+
+def request(path: Path, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Send Request ``data`` To Server Listening On ``path`` And Return Response.
+
+    Relative paths are resolved against the current working directory.
+    """
+    data = {"cwd": str(Path.cwd()), **data}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:  # type: ignore[attr-defined]
+        sock.connect(str(path))
+        sock.sendall(json.dumps(data).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as file:
+            return json.loads(file.readline())
+
+
+def _remove_stale_socket(path: Path):
+    if path.exists():
+        try:
+            request(path, {"cmd": "stat"})
+        except OSError:
+            path.unlink()
+        else:
+            raise MakolatorError(f"Server already running on '{path!s}'.")
+
+
+class _UnixServer(getattr(socketserver, "UnixStreamServer", socketserver.BaseServer)):  # type: ignore[misc]
+    owner: Server
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _UnixServer
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                data = json.loads(line)
+                if not isinstance(data, dict):
+                    raise ValueError("request must be an object")
+            except ValueError as exc:
+                response = {"ok": False, "error": f"invalid request: {exc}"}
+            else:
+                response = self.server.owner.process(data)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
@@ -62,11 +62,21 @@ class Tracker:
         self._items.append((path, state))
         self._stat[state] += 1
 
+    def update(self, other: "Tracker") -> None:
+        """Add Information From ``other``."""
+        for path, state in other.items:
+            self.add(path, state)
+
     def clear(self):
         """Clear Information."""
         self._items.clear()
         self._stat = dict(_STAT_INIT)
 
+    @property
+    def items(self) -> tuple[tuple[Path, FileState], ...]:
+        """Files And Their States In Order Of Processing."""
+        return tuple(self._items)
+
     @property
     def total(self):
         """Total Number of Files."""
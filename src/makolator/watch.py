@@ -0,0 +1,153 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""
+Watch Mode.
+
+Re-runs :any:`Manifest` jobs as soon as their templates, updated files or inputs change.
+Changes are detected by polling modification time and size - no external service required.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from attrs import define, field
+
+from ._util import LOGGER, iter_files
+from .depgraph import DepGraph
+from .makolator import Makolator
+from .manifest import Manifest, ManifestJob
+
+_Stat = tuple[int, int] | None
+
+
+@define
+class Watcher:
+    """
+    Manifest Watcher.
+
+    All jobs run initially. Afterwards only jobs whose templates (including inherited, included
+    and imported ones) or inplace updated files changed are run again.
+    Templates appearing within the template search paths are detected, too.
+    A change of any of the ``inputs`` re-runs all jobs.
+    Compiled templates stay loaded between the runs.
+    """
+
+    mklt: Makolator
+    """Makolator Processing All Jobs."""
+
+    manifest: Manifest
+    """Jobs."""
+
+    inputs: list[Path] = field(factory=list)
+    """Additional Input Files, i.e. Datamodel Sources."""
+
+    interval: float = 1.0
+    """Polling Interval In Seconds."""
+
+    workers: int | None = 1
+    """Number of Worker Processes."""
+
+    _deps: list[set[str]] = field(factory=list, init=False)
+    _stats: dict[str, _Stat] = field(factory=dict, init=False)
+
+    def run(self, iterations: int | None = None):
+        """
+        Run All Jobs And Re-Run Them On Changes Until Interrupted.
+
+        Keyword Args:
+            iterations: Stop After Number Of Polls.
+        """
+        self.start()
+        try:
+            while iterations is None or iterations > 0:
+                time.sleep(self.interval)
+                self.poll()
+                if iterations is not None:
+                    iterations -= 1
+        except KeyboardInterrupt:
+            pass
+
+    def start(self):
+        """Run All Jobs."""
+        self.mklt.config.depgraph = True
+        self._deps = [set() for _ in self.manifest.jobs]
+        self._run(list(range(len(self.manifest.jobs))))
+
+    def poll(self) -> list[ManifestJob]:
+        """Re-Run Jobs Affected By Changes Since The Last Run And Return Them."""
+        changed = {filename for filename, stat in self._stats.items() if _get_stat(filename) != stat}
+        if not changed:
+            return []
+        LOGGER.info("changed: %s", ", ".join(sorted(changed)))
+        if changed.intersection(str(path) for path in self.inputs):
+            idxs = list(range(len(self.manifest.jobs)))
+        else:
+            idxs = [idx for idx, deps in enumerate(self._deps) if deps & changed]
+        self._run(idxs)
+        return [self.manifest.jobs[idx] for idx in idxs]
+
+    def _run(self, idxs: list[int]):
+        jobs = self.manifest.jobs
+        mklt = self.mklt
+        # templates may have been added or removed since the last run
+        mklt._searchindex.clear()
+        try:
+            Manifest(config=mklt.config, jobs=[jobs[idx] for idx in idxs]).run(mklt, workers=self.workers)
+        except Exception as exc:  # keep watching
+            LOGGER.error("%s", exc)
+        depgraph = mklt.depgraph
+        searchpaths = mklt.config.template_paths
+        for idx in idxs:
+            self._deps[idx] |= _get_deps(jobs[idx], depgraph, searchpaths)
+        filenames = set().union(*self._deps, (str(path) for path in self.inputs))
+        self._stats = {filename: _get_stat(filename) for filename in sorted(filenames)}
+
+
+def _get_deps(job: ManifestJob, depgraph: DepGraph, searchpaths: list[Path]) -> set[str]:
+    deps: set[str] = set()
+    if job.cmd == "inplace":
+        # inplace files host MAKO TEMPLATE blocks
+        deps.update(str(path) for path in job.paths)
+    for template in job.templates:
+        if not template.is_absolute():
+            # all candidates, as a template may appear in front of the used one
+            deps.update(str(searchpath / template) for searchpath in searchpaths)
+        if template.is_dir():
+            # recursive generation
+            deps.update(str(path) for path in iter_files([template]))
+    for path in job.paths:
+        prefix = f"{path!s}{os.sep}"
+        for output, filenames in depgraph.outputs.items():
+            if output == str(path) or output.startswith(prefix):
+                deps.update(depgraph.get_closure(filenames))
+    return deps
+
+
+def _get_stat(filename: str) -> _Stat:
+    try:
+        stat = os.stat(filename)  # noqa: PTH116
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,322 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Build State Testing."""
+
+import asyncio
+from pathlib import Path
+
+from pytest import fixture
+
+from makolator import BuildState, CacheMode, Config, Makolator
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+@fixture
+def renders(monkeypatch):
+    """Rendered Outputs."""
+    renders = []
+    render = Makolator._render
+
+    def _render(self, template, output, dest, *args):
+        renders.append(dest.name)
+        render(self, template, output, dest, *args)
+
+    monkeypatch.setattr(Makolator, "_render", _render)
+    return renders
+
+
+def _gen(config, out_path, **kwargs):
+    mklt = Makolator(config=config)
+    mklt.config.track = True
+    for name, value in kwargs.items():
+        setattr(mklt.datamodel, name, value)
+    mklt.gen([Path("impl.txt.mako")], out_path / "impl.txt", context={"mode": "a"})
+    return mklt.tracker.stat
+
+
+def test_buildstate_gen(tmp_path, tpl_path, renders, update_file):
+    """Unchanged Outputs Are Not Rendered."""
+    out_path = tmp_path / "out"
+    config = Config(
+        template_paths=[tpl_path], cache_path=tmp_path / "cache", cache_mode=CacheMode.CONTENT, buildstate=True
+    )
+
+    assert _gen(config, out_path) == "1 files. 1 CREATED."
+    assert _gen(config, out_path) == "1 files. 1 identical. untouched."
+    assert renders == ["impl.txt"]
+
+    # modified output
+    (out_path / "impl.txt").write_text("modified")
+    assert _gen(config, out_path) == "1 files. 1 UPDATED."
+    assert _gen(config, out_path) == "1 files. 1 identical. untouched."
+    assert len(renders) == 2
+
+    # modified base template
+    update_file(tpl_path / "base.txt.mako", "modified\n", append=True)
+    assert _gen(config, out_path) == "1 files. 1 UPDATED."
+    assert len(renders) == 3
+
+    # modified datamodel
+    assert _gen(config, out_path, name="other") == "1 files. 1 identical. untouched."
+    assert len(renders) == 4
+    assert _gen(config, out_path, name="other") == "1 files. 1 identical. untouched."
+    assert len(renders) == 4
+
+    # verbose output does not matter
+    config.verbose = True
+    assert _gen(config, out_path, name="other") == "1 files. 1 identical. untouched."
+    assert len(renders) == 4
+
+
+def test_buildstate_disabled(tmp_path, tpl_path, renders):
+    """Build State Is Only Used With Config.buildstate."""
+    out_path = tmp_path / "out"
+    config = Config(template_paths=[tpl_path], cache_path=tmp_path / "cache")
+    assert _gen(config, out_path) == "1 files. 1 CREATED."
+    assert _gen(config, out_path) == "1 files. 1 identical. untouched."
+    assert len(renders) == 2
+    assert not (tmp_path / "cache" / "buildstate.sqlite").exists()
+
+
+def test_buildstate_gen_many(tmp_path, tpl_path):
+    """Workers Share The Build State."""
+    out_path = tmp_path / "out"
+    config = Config(
+        template_paths=[tpl_path],
+        cache_path=tmp_path / "cache",
+        cache_mode=CacheMode.CONTENT,
+        buildstate=True,
+        track=True,
+    )
+    jobs = [([Path("impl.txt.mako")], out_path / f"impl{idx}.txt", {"idx": idx}) for idx in range(3)]
+    mklt = Makolator(config=config)
+    mklt.gen_many(jobs, workers=2)
+    assert mklt.tracker.stat == "3 files. 3 CREATED."
+
+    mklt = Makolator(config=config)
+    buildstate = mklt.buildstate
+    _, lookup = mklt._create_template_lookup([Path("impl.txt.mako")], config.template_paths, required=True)
+    digest = mklt._get_build_digest("gen", lookup.directories, str(tpl_path / "impl.txt.mako"), {"idx": 1})
+    assert buildstate.is_unchanged(out_path / "impl1.txt", digest)
+    assert not buildstate.is_unchanged(out_path / "impl2.txt", digest)
+    buildstate.remove(out_path / "impl1.txt")
+    assert not buildstate.is_unchanged(out_path / "impl1.txt", digest)
+
+
+def test_buildstate_inplace(tmp_path, update_file):
+    """Inplace Files Depend On Templates Referred By Inline Templates."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    (tpl_path / "util.txt.mako").write_text('<%def name="util()">util</%def>\n')
+    (tpl_path / "main.txt.mako").write_text('<%def name="main()">main</%def>\n')
+    filepath = tmp_path / "file.txt"
+    filepath.write_text(
+        """\
+// MAKO TEMPLATE BEGIN
+// <%namespace name="u" file="util.txt.mako"/>
+// <%def name="inline()">${u.util()}</%def>
+// MAKO TEMPLATE END
+// GENERATE INPLACE BEGIN inline()
+// GENERATE INPLACE END inline
+// GENERATE INPLACE BEGIN main()
+// GENERATE INPLACE END main
+"""
+    )
+    config = Config(
+        template_paths=[tpl_path],
+        cache_path=tmp_path / "cache",
+        cache_mode=CacheMode.CONTENT,
+        buildstate=True,
+        track=True,
+    )
+
+    def inplace():
+        mklt = Makolator(config=config)
+        mklt.inplace([Path("main.txt.mako")], filepath)
+        return mklt.tracker.stat
+
+    assert inplace() == "1 files. 1 UPDATED."
+    assert "util\n" in filepath.read_text()
+    assert inplace() == "1 files. 1 identical. untouched."
+
+    update_file(tpl_path / "util.txt.mako", '<%def name="util()">UTIL</%def>\n')
+    assert inplace() == "1 files. 1 UPDATED."
+    assert "UTIL\n" in filepath.read_text()
+
+    update_file(tpl_path / "main.txt.mako", '<%def name="main()">MAIN</%def>\n')
+    assert inplace() == "1 files. 1 UPDATED."
+    assert "MAIN\n" in filepath.read_text()
+
+
+def test_buildstate_clear(tmp_path):
+    """Clear Build State."""
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("data")
+    buildstate = BuildState(tmp_path / "buildstate.sqlite")
+    buildstate.add(filepath, "digest", [])
+    assert buildstate.is_unchanged(filepath, "digest")
+    assert not buildstate.is_unchanged(filepath, "other")
+    buildstate.clear()
+    assert not buildstate.is_unchanged(filepath, "digest")
+    buildstate.close()
+
+
+def test_buildstate_nested(tmp_path, update_file):
+    """Outputs Generating Further Outputs Are Always Rendered."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    (tpl_path / "outer.txt.mako").write_text(
+        "<%! from pathlib import Path %>"
+        '<% makolator.gen(Path("inner.txt.mako"), output_filepath.with_name("inner.txt")) %>outer\n'
+    )
+    (tpl_path / "inner.txt.mako").write_text("inner v1\n")
+    out_path = tmp_path / "out"
+    config = Config(
+        template_paths=[tpl_path],
+        cache_path=tmp_path / "cache",
+        cache_mode=CacheMode.CONTENT,
+        buildstate=True,
+        track=True,
+    )
+
+    def gen():
+        mklt = Makolator(config=config)
+        mklt.gen([Path("outer.txt.mako")], out_path / "outer.txt")
+        return mklt.tracker.stat
+
+    assert gen() == "2 files. 2 CREATED."
+    assert gen() == "2 files. 2 identical. untouched."
+
+    update_file(tpl_path / "inner.txt.mako", "inner v2\n")
+    assert gen() == "2 files. 1 UPDATED. 1 identical. untouched."
+    assert (out_path / "inner.txt").read_text() == "inner v2\n"
+
+    (out_path / "inner.txt").unlink()
+    assert gen() == "2 files. 1 identical. untouched. 1 CREATED."
+    assert (out_path / "inner.txt").read_text() == "inner v2\n"
+
+
+def test_buildstate_dynamic(tmp_path, update_file):
+    """Outputs Depend On Dynamically Included Templates."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    (tpl_path / "dyn.txt.mako").write_text("<%include file=\"${'leaf.txt.mako'}\"/>")
+    (tpl_path / "leaf.txt.mako").write_text("leaf v1\n")
+    out_path = tmp_path / "out"
+    config = Config(
+        template_paths=[tpl_path],
+        cache_path=tmp_path / "cache",
+        cache_mode=CacheMode.CONTENT,
+        buildstate=True,
+        track=True,
+    )
+
+    def gen():
+        mklt = Makolator(config=config)
+        mklt.gen([Path("dyn.txt.mako")], out_path / "dyn.txt")
+        return mklt.tracker.stat
+
+    assert gen() == "1 files. 1 CREATED."
+    assert gen() == "1 files. 1 identical. untouched."
+
+    update_file(tpl_path / "leaf.txt.mako", "leaf v2\n")
+    assert gen() == "1 files. 1 UPDATED."
+    assert (out_path / "dyn.txt").read_text() == "leaf v2\n"
+    assert gen() == "1 files. 1 identical. untouched."
+
+
+def test_buildstate_undigestable(tmp_path, tpl_path, renders):
+    """Outputs Depending On Undigestable Values Are Always Rendered."""
+    out_path = tmp_path / "out"
+    config = Config(
+        template_paths=[tpl_path], cache_path=tmp_path / "cache", cache_mode=CacheMode.CONTENT, buildstate=True
+    )
+    assert _gen(config, out_path, item=object()) == "1 files. 1 CREATED."
+    assert _gen(config, out_path, item=object()) == "1 files. 1 identical. untouched."
+    assert len(renders) == 2
+
+
+def test_buildstate_template_paths(tmp_path, renders):
+    """The Template Search Path Order Matters."""
+    for name in ("a", "b", "impl"):
+        (tmp_path / name).mkdir()
+    for name in ("a", "b"):
+        (tmp_path / name / "base.txt.mako").write_text(f"base {name}\n")
+    (tmp_path / "impl" / "impl.txt.mako").write_text('<%inherit file="base.txt.mako"/>\n')
+    out_path = tmp_path / "out"
+
+    def gen(*names):
+        config = Config(
+            template_paths=[tmp_path / name for name in ("impl", *names)],
+            cache_path=tmp_path / "cache",
+            cache_mode=CacheMode.CONTENT,
+            buildstate=True,
+            track=True,
+        )
+        mklt = Makolator(config=config)
+        mklt.gen([Path("impl.txt.mako")], out_path / "impl.txt")
+        return mklt.tracker.stat
+
+    assert gen("a", "b") == "1 files. 1 CREATED."
+    assert gen("a", "b") == "1 files. 1 identical. untouched."
+    assert gen("b", "a") == "1 files. 1 UPDATED."
+    assert (out_path / "impl.txt").read_text() == "base b\n"
+    assert len(renders) == 2
+
+
+def test_buildstate_async(tmp_path, tpl_path, renders, update_file):
+    """Asynchronous Rendering Uses The Build State Too."""
+    out_path = tmp_path / "out"
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("// GENERATE INPLACE BEGIN main()\n// GENERATE INPLACE END main\n")
+    (tmp_path / "inl").mkdir()
+    (tmp_path / "inl" / "main.txt.mako").write_text('<%def name="main()">main</%def>\n')
+    config = Config(
+        template_paths=[tpl_path, tmp_path / "inl"],
+        cache_path=tmp_path / "cache",
+        cache_mode=CacheMode.CONTENT,
+        buildstate=True,
+        track=True,
+    )
+
+    def run():
+        mklt = Makolator(config=config)
+
+        async def main():
+            await mklt.agen([Path("impl.txt.mako")], out_path / "impl.txt", context={"mode": "a"})
+            await mklt.ainplace([Path("main.txt.mako")], filepath)
+
+        asyncio.run(main())
+        return mklt.tracker.stat
+
+    assert run() == "2 files. 1 UPDATED. 1 CREATED."
+    assert run() == "2 files. 2 identical. untouched."
+    assert renders == ["impl.txt"]
+
+    update_file(tmp_path / "inl" / "main.txt.mako", '<%def name="main()">MAIN</%def>\n')
+    assert run() == "2 files. 1 UPDATED. 1 identical. untouched."
+    assert renders == ["impl.txt"]
+    assert "MAIN\n" in filepath.read_text()
@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Cache Backend Testing."""
+
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from makolator import CacheBackend, CacheMode, CacheServer, ChainBackend, Config, FileBackend, HttpBackend, Makolator
+from makolator.cli import main
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+@fixture
+def server(tmp_path):
+    """Local Cache Server."""
+    server = CacheServer(tmp_path / "server")
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_cache_backend():
+    """Cache Backends Implement The Whole Interface."""
+    with raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]
+
+    class Incomplete(CacheBackend):
+        def get(self, key):
+            return None
+
+    with raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_http_backend(server):
+    """HTTP Backend Against Local Server."""
+    backend = HttpBackend(server.url)
+    assert backend.get("render/ab/abcd.json") is None
+    assert not backend.contains("render/ab/abcd.json")
+    backend.put("render/ab/abcd.json", b"data")
+    assert backend.contains("render/ab/abcd.json")
+    assert backend.get("render/ab/abcd.json") == b"data"
+    assert (server.backend.path / "render" / "ab" / "abcd.json").read_bytes() == b"data"
+    assert backend.get("render") is None
+    assert backend.get("../outside") is None
+
+
+def test_http_backend_down(tmp_path, caplog):
+    """Unreachable Servers Are Misses."""
+    server = CacheServer(tmp_path / "server")
+    url = server.url
+    server.server_close()
+    backend = HttpBackend(url, timeout=1)
+    assert backend.is_reachable
+    assert backend.get("key") is None
+    assert not backend.is_reachable
+    assert not HttpBackend(url).is_reachable
+    assert not backend.contains("key")
+    backend.put("key", b"data")
+    assert "Cache GET 'key' failed" in caplog.text
+    assert f"Remote cache '{url}' disabled." in caplog.text
+    assert len(caplog.records) == 1
+
+
+def test_chain_backend(tmp_path):
+    """Chain Backend Copies Entries To Faster Backends."""
+    local, remote = FileBackend(tmp_path / "local"), FileBackend(tmp_path / "remote")
+    backend = ChainBackend([local, remote])
+    remote.put("a", b"A")
+    assert not local.contains("a")
+    assert backend.contains("a")
+    assert backend.get("a") == b"A"
+    assert local.get("a") == b"A"
+    backend.put("b", b"B")
+    assert local.get("b") == remote.get("b") == b"B"
+    assert backend.get("c") is None
+
+
+def test_remote_cache(tmp_path, server, monkeypatch, create_workspace):
+    """Agents Without Shared Disk Share Compiled Templates And Rendered Outputs."""
+    outputs = []
+    for agent in ("one", "two"):
+        monkeypatch.chdir(create_workspace(tmp_path / agent))
+        config = Config(
+            template_paths=[Path("tpl")],
+            cache_path=Path("cache"),
+            cache_mode=CacheMode.CONTENT,
+            render_cache=True,
+            remote_cache=server.url,
+        )
+        mklt = Makolator(config=config)
+        mklt.gen([Path("impl.txt.mako")], Path("impl.txt"))
+        outputs.append(Path("impl.txt").read_text())
+        assert list(Path("cache/render").glob("*/*.json"))
+
+    assert outputs[0] == outputs[1]
+    assert mklt.cachestat.hits["render"] == 1
+    assert mklt.cachestat.hits["remote-module"] == 2
+    assert "remote-module" not in mklt.cachestat.misses
+    assert len(list((server.backend.path / "modules").glob("*.py"))) == 2
+
+
+def test_remote_cache_corrupted(tmp_path, server, monkeypatch, create_workspace, caplog):
+    """Corrupted Remote Modules Are Not Used."""
+    config = Config(
+        template_paths=[Path("tpl")], cache_path=Path("cache"), cache_mode=CacheMode.CONTENT, remote_cache=server.url
+    )
+    monkeypatch.chdir(create_workspace(tmp_path / "one"))
+    Makolator(config=config).gen([Path("impl.txt.mako")], Path("impl.txt"))
+    for modulepath in (server.backend.path / "modules").glob("*.py"):
+        assert modulepath.read_bytes().startswith(b"# sha256:")
+        with modulepath.open("ab") as file:
+            file.write(b"raise RuntimeError()\n")
+
+    monkeypatch.chdir(create_workspace(tmp_path / "two"))
+    mklt = Makolator(config=config)
+    mklt.gen([Path("impl.txt.mako")], Path("impl.txt"))
+    assert Path("impl.txt").read_text() == (tmp_path / "one" / "impl.txt").read_text()
+    assert mklt.cachestat.misses["remote-module"] == 2
+    assert "Ignoring corrupted remote module" in caplog.text
+
+
+def test_remote_cache_compile(tmp_path, server, monkeypatch, create_workspace):
+    """Precompiled Templates Are Uploaded."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    main(["compile", "tpl", "--cache-path", "cache", "--cache-mode", "content", "--remote-cache", server.url])
+    assert len(list((server.backend.path / "modules").glob("*.py"))) == 2
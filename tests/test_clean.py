@@ -23,10 +23,11 @@
 #
 """Info Testing."""
 
-from pytest import fixture
+from pytest import fixture, mark
 
-from makolator import Makolator
+from makolator import Config, Makolator
 from makolator._util import iter_files
+from makolator.makolator import CLEAN_LINESIZE
 
 
 @fixture
@@ -148,3 +149,30 @@ def test_remove_failed(example, mklt, capsys):
 
     assert mklt.tracker.stat == "1 files. 1 FAILED."
     assert capsys.readouterr().out.splitlines() == [f"'{onefile!s}'... FAILED."]
+
+
+@mark.parametrize("workers", [1, 4])
+def test_clean_tag_lines(tmp_path, workers):
+    """Only The First ``tag_lines`` Lines Are Inspected."""
+    mklt = Makolator(config=Config(tag_lines=2, track=True))
+    for idx in range(3):
+        (tmp_path / f"file{idx}.txt").write_text("\n" * idx + "// @fully-generated\n")
+    (tmp_path / "file.bin").write_bytes(b"\xff\n// @fully-generated\n")
+
+    mklt.clean([tmp_path], workers=workers)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["file.bin", "file2.txt"]
+    assert mklt.tracker.stat == "3 files. 1 identical. untouched. 2 REMOVED."
+
+
+def test_clean_long_lines(tmp_path):
+    """Header Reads Are Limited On Files Without Newlines."""
+    mklt = Makolator(config=Config(tag_lines=2, track=True))
+    (tmp_path / "long.txt").write_text("a" * 20_000_000 + "// @fully-generated\n")
+    (tmp_path / "split.txt").write_text("ä" * CLEAN_LINESIZE + "// @fully-generated\n")
+    (tmp_path / "tag.txt").write_text("a" * (CLEAN_LINESIZE + 10) + "// @fully-generated\n")
+
+    mklt.clean([tmp_path])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["long.txt", "split.txt"]
+    assert mklt.tracker.stat == "3 files. 2 identical. untouched. 1 REMOVED."
@@ -23,6 +23,7 @@
 #
 """Datamodel Testing."""
 
+import json
 import re
 from pathlib import Path
 from shutil import copyfile
@@ -50,6 +51,18 @@ def test_gen_stat(tmp_path, capsys):
     assert_refdata(test_gen_stat, tmp_path, capsys=capsys)
 
 
+def test_gen_jobs(tmp_path, capsys):
+    """Gen Template Directory In Parallel."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    for name in ("a.txt.mako", "b.txt.mako", "c.txt"):
+        copyfile(TESTDATA / "test.txt.mako", tpl_path / name)
+    main(["gen", str(tpl_path), str(tmp_path / "gen"), "--jobs", "2", "-v"])
+    assert capsys.readouterr().out.splitlines() == [
+        f"'{tmp_path / 'gen' / name!s}'... CREATED." for name in ("a.txt", "b.txt", "c.txt")
+    ]
+
+
 def test_inplace(tmp_path, capsys):
     """Inplace."""
     filepath = tmp_path / "inplace.txt"
@@ -66,6 +79,56 @@ def test_inplace_stat(tmp_path, capsys):
     assert_refdata(test_inplace_stat, tmp_path, capsys=capsys)
 
 
+def test_inplace_many(tmp_path, capsys):
+    """Inplace On Files, Directories And Glob Patterns."""
+    for name in ("a.txt", "sub/b.txt", "glob/c.txt", "glob/d.txt", "glob/e.log"):
+        filepath = tmp_path / name
+        filepath.parent.mkdir(exist_ok=True)
+        copyfile(TESTDATA / "inplace.txt", filepath)
+    paths = [tmp_path / "a.txt", tmp_path / "sub", tmp_path / "glob" / "*.txt"]
+    main(["inplace", "-t", str(TESTDATA / "inplace.txt.mako"), *(str(path) for path in paths), "-j", "2", "-v"])
+    assert capsys.readouterr().out.splitlines() == [
+        f"'{tmp_path / name!s}'... UPDATED." for name in ("a.txt", "sub/b.txt", "glob/c.txt", "glob/d.txt")
+    ]
+
+
+def test_inplace_many_errors(tmp_path):
+    """Inplace Errors Are Collected."""
+    copyfile(TESTDATA / "inplace.txt", tmp_path / "a.txt")
+    with raises(MakolatorError, match=re.escape("1 of 2 files failed.")):
+        main(
+            [
+                "inplace",
+                "-t",
+                str(TESTDATA / "inplace.txt.mako"),
+                str(tmp_path / "missing.txt"),
+                str(tmp_path / "a.txt"),
+            ]
+        )
+
+
+def test_inplace_no_file():
+    """Inplace Without File."""
+    with raises(SystemExit):
+        main(["inplace", "-t", str(TESTDATA / "inplace.txt.mako")])
+
+
+def test_inplace_positional(tmp_path):
+    """All But The Last Positional Path Are Templates - Independent Of Their Suffix."""
+    copyfile(TESTDATA / "inplace.txt.mako", tmp_path / "tpl.txt")
+    copyfile(TESTDATA / "inplace.txt", tmp_path / "out.txt")
+    main(["inplace", str(tmp_path / "tpl.txt"), str(tmp_path / "out.txt")])
+    assert (tmp_path / "tpl.txt").read_text() == (TESTDATA / "inplace.txt.mako").read_text()
+    assert "obsolete" not in (tmp_path / "out.txt").read_text()
+
+    (tmp_path / "file.mako").write_text(
+        '<%doc>\n// MAKO TEMPLATE BEGIN\n// <%def name="foo()">foo</%def>\n// MAKO TEMPLATE END\n'
+        "// GENERATE INPLACE BEGIN foo()\n// GENERATE INPLACE END foo\n</%doc>\n"
+    )
+    main(["inplace", str(tmp_path / "file.mako")])
+    assert "foo\n// GENERATE INPLACE END foo" in (tmp_path / "file.mako").read_text()
+
+
 def test_inplace_missing(tmp_path):
     """Inplace File Not Found."""
     with raises(FileNotFoundError):
@@ -88,3 +151,57 @@ def test_inplace_create(tmp_path, caplog):
     """Inplace With Create."""
     main(["inplace", "--create", str(TESTDATA / "inplace-create.txt.mako"), str(tmp_path / "inplace.txt")])
     assert_refdata(test_inplace_create, tmp_path, caplog=caplog)
+
+
+def test_run(tmp_path, capsys):
+    """Run Manifest."""
+    manifest = {
+        "template_paths": [str(TESTDATA)],
+        "jobs": [
+            {"cmd": "gen", "templates": ["test.txt.mako"], "output": "test1.txt"},
+            {"cmd": "gen", "templates": ["test.txt.mako"], "output": "test2.txt"},
+        ],
+    }
+    (tmp_path / "jobs.json").write_text(json.dumps(manifest))
+    main(["run", str(tmp_path / "jobs.json"), "-j", "2", "--stat"])
+    assert capsys.readouterr().out.splitlines()[-1] == "2 files. 2 CREATED."
+    assert (tmp_path / "test1.txt").read_text() == (tmp_path / "test2.txt").read_text()
+
+
+def test_compile(tmp_path, capsys):
+    """Compile."""
+    cache_path = tmp_path / "cache"
+    main(["compile", str(TESTDATA), "--cache-path", str(cache_path), "--cache-mode", "content", "-j", "1", "-v"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(tuple(cache_path.glob("*.py")))
+    assert all(line.endswith("... COMPILED.") for line in lines)
+
+    args = ["-T", str(TESTDATA), "--cache-path", str(cache_path), "--cache-mode", "content"]
+    main(["gen", "test.txt.mako", str(tmp_path / "test.txt"), *args])
+    assert len(lines) == len(tuple(cache_path.glob("*.py")))
+
+
+def test_compile_missing_cache_path(tmp_path):
+    """Compile Requires Cache Path."""
+    with raises(SystemExit):
+        main(["compile", str(TESTDATA)])
+
+
+def test_cache(tmp_path, capsys):
+    """Cache Management."""
+    cache_path = tmp_path / "cache"
+    main(["compile", str(TESTDATA), "--cache-path", str(cache_path), "-j", "1"])
+    count = len(tuple(cache_path.glob("*.py")))
+
+    main(["cache", "stats", "--cache-path", str(cache_path)])
+    assert capsys.readouterr().out.startswith(f"{count} entries. ")
+
+    main(["cache", "prune", "--cache-path", str(cache_path), "--max-entries", "3", "-v"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == count - 3 + 1
+    assert lines[-1].startswith("3 entries. ")
+    assert len(tuple(cache_path.glob("*.py"))) == 3
+
+    main(["cache", "clear", "--cache-path", str(cache_path)])
+    assert capsys.readouterr().out == "0 entries. 0 bytes.\n"
+    assert tuple(cache_path.glob("**/*.py*")) == ()
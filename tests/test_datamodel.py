@@ -23,7 +23,14 @@
 #
 """Datamodel Testing."""
 
-from makolator import Datamodel
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from attrs import define
+from pytest import raises
+
+from makolator import Datamodel, Digester, DigestError, get_digest
 
 
 def test_datamodel():
@@ -52,3 +59,151 @@ def test_datamodel_update():
     assert datamodel.__dict__ == {"a": "bc", "data": 4}
     assert str(datamodel) == text
     assert repr(datamodel) == text
+
+
+@define(frozen=True)
+class Frozen:
+    """Frozen Attrs Class."""
+
+    items: tuple
+
+
+@dataclass
+class Mutable:
+    """Mutable Dataclass."""
+
+    items: list
+
+
+def test_datamodel_digest():
+    """Datamodel Digest."""
+    datamodel = Datamodel(a=Frozen((1, 2)), b=Mutable([3]), c={"x": (4, Path("y"))})
+    digest = datamodel.get_digest()
+    assert digest == Datamodel(c={"x": (4, Path("y"))}, b=Mutable([3]), a=Frozen((1, 2))).get_digest()
+
+    datamodel.b.items.append(5)
+    assert datamodel.get_digest() != digest
+    datamodel.b.items.pop()
+    assert datamodel.get_digest() == digest
+
+    datamodel.d = None
+    assert datamodel.get_digest() != digest
+    del datamodel.d
+    assert datamodel.get_digest() == digest
+
+
+def test_datamodel_digest_frozen():
+    """Frozen Attributes Are Digested Once."""
+    datamodel = Datamodel(a=[1], b=[2])
+    datamodel.freeze("a")
+    digest = datamodel.get_digest()
+    datamodel.a.append(3)
+    assert datamodel.get_digest() == digest
+    datamodel.b.append(3)
+    assert datamodel.get_digest() != digest
+    datamodel.a = [1]
+    datamodel.b = [2]
+    assert datamodel.get_digest() == digest
+
+
+class Comparable(Datamodel):  # noqa: PLW1641
+    """Unhashable Datamodel."""
+
+    def __eq__(self, other):
+        return vars(self) == vars(other)
+
+
+@define
+class AttrsDatamodel(Datamodel):
+    """Attrs Datamodel."""
+
+    a: int = 1
+
+
+def test_datamodel_unhashable():
+    """Datamodels Do Not Need To Be Hashable."""
+    datamodel = Comparable(a=1)
+    datamodel.freeze("a")
+    digest = datamodel.get_digest()
+    datamodel.a = 2
+    assert datamodel.get_digest() != digest
+    del datamodel.a
+    assert datamodel.get_digest() == Comparable().get_digest()
+
+    attrsmodel = AttrsDatamodel(a=2)
+    attrsmodel.freeze("a")
+    digest = attrsmodel.get_digest()
+    attrsmodel.a = 3
+    assert attrsmodel.get_digest() != digest
+
+
+def test_digester_cache():
+    """Immutable Subtrees Are Cached."""
+    digester = Digester()
+    frozen = Frozen(((1, 2), frozenset({3})))
+    mutable = Mutable([(4,), [5]])
+    digest = digester.get_digest([frozen, mutable])
+    cached = {id(obj) for obj, _ in digester._cache.values()}
+    assert cached == {id(frozen), id(frozen.items), id(frozen.items[0]), id(frozen.items[1]), id(mutable.items[0])}
+    assert digester.get_digest([frozen, mutable]) == digest
+    assert digester.get_digest([frozen, mutable]) == get_digest([frozen, mutable])
+    digester.clear()
+    assert not digester._cache
+
+
+def test_digester_cache_bound():
+    """Least Recently Used Cache Entries Are Dropped."""
+    digester = Digester(maxsize=2)
+    first, second, third = frozenset({1}), frozenset({2}), frozenset({3})
+    digest = digester.get_digest([first, second])
+    assert len(digester._cache) == 2
+    assert digester.get_digest([first]) == get_digest([first])
+    digester.get_digest([third])
+    assert [obj for obj, _ in digester._cache.values()] == [first, third]
+    assert digester.get_digest([first, second]) == digest
+    assert len(digester._cache) == 2
+
+
+def test_digest_cycle():
+    """Cyclic References."""
+    items = [1]
+    items.append(items)
+    assert get_digest(items) == get_digest(items)
+    assert get_digest(items) != get_digest([1, [1]])
+
+
+class Slotted:
+    """Slotted Class."""
+
+    __slots__ = ("__private", "value")
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return "Slotted()"
+
+
+def _make(value):
+    return lambda: value
+
+
+def test_digest_callables():
+    """Functions Are Digested By Code, Defaults, Closure And Arguments."""
+    assert get_digest(lambda: 1) != get_digest(lambda: 2)
+    assert get_digest(lambda: 1) == get_digest(lambda: 1)
+    assert get_digest(_make(1)) != get_digest(_make(2))
+    assert get_digest(_make(1)) == get_digest(_make(1))
+    assert get_digest(partial(int, base=2)) != get_digest(partial(int, base=16))
+    assert get_digest(partial(int, base=2)) == get_digest(partial(int, base=2))
+    assert get_digest(Slotted(1).__repr__) != get_digest(Slotted(2).__repr__)
+    assert get_digest(len) == get_digest(len)
+    assert get_digest([1].append) != get_digest([2].append)
+
+
+def test_digest_slots():
+    """Slots Are Walked And Identity-Only Objects Are Rejected."""
+    assert get_digest(Slotted(1)) != get_digest(Slotted(2))
+    assert get_digest(Slotted(1)) == get_digest(Slotted(1))
+    with raises(DigestError, match="Cannot digest builtins.object object"):
+        get_digest([object()])
@@ -0,0 +1,111 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Dependency File Testing."""
+
+import asyncio
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import fixture
+
+from makolator import Config, Makolator
+from makolator.cli import main
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+def _rule(target: Path, *deps: Path) -> str:
+    items = [f"{target.as_posix()}:", *(f"  {_escape(dep)}" for dep in deps)]
+    return " \\\n".join(items) + "\n"
+
+
+def _escape(path: Path) -> str:
+    return path.as_posix().replace(" ", "\\ ")
+
+
+@fixture
+def tpl_path(tpl_path):
+    """Template Directory With Dynamic Dependencies."""
+    (tpl_path / "dyn.txt.mako").write_text(
+        """\
+<%include file="${'leaf.txt.mako'}"/>
+<% makolator.add_dependency(datamodel.input) %>
+"""
+    )
+    (tpl_path / "leaf.txt.mako").write_text("leaf\n")
+    return tpl_path
+
+
+def test_depfile_gen(tmp_path, tpl_path):
+    """Depfile On Gen."""
+    mklt = Makolator(config=Config(template_paths=[tpl_path], depfile=True))
+    mklt.datamodel.input = tmp_path / "my input.json"
+    mklt.gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    mklt.gen([Path("dyn.txt.mako")], tmp_path / "dyn.txt")
+    mklt.gen([Path("impl.txt.mako")])
+
+    assert (tmp_path / "impl.txt.d").read_text() == _rule(
+        tmp_path / "impl.txt", tpl_path / "base.txt.mako", tpl_path / "impl.txt.mako"
+    )
+    assert (tmp_path / "dyn.txt.d").read_text() == _rule(
+        tmp_path / "dyn.txt", tmp_path / "my input.json", tpl_path / "dyn.txt.mako", tpl_path / "leaf.txt.mako"
+    )
+    assert sorted(path.name for path in tmp_path.glob("*.d")) == ["dyn.txt.d", "impl.txt.d"]
+
+
+def test_depfile_disabled(tmp_path, tpl_path):
+    """No Depfile By Default."""
+    mklt = Makolator(config=Config(template_paths=[tpl_path]))
+    mklt.datamodel.input = "input.json"
+    mklt.gen([Path("dyn.txt.mako")], tmp_path / "dyn.txt")
+    mklt.add_dependency("other.json")
+    assert not list(tmp_path.glob("*.d"))
+
+
+def test_depfile_inplace(tmp_path):
+    """Depfile On Inplace."""
+    filepath = tmp_path / "inplace-child.txt"
+    copyfile(TESTDATA / "inplace-child.txt", filepath)
+    mklt = Makolator(config=Config(template_paths=[TESTDATA], depfile=True))
+    mklt.inplace([Path("inplace-child.txt.mako")], filepath, ignore_unknown=True)
+    child, parent = (TESTDATA / name for name in ("inplace-child.txt.mako", "inplace.txt.mako"))
+    assert (tmp_path / "inplace-child.txt.d").read_text() == _rule(filepath, child, parent)
+
+
+def test_depfile_async(tmp_path, tpl_path):
+    """Depfile On Async Gen."""
+    mklt = Makolator(config=Config(template_paths=[tpl_path], depfile=True))
+    asyncio.run(mklt.agen([Path("impl.txt.mako")], tmp_path / "impl.txt"))
+    assert (tmp_path / "impl.txt.d").read_text() == _rule(
+        tmp_path / "impl.txt", tpl_path / "base.txt.mako", tpl_path / "impl.txt.mako"
+    )
+
+
+def test_depfile_cli(tmp_path, tpl_path):
+    """Depfile Via Command Line."""
+    main(["gen", str(tpl_path / "impl.txt.mako"), str(tmp_path / "impl.txt"), "--depfile"])
+    assert (tmp_path / "impl.txt.d").read_text() == _rule(
+        tmp_path / "impl.txt", tpl_path / "base.txt.mako", tpl_path / "impl.txt.mako"
+    )
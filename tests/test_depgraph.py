@@ -0,0 +1,116 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Dependency Graph Testing."""
+
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import fixture
+
+from makolator import Config, DepGraph, Makolator
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+@fixture
+def tpl_path(tmp_path, create_workspace):
+    """Template Directory."""
+    tpl_path = create_workspace(tmp_path, "util.txt.mako", "test.txt.mako") / "tpl"
+    (tpl_path / "leaf.txt.mako").write_text(
+        """\
+<%namespace name="util" file="util.txt.mako"/>
+<%namespace name="dyn" file="${'util.txt.mako'}"/>
+<%include file="missing.txt.mako" args="" />
+${util.utilfunc(1)}
+"""
+    )
+    return tpl_path
+
+
+def test_depgraph(tmp_path, tpl_path, update_file):
+    """Dependency Graph."""
+    cache_path = tmp_path / "cache"
+    out_path = tmp_path / "out"
+    config = Config(template_paths=[tpl_path], cache_path=cache_path, depgraph=True)
+    mklt = Makolator(config=config)
+    mklt.gen([Path("impl.txt.mako")], out_path / "impl.txt")
+    mklt.gen([Path("test.txt.mako")], out_path / "test.txt")
+    mklt.gen([Path("test.txt.mako")])
+
+    depgraph = mklt.depgraph
+    impl, base, test = (str(tpl_path / name) for name in ("impl.txt.mako", "base.txt.mako", "test.txt.mako"))
+    assert depgraph.templates[impl].deps == [base]
+    assert depgraph.templates[base].deps == []
+    assert depgraph.outputs == {str(out_path / "impl.txt"): [impl], str(out_path / "test.txt"): [test]}
+    assert depgraph.get_closure([impl]) == {impl, base}
+    assert depgraph.get_dependents([base]) == {impl, base}
+    assert not depgraph.is_modified
+    assert DepGraph.load(cache_path / "depgraph.json") == depgraph
+    assert depgraph.get_changed() == set()
+    assert depgraph.get_stale_outputs() == []
+
+    # base changed
+    update_file(tpl_path / "base.txt.mako", "modified\n", append=True)
+    depgraph = Makolator(config=config).depgraph
+    assert depgraph.get_changed() == {base}
+    assert depgraph.get_stale_outputs() == [str(out_path / "impl.txt")]
+    assert depgraph.get_stale_outputs([test]) == [str(out_path / "test.txt")]
+
+    mklt = Makolator(config=config)
+    mklt.gen([Path("impl.txt.mako")], out_path / "impl.txt")
+    assert mklt.depgraph.get_stale_outputs() == []
+
+    # base removed
+    (tpl_path / "base.txt.mako").unlink()
+    assert mklt.depgraph.get_stale_outputs() == [str(out_path / "impl.txt")]
+
+
+def test_depgraph_static(tmp_path, tpl_path):
+    """Only Static And Existing Dependencies Are Tracked."""
+    config = Config(template_paths=[tpl_path], cache_path=tmp_path / "cache", depgraph=True)
+    mklt = Makolator(config=config)
+    lookup = mklt._create_template_lookup([Path("leaf.txt.mako")], config.template_paths)[1]
+    mklt.depgraph.add(lookup, [lookup.get_template("leaf.txt.mako")])
+    assert mklt.depgraph.templates[str(tpl_path / "leaf.txt.mako")].deps == [str(tpl_path / "util.txt.mako")]
+    assert mklt.depgraph.outputs == {}
+
+
+def test_depgraph_inplace(tmp_path):
+    """Inplace Outputs Are Tracked."""
+    filepath = tmp_path / "inplace-child.txt"
+    copyfile(TESTDATA / "inplace-child.txt", filepath)
+    mklt = Makolator(config=Config(template_paths=[TESTDATA], cache_path=tmp_path / "cache", depgraph=True))
+    mklt.inplace([Path("inplace-child.txt.mako")], filepath, ignore_unknown=True)
+    child, parent = (str(TESTDATA / name) for name in ("inplace-child.txt.mako", "inplace.txt.mako"))
+    assert mklt.depgraph.outputs == {str(filepath): [child]}
+    assert mklt.depgraph.get_stale_outputs([parent]) == [str(filepath)]
+
+
+def test_depgraph_broken(tmp_path, caplog):
+    """Broken Dependency Graph Files Are Ignored."""
+    filepath = tmp_path / "depgraph.json"
+    filepath.write_text("{")
+    assert DepGraph.load(filepath) == DepGraph()
+    assert "Ignoring broken dependency graph" in caplog.text
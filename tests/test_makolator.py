@@ -23,11 +23,15 @@
 #
 """Makolator Testing."""
 
+import os
+from importlib.util import cache_from_source
 from pathlib import Path
+from shutil import copyfile
 
 from contextlib_chdir import chdir
+from pytest import mark, raises
 
-from makolator import Config, Datamodel, Existing, Makolator, Tracker
+from makolator import CacheManager, CacheMode, Config, Datamodel, DepGraph, Existing, Makolator, MakolatorError, Tracker
 
 FILEPATH = Path(__file__)
 TESTDATA = FILEPATH.parent / "testdata"
@@ -99,3 +103,192 @@ def test_cachepath_explicit(tmp_path):
     assert cachepath.exists()
     assert len(tuple(cachepath.glob("*"))) == 0
     mklt.gen([TESTDATA / "test.txt.mako"], tmp_path / "test.txt")
+
+
+def test_lookup_reuse(tmp_path):
+    """Template Lookup Is Reused For Identical Search Paths."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA]))
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test1.txt")
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test2.txt")
+    mklt.inplace([Path("inplace.txt.mako")], tmp_path / "test1.txt")
+    assert mklt.cachestat.hits["lookup"] == 2
+    assert mklt.cachestat.misses["lookup"] == 1
+    assert (tmp_path / "test1.txt").read_text() == (tmp_path / "test2.txt").read_text()
+
+    mklt.config.template_paths = [TESTDATA, tmp_path]
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test3.txt")
+    assert mklt.cachestat.misses["lookup"] == 2
+
+
+def _backdate(*paths: Path) -> None:
+    """Move Access And Modification Time Into The Past - Independent Of The Timestamp Resolution."""
+    for path in paths:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns - 10_000_000_000, stat.st_mtime_ns - 10_000_000_000))
+
+
+def test_cachemode_content(tmp_path):
+    """Content Addressed Cache Is Shared Between Template Locations."""
+    cache_path = tmp_path / "cache"
+    config = Config(cache_path=cache_path, cache_mode=CacheMode.CONTENT)
+    for name in ("ws1", "ws2"):
+        (tmp_path / name).mkdir()
+        copyfile(TESTDATA / "test.txt.mako", tmp_path / name / "test.txt.mako")
+
+    Makolator(config=config).gen([tmp_path / "ws1" / "test.txt.mako"], tmp_path / "ws1" / "test.txt")
+    modules = sorted(cache_path.glob("*.py"))
+    assert len(modules) == 1
+    _backdate(modules[0])
+    mtime_ns = modules[0].stat().st_mtime_ns
+    source = modules[0].read_text()
+
+    # newer template copy at a different location: no recompile
+    Makolator(config=config).gen([tmp_path / "ws2" / "test.txt.mako"], tmp_path / "ws2" / "test.txt")
+    assert sorted(cache_path.glob("*.py")) == modules
+    assert modules[0].read_text() == source
+    assert modules[0].stat().st_mtime_ns > mtime_ns
+    assert (tmp_path / "ws1" / "test.txt").read_text() == (tmp_path / "ws2" / "test.txt").read_text()
+
+    # changed template: new module
+    mklt = Makolator(config=config)
+    filepath = tmp_path / "ws2" / "test.txt.mako"
+    mklt.gen([filepath], tmp_path / "ws2" / "test.txt")
+    filepath.write_text("changed\n")
+    mklt.gen([filepath], tmp_path / "ws2" / "test.txt")
+    assert (tmp_path / "ws2" / "test.txt").read_text() == "changed\n"
+    mklt.gen([filepath], tmp_path / "ws2" / "test.txt")
+    assert len(tuple(cache_path.glob("*.py"))) == 2
+
+
+@mark.parametrize("workers", [1, 2])
+@mark.parametrize("cache_mode", list(CacheMode))
+def test_precompile(tmp_path, workers, cache_mode):
+    """Precompile Templates."""
+    cache_path = tmp_path / "cache"
+    config = Config(template_paths=[TESTDATA], cache_path=cache_path, cache_mode=cache_mode)
+    modulepaths = Makolator(config=config).precompile(workers=workers)
+    assert modulepaths
+    assert sorted(cache_path.glob("*.py")) == sorted(modulepaths)
+    for modulepath in modulepaths:
+        assert Path(cache_from_source(str(modulepath))).exists()
+
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    mklt = Makolator(config=config)
+    mklt.datamodel.name = "some-name"
+    mklt.gen([TESTDATA / "gen-recursive"], tmp_path / "gen")
+    assert sorted(cache_path.glob("*.py")) == sorted(modulepaths)
+
+
+def test_precompile_empty(tmp_path):
+    """Precompile Without Templates."""
+    mklt = Makolator(config=Config(cache_path=tmp_path / "cache"))
+    assert mklt.precompile(tmp_path) == []
+
+
+def test_cache_lru(tmp_path):
+    """Least Recently Used Templates Are Removed From Cache."""
+    cache_path = tmp_path / "cache"
+    config = Config(template_paths=[TESTDATA], cache_path=cache_path)
+    Makolator(config=config).precompile(workers=1)
+    count = len(tuple(cache_path.glob("*.py")))
+    assert count > 3
+
+    _backdate(*cache_path.glob("*.py"))
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    used = {entry.path for entry in CacheManager(cache_path).entries[:2]}
+    assert {path.name.split("_")[0] for path in used} == {"impl.txt.mako", "base.txt.mako"}
+
+    config.cache_max_entries = 2
+    mklt = Makolator(config=config)
+    assert mklt.cachemanager.stat.startswith(f"{count} entries.")
+    mklt.gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    assert set(cache_path.glob("*.py")) == used
+
+    config.cache_max_entries = None
+    config.cache_max_size = 0
+    Makolator(config=config).cache_path  # noqa: B018
+    assert tuple(cache_path.glob("*.py")) == ()
+
+
+def test_cache_state(tmp_path, monkeypatch):
+    """Render Cache Files Are Cache Entries, State Files Not - Unbounded Caches Are Not Scanned."""
+    cache_path = tmp_path / "cache"
+    config = Config(template_paths=[TESTDATA], cache_path=cache_path, render_cache=True, buildstate=True)
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    names = {entry.path.relative_to(cache_path).parts[0] for entry in CacheManager(cache_path).entries}
+    assert "render" in names
+    assert not {"depgraph.json", "buildstate.sqlite"} & names
+
+    def entries(self):
+        raise AssertionError("scanned")
+
+    monkeypatch.setattr(CacheManager, "entries", property(entries))
+    assert Makolator(config=config).cachemanager.prune() == []
+    monkeypatch.undo()
+
+    config.cache_max_entries = 0
+    assert Makolator(config=config).cachemanager.prune()
+    assert CacheManager(cache_path).stat == "0 entries. 0 bytes."
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    CacheManager(cache_path).clear()
+    assert CacheManager(cache_path).stat == "0 entries. 0 bytes."
+    assert sorted(path.name for path in cache_path.glob("**/*") if path.is_file()) == [
+        "buildstate.sqlite",
+        "depgraph.json",
+    ]
+
+
+def test_helper_template(tmp_path):
+    """Built-In Helper Template Is Compiled Once."""
+    copyfile(TESTDATA / "inplace-run.txt", tmp_path / "inplace-run.txt")
+    for _ in range(2):
+        mklt = Makolator(config=Config(template_paths=[TESTDATA]))
+        mklt.inplace([], tmp_path / "inplace-run.txt")
+        assert mklt.cachestat.hits.get("helper", 0) + mklt.cachestat.misses.get("helper", 0) == 1
+    assert mklt.cachestat.hits == {"helper": 1}
+
+
+def test_searchindex(tmp_path):
+    """Template Search Paths Are Listed Once."""
+    mklt = Makolator(config=Config(template_paths=[tmp_path, TESTDATA]))
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test1.txt")
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test2.txt")
+    assert mklt.cachestat.misses["searchindex"] == 2
+    assert mklt.cachestat.hits["searchindex"] == 2
+
+    # New templates are not found without check
+    copyfile(TESTDATA / "test.txt.mako", tmp_path / "test.txt.mako")
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test3.txt")
+    assert mklt.cachestat.misses["searchindex"] == 2
+
+    mklt.config.template_paths_check = True
+    mklt.gen([Path("test.txt.mako")], tmp_path / "test4.txt")
+    assert mklt.cachestat.misses["searchindex"] == 3
+
+
+@mark.parametrize("workers", [1, 2])
+def test_gen_many(tmp_path, workers):
+    """Render Many Files In Parallel."""
+    config = Config(template_paths=[TESTDATA], track=True, depgraph=True, cache_path=tmp_path / "cache")
+    mklt = Makolator(config=config)
+    jobs = [([Path("test.txt.mako")], tmp_path / f"test{idx}.txt", {"idx": idx}) for idx in range(4)]
+    mklt.gen_many(jobs, workers=workers)
+    assert [path for path, _ in mklt.tracker.items] == [dest for _, dest, _ in jobs]
+    assert mklt.tracker.stat == "4 files. 4 CREATED."
+    ref = Makolator(config=Config(template_paths=[TESTDATA]))
+    ref.gen([Path("test.txt.mako")], tmp_path / "ref.txt")
+    for _, dest, _ in jobs:
+        assert dest.read_text() == (tmp_path / "ref.txt").read_text()
+    depgraph = DepGraph.load(tmp_path / "cache" / "depgraph.json")
+    assert sorted(depgraph.outputs) == sorted(str(dest) for _, dest, _ in jobs)
+
+    mklt.tracker.clear()
+    mklt.gen_many(jobs, workers=workers)
+    assert mklt.tracker.stat == "4 files. 4 identical. untouched."
+
+
+def test_gen_many_error(tmp_path):
+    """Errors Of Workers Are Raised."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA]))
+    with raises(MakolatorError, match="None of the templates"):
+        mklt.gen_many([([Path("missing.txt.mako")], tmp_path / "test.txt", None)], workers=2)
@@ -0,0 +1,125 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Asyncio API Testing."""
+
+import asyncio
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import raises
+
+from makolator import Config, Makolator, MakolatorError
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+def test_agen(tmp_path):
+    """Render Many Files Concurrently."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA], track=True, async_limit=2))
+    ref = Makolator(config=Config(template_paths=[TESTDATA]))
+    ref.gen([Path("static.txt.mako")], tmp_path / "ref.txt")
+    dests = [tmp_path / f"test{idx}.txt" for idx in range(5)]
+
+    async def main():
+        await asyncio.gather(*(mklt.agen([Path("static.txt.mako")], dest) for dest in dests))
+
+    asyncio.run(main())
+    assert mklt.tracker.stat == "5 files. 5 CREATED."
+    for dest in dests:
+        assert dest.read_text() == (tmp_path / "ref.txt").read_text()
+
+    # static code is preserved
+    dests[0].write_text(dests[0].read_text().replace("obsolete a", "my a"))
+    asyncio.run(main())
+    assert mklt.tracker.stat == "10 files. 5 UPDATED. 5 CREATED."
+    assert "my a" in dests[0].read_text()
+
+
+def test_agen_recursive(tmp_path):
+    """Render Template Directory."""
+    mklt = Makolator()
+    mklt.datamodel.name = "some-name"  # type: ignore[attr-defined]
+    ref = Makolator(datamodel=mklt.datamodel)
+    ref.gen([TESTDATA / "gen-recursive"], tmp_path / "ref")
+    asyncio.run(mklt.agen([TESTDATA / "gen-recursive"], tmp_path / "gen"))
+    for filepath in (tmp_path / "ref").rglob("*"):
+        if filepath.is_file():
+            assert (tmp_path / "gen" / filepath.relative_to(tmp_path / "ref")).read_bytes() == filepath.read_bytes()
+
+
+def test_agen_fail(tmp_path):
+    """Failures Are Tracked And Raised."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA], track=True))
+    with raises(MakolatorError):
+        asyncio.run(mklt.agen([Path("missing.txt.mako")], tmp_path / "test.txt"))
+    assert mklt.tracker.stat == "1 files. 1 FAILED."
+
+
+def test_ainplace(tmp_path):
+    """Update Files Concurrently."""
+    mklt = Makolator(config=Config(track=True))
+    filepaths = [tmp_path / f"inplace{idx}.txt" for idx in range(3)]
+    (tmp_path / "ref").mkdir()
+    for filepath in filepaths:
+        copyfile(TESTDATA / "inplace.txt", filepath)
+        copyfile(TESTDATA / "inplace.txt", tmp_path / "ref" / filepath.name)
+        Makolator().inplace([TESTDATA / "inplace.txt.mako"], tmp_path / "ref" / filepath.name)
+
+    async def main():
+        await asyncio.gather(*(mklt.ainplace([TESTDATA / "inplace.txt.mako"], filepath) for filepath in filepaths))
+
+    asyncio.run(main())
+    assert mklt.tracker.stat == "3 files. 3 UPDATED."
+    for filepath in filepaths:
+        assert filepath.read_text() == (tmp_path / "ref" / filepath.name).read_text()
+
+
+def test_ainplace_fail(tmp_path):
+    """Failures Are Tracked And Raised."""
+    mklt = Makolator(config=Config(track=True))
+    filepath = tmp_path / "inplace.txt"
+    copyfile(TESTDATA / "inplace-child.txt", filepath)
+    with raises(MakolatorError):
+        asyncio.run(mklt.ainplace([TESTDATA / "inplace.txt.mako"], filepath))
+    assert mklt.tracker.stat == "1 files. 1 FAILED."
+    assert filepath.read_text() == (TESTDATA / "inplace-child.txt").read_text()
+
+
+def test_ainplace_create(tmp_path):
+    """Create Missing File."""
+    mklt = Makolator(config=Config(create=True))
+    asyncio.run(mklt.ainplace([TESTDATA / "inplace-create.txt.mako"], tmp_path / "inplace.txt"))
+    assert (tmp_path / "inplace.txt").exists()
+
+
+def test_aclean(tmp_path):
+    """Clean Concurrently."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "gen.txt").write_text("// @fully-generated\n")
+    (tmp_path / "keep.txt").write_text("// @generated\n")
+    mklt = Makolator(config=Config(track=True, verbose=True))
+    asyncio.run(mklt.aclean([tmp_path]))
+    assert sorted(path.name for path in tmp_path.rglob("*.txt")) == ["keep.txt"]
+    assert mklt.tracker.stat == "2 files. 1 identical. untouched. 1 REMOVED."
@@ -266,15 +266,21 @@ def test_undefined(tmp_path, mklt):
         mklt.gen([Path("undefined.txt.mako")], filepath)
 
 
+@mark.parametrize("workers", (1, 2))
 @mark.parametrize("existing", (False, True))
-def test_gen_recursive(tmp_path, existing: bool):
+def test_gen_recursive(tmp_path, existing: bool, workers: int):
     """Recursive Rendering."""
-    mklt = Makolator()
+    mklt = Makolator(config=Config(track=True))
     mklt.datamodel.name = "some-name"  # type: ignore[attr-defined]
     gen_path = tmp_path / "gen"
     if existing:
         gen_path.mkdir()
-    mklt.gen([TESTDATA / "gen-recursive"], gen_path)
+    mklt.gen([TESTDATA / "gen-recursive"], gen_path, workers=workers)
+    ref = Makolator(config=Config(track=True), datamodel=mklt.datamodel)
+    ref.gen([TESTDATA / "gen-recursive"], tmp_path / "ref")
+    assert [(filepath.relative_to(gen_path), state) for filepath, state in mklt.tracker.items] == [
+        (filepath.relative_to(tmp_path / "ref"), state) for filepath, state in ref.tracker.items
+    ]
     assert_refdata(test_gen_recursive, gen_path)
 
 
@@ -23,15 +23,19 @@
 #
 """Makolator Testing."""
 
+import asyncio
+import os
 import re
+import time
 from pathlib import Path
 from shutil import copyfile
 
 from mako.exceptions import CompileException
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 from test2ref import assert_paths, assert_refdata
 
-from makolator import Makolator, MakolatorError
+from makolator import Config, Makolator, MakolatorError, _inplace
+from makolator._inplace import InplaceRenderer, has_markers, scan_markers
 
 FILEPATH = Path(__file__)
 TESTDATA = FILEPATH.parent / "testdata"
@@ -137,6 +141,34 @@ def test_mako_only(tmp_path):
     assert_refdata(test_mako_only, tmp_path)
 
 
+def test_mako_cache(tmp_path):
+    """Inline Templates Are Cached In Memory And In Cache Path."""
+    filepath = tmp_path / "inplace.txt"
+    cache_path = tmp_path / "cache"
+    config = Config(cache_path=cache_path)
+    reffilepath = tmp_path / "ref" / "inplace.txt"
+    reffilepath.parent.mkdir()
+    copyfile(TESTDATA / "inplace-tpl.txt", reffilepath)
+    Makolator().inplace([TESTDATA / "inplace.txt.mako"], reffilepath)
+
+    copyfile(TESTDATA / "inplace-tpl.txt", filepath)
+    mklt = Makolator(config=config)
+    mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
+    mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
+    assert mklt.cachestat.misses["inline"] == 2
+    assert mklt.cachestat.misses["inline-module"] == 2
+    assert mklt.cachestat.hits["inline"] == 2
+    assert len(tuple(cache_path.glob("inline_*.py"))) == 2
+    assert filepath.read_text() == reffilepath.read_text()
+
+    copyfile(TESTDATA / "inplace-tpl.txt", filepath)
+    mklt = Makolator(config=config)
+    mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
+    assert mklt.cachestat.hits["inline-module"] == 2
+    assert "inline-module" not in mklt.cachestat.misses
+    assert filepath.read_text() == reffilepath.read_text()
+
+
 def test_mako_disabled(tmp_path):
     """Render File Inplace with mako."""
     filepath = tmp_path / "inplace.txt"
@@ -330,3 +362,180 @@ def test_mako_only_fillstar(tmp_path):
     mklt.config.marker_linelength = 40
     mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
     assert_refdata(test_mako_only_fillstar, tmp_path)
+
+
+def test_get_inplace_funcs(mklt):
+    """Available Inplace Functions."""
+    funcs = mklt.get_inplace_funcs([Path("inplace-child.txt.mako"), Path("inplace.txt.mako")])
+    assert funcs == {
+        "afunc": str(TESTDATA / "inplace.txt.mako"),
+        "bfunc": str(TESTDATA / "inplace-child.txt.mako"),
+        "run": None,
+        "simple": str(TESTDATA / "inplace.txt.mako"),
+    }
+
+
+@mark.parametrize("workers", [1, 2])
+def test_inplace_many(tmp_path, workers):
+    """Update Many Files And Collect Errors."""
+    filepaths = [tmp_path / f"inplace{idx}.txt" for idx in range(3)]
+    (tmp_path / "ref").mkdir()
+    for filepath in filepaths:
+        copyfile(TESTDATA / "inplace.txt", filepath)
+        copyfile(TESTDATA / "inplace.txt", tmp_path / "ref" / filepath.name)
+        Makolator().inplace([TESTDATA / "inplace.txt.mako"], tmp_path / "ref" / filepath.name)
+    broken = tmp_path / "broken.txt"
+    copyfile(TESTDATA / "inplace-child.txt", broken)
+    missing = tmp_path / "missing.txt"
+
+    mklt = Makolator(config=Config(track=True))
+    with raises(MakolatorError) as exc:
+        mklt.inplace_many(
+            [TESTDATA / "inplace.txt.mako"], [filepaths[0], broken, *filepaths[1:], missing], workers=workers
+        )
+    lines = str(exc.value).splitlines()
+    assert lines[0] == "2 of 5 files failed."
+    assert lines[1].startswith(f"{broken!s}: ")
+    assert lines[2].startswith(f"{missing!s}: ")
+    for filepath in filepaths:
+        assert filepath.read_text() == (tmp_path / "ref" / filepath.name).read_text()
+    assert [filepath for filepath, _ in mklt.tracker.items] == [filepaths[0], broken, *filepaths[1:], missing]
+    assert mklt.tracker.failed == 2
+
+
+@mark.parametrize("workers", [1, 2])
+def test_inplace_many_mako_error(tmp_path, workers):
+    """Broken Inline Templates Are Collected Like Other Errors."""
+    filepaths = [tmp_path / name for name in ("a.txt", "broken.txt", "b.txt")]
+    for filepath, name in zip(filepaths, ("inplace.txt", "inplace-tpl-broken.txt", "inplace.txt"), strict=True):
+        copyfile(TESTDATA / name, filepath)
+    mklt = Makolator()
+    with raises(MakolatorError) as exc:
+        mklt.inplace_many([TESTDATA / "inplace.txt.mako"], filepaths, workers=workers)
+    lines = str(exc.value).splitlines()
+    assert lines[0] == "1 of 3 files failed."
+    assert lines[1].startswith(f"{filepaths[1]!s}: ")
+    assert "obsolete" not in filepaths[0].read_text()
+    assert "obsolete" not in filepaths[2].read_text()
+
+
+def test_has_markers(tmp_path):
+    """Byte-Level Marker Prefilter."""
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("")
+    assert not has_markers(filepath, ("GENERATE INPLACE",))
+    filepath.write_text("a\nb // GENERATE INPLACE BEGIN\n")
+    assert has_markers(filepath, ("MAKO TEMPLATE", "GENERATE INPLACE"))
+    assert not has_markers(filepath, ("MAKO TEMPLATE", "STATIC"))
+    assert not has_markers(filepath, ("", None))
+    assert has_markers(filepath, (r"MAKO\s+TEMPLATE",))
+
+
+@mark.parametrize("content", ["", "no markers\nhere\n"])
+def test_markerless(tmp_path, monkeypatch, content):
+    """Files Without Any Marker Are Skipped."""
+    filepath = tmp_path / "plain.txt"
+    filepath.write_text(content)
+    mtime = filepath.stat().st_mtime_ns
+
+    def render(*args, **kwargs):
+        raise AssertionError("render called")
+
+    monkeypatch.setattr(InplaceRenderer, "render", render)
+    mklt = Makolator(config=Config(track=True))
+    mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
+    assert mklt.tracker.stat == "1 files. 1 identical. untouched."
+    assert filepath.read_text() == content
+    assert filepath.stat().st_mtime_ns == mtime
+
+    mklt = Makolator(config=Config(track=True, render_cache=True))
+    asyncio.run(mklt.ainplace([TESTDATA / "inplace.txt.mako"], filepath))
+    assert mklt.tracker.stat == "1 files. 1 identical. untouched."
+
+
+def test_static_only(tmp_path):
+    """Files With Static Code Only Are Still Processed."""
+    filepath = tmp_path / "static.txt"
+    filepath.write_text("a\n// STATIC BEGIN foo\nb\n// STATIC END foo\n")
+    mklt = Makolator()
+    with raises(MakolatorError, match="unknown static code"):
+        mklt.inplace([TESTDATA / "inplace.txt.mako"], filepath)
+
+
+def test_scan_markers():
+    """Single Pass Marker Scanner."""
+    lines = [
+        "a\n",
+        "// GENERATE INPLACE BEGIN foo()\r\n",
+        "b\r",
+        "MAKO TEMPLATE MAKO TEMPLATE\n",
+        "GENERATE\n",
+        "INPLACE",
+    ]
+    assert scan_markers(lines, ("GENERATE INPLACE", "MAKO TEMPLATE")) == [1, 3]
+    assert scan_markers(lines, ("MAKO TEMPLATE", None)) == [3]
+    assert scan_markers(lines, ("", None)) == []
+    assert scan_markers(lines, (r"GENERATE\s+INPLACE", "MAKO TEMPLATE")) == [1, 3, 4]
+    assert scan_markers(lines, (r"INPLACE$",)) == [5]
+    assert scan_markers(lines, ("^GENERATE INPLACE",)) == []
+    assert scan_markers(lines, ("^GENERATE",)) == [4]
+    assert scan_markers(lines, ("^MAKO", r"BEGIN foo\(\)$")) == [1, 3]
+    assert scan_markers([], ("GENERATE INPLACE",)) == []
+
+
+def _gen_sv(filepath: Path, numlines: int):
+    lines = [
+        "// MAKO TEMPLATE BEGIN\n",
+        '// <%def name="ports(num)">\\\n',
+        "// % for idx in range(num):\n",
+        "// logic [31:0] data${idx};\n",
+        "// % endfor\n",
+        "// </%def>\n",
+        "// MAKO TEMPLATE END\n",
+        "module top (\n",
+    ]
+    idx = 0
+    while len(lines) < numlines:
+        if idx % 1000 == 0:
+            lines += [
+                f"  // GENERATE INPLACE BEGIN ports({idx % 7 + 1})\n",
+                "  old\n",
+                "  // GENERATE INPLACE END ports\n",
+            ]
+        lines.append(f"  assign signal_{idx} = (other_{idx} & mask_{idx}) | {{8{{enable_{idx}}}}}; // comment\n")
+        idx += 1
+    lines.append("endmodule\n")
+    filepath.write_text("".join(lines))
+
+
+def _inplace_sv(tmp_path: Path, monkeypatch, numlines: int) -> tuple[int, dict[str, float]]:
+    """Run Inplace With Scanner And With Regex On Every Line And Return Size And Duration."""
+    source = tmp_path / "source.sv"
+    _gen_sv(source, numlines)
+    durations = {}
+    for name in ("scan", "perline"):
+        if name == "perline":
+            monkeypatch.setattr(_inplace, "scan_markers", lambda lines, markers: list(range(len(lines))))
+        filepath = tmp_path / f"{name}.sv"
+        copyfile(source, filepath)
+        start = time.perf_counter()
+        Makolator().inplace([], filepath)
+        durations[name] = time.perf_counter() - start
+    assert (tmp_path / "scan.sv").read_text() == (tmp_path / "perline.sv").read_text()
+    assert "logic [31:0] data6;" in (tmp_path / "scan.sv").read_text()
+    return source.stat().st_size, durations
+
+
+def test_scan_perline(tmp_path, monkeypatch):
+    """Scanner Matches Regex On Every Line."""
+    _inplace_sv(tmp_path, monkeypatch, 5_000)
+
+
+@mark.skipif(not os.environ.get("MAKOLATOR_BENCHMARK"), reason="set MAKOLATOR_BENCHMARK=1 to benchmark")
+@mark.parametrize("numlines", [50_000, 200_000])
+def test_throughput(tmp_path, monkeypatch, capsys, numlines):
+    """Inplace Throughput On Large Generated Sources - Scanner vs. Regex On Every Line."""
+    size, durations = _inplace_sv(tmp_path, monkeypatch, numlines)
+    results = {name: size / duration / 1e6 for name, duration in durations.items()}
+    with capsys.disabled():
+        print(f"\n{numlines} lines, {size / 1e6:.1f} MB: " + ", ".join(f"{k} {v:.1f} MB/s" for k, v in results.items()))
@@ -0,0 +1,159 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Manifest Testing."""
+
+import json
+import re
+from pathlib import Path
+from shutil import copyfile
+
+from attrs import evolve
+from pytest import fixture, mark, raises
+
+from makolator import CacheMode, Makolator, MakolatorError, Manifest
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+MANIFEST = {
+    "template_paths": [str(TESTDATA)],
+    "cache_path": "cache",
+    "cache_mode": "content",
+    "jobs": [
+        {"cmd": "gen", "templates": ["test.txt.mako"], "output": "gen/test1.txt"},
+        {"cmd": "gen", "templates": ["context.txt.mako"], "output": "gen/test2.txt", "context": {"myvar": "x"}},
+        {"cmd": "inplace", "templates": ["inplace.txt.mako"], "files": ["src/*.txt"]},
+        {"cmd": "clean", "paths": ["gen"]},
+    ],
+}
+
+TOML = f"""
+template_paths = [{str(TESTDATA)!r}]
+cache_path = "cache"
+cache_mode = "content"
+
+[[jobs]]
+cmd = "gen"
+templates = ["test.txt.mako"]
+output = "gen/test1.txt"
+
+[[jobs]]
+cmd = "gen"
+templates = ["context.txt.mako"]
+output = "gen/test2.txt"
+context = {{ myvar = "x" }}
+
+[[jobs]]
+cmd = "inplace"
+templates = ["inplace.txt.mako"]
+files = ["src/*.txt"]
+
+[[jobs]]
+cmd = "clean"
+paths = ["gen"]
+"""
+
+
+@fixture
+def example(tmp_path):
+    """Example Manifests."""
+    (tmp_path / "src").mkdir()
+    for name in ("a.txt", "b.txt"):
+        copyfile(TESTDATA / "inplace.txt", tmp_path / "src" / name)
+    (tmp_path / "jobs.json").write_text(json.dumps(MANIFEST))
+    (tmp_path / "jobs.toml").write_text(TOML)
+    yield tmp_path
+
+
+@mark.parametrize("name", ["jobs.json", "jobs.toml"])
+def test_manifest(example, name):
+    """Load And Run Manifest."""
+    manifest = Manifest.load(example / name)
+    assert manifest.config.template_paths == [TESTDATA, example]
+    assert manifest.config.cache_path == example / "cache"
+    assert manifest.config.cache_mode == CacheMode.CONTENT
+    assert [job.cmd for job in manifest.jobs] == ["gen", "gen", "inplace", "clean"]
+    assert manifest.jobs[1].context == {"myvar": "x"}
+    assert manifest.jobs[2].paths == [example / "src" / "a.txt", example / "src" / "b.txt"]
+
+    mklt = Makolator(config=evolve(manifest.config, track=True))
+    manifest.run(mklt, workers=1)
+    assert mklt.tracker.stat == "6 files. 2 UPDATED. 2 identical. untouched. 2 CREATED."
+    assert (example / "gen" / "test2.txt").read_text() == "x\n"
+
+
+def test_manifest_inplace_pool(example, monkeypatch):
+    """Consecutive Inplace Jobs Share One Worker Pool And Collect Their Errors."""
+    copyfile(TESTDATA / "inplace-tpl-broken.txt", example / "broken.txt")
+    data = {
+        "template_paths": [str(TESTDATA)],
+        "jobs": [
+            {"cmd": "inplace", "templates": ["inplace.txt.mako"], "files": ["src/a.txt"]},
+            {"cmd": "inplace", "templates": ["inplace.txt.mako"], "files": ["broken.txt"]},
+            {"cmd": "inplace", "templates": ["inplace.txt.mako"], "files": ["src/b.txt"], "context": {"x": 1}},
+        ],
+    }
+    (example / "pool.json").write_text(json.dumps(data))
+    manifest = Manifest.load(example / "pool.json")
+    pools = []
+    run_workers = Makolator._run_workers
+
+    def _run_workers(self, func, jobs, workers):
+        pools.append(len(jobs))
+        return run_workers(self, func, jobs, workers)
+
+    monkeypatch.setattr(Makolator, "_run_workers", _run_workers)
+    mklt = Makolator(config=evolve(manifest.config, track=True))
+    with raises(MakolatorError, match=re.escape("1 of 3 files failed.")):
+        manifest.run(mklt, workers=2)
+    assert pools == [3]
+    assert "obsolete" not in (example / "src" / "a.txt").read_text()
+    assert "obsolete" not in (example / "src" / "b.txt").read_text()
+
+
+@mark.parametrize(
+    "data, msg",
+    [
+        ({"foo": 1}, "unknown settings ['foo']."),
+        ({"cache_mode": "foo"}, "'foo' is not a valid CacheMode"),
+        ({"jobs": [{"cmd": "foo"}]}, "unknown cmd 'foo'. Use one of ['gen', 'inplace', 'clean']."),
+        ({"jobs": [{"cmd": "gen", "templates": ["a.mako"]}]}, "gen job without output."),
+        ({"jobs": [{"cmd": "clean", "files": ["a"]}]}, "unknown clean settings ['files']."),
+        ([], "manifest must be a table/object."),
+    ],
+)
+def test_manifest_broken(tmp_path, data, msg):
+    """Broken Manifest."""
+    filepath = tmp_path / "jobs.json"
+    filepath.write_text(json.dumps(data))
+    with raises(MakolatorError, match=re.escape(msg)):
+        Manifest.load(filepath)
+
+
+def test_manifest_syntax(tmp_path):
+    """Syntax Error."""
+    filepath = tmp_path / "jobs.toml"
+    filepath.write_text("[[jobs]")
+    with raises(MakolatorError, match=re.escape(str(filepath))):
+        Manifest.load(filepath)
@@ -0,0 +1,120 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Template Registry Testing."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import fixture
+
+from makolator import TEMPLATE_REGISTRY, Config, Makolator
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+REFDATA = FILEPATH.parent / "refdata" / "tests.test_makolator_gen"
+
+
+@fixture
+def registry(monkeypatch):
+    """Empty Registry And No Temporary Cache Directories."""
+
+    def mkdtemp(*args, **kwargs):
+        raise AssertionError("mkdtemp is not expected")
+
+    monkeypatch.setattr("makolator.makolator.tempfile.mkdtemp", mkdtemp)
+    TEMPLATE_REGISTRY.clear()
+    TEMPLATE_REGISTRY.cachestat.clear()
+    yield TEMPLATE_REGISTRY
+    TEMPLATE_REGISTRY.clear()
+    TEMPLATE_REGISTRY.cachestat.clear()
+
+
+def test_registry(tmp_path, registry):
+    """Compiled Templates Are Shared Between Instances."""
+    config = Config(template_paths=[TESTDATA], template_registry=True)
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl1.txt")
+    assert registry.cachestat.misses == {"registry": 2}
+    assert len(registry) == 2
+
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl2.txt")
+    assert registry.cachestat.hits == {"registry": 2}
+    assert registry.cachestat.misses == {"registry": 2}
+
+    content = (REFDATA / "test_hier_impl" / "impl.txt").read_text()
+    assert (tmp_path / "impl1.txt").read_text() == content
+    assert (tmp_path / "impl2.txt").read_text() == content
+
+
+def test_registry_change(tmp_path, registry):
+    """Changed Templates Are Recompiled."""
+    filepath = tmp_path / "test.txt.mako"
+    filepath.write_text("one\n")
+    mklt = Makolator(config=Config(template_registry=True))
+    mklt.gen([filepath], tmp_path / "test.txt")
+    filepath.write_text("two\n")
+    mklt.gen([filepath], tmp_path / "test.txt")
+    assert (tmp_path / "test.txt").read_text() == "two\n"
+    assert registry.cachestat.misses == {"registry": 2}
+
+    filepath.write_text("one\n")
+    Makolator(config=Config(template_registry=True)).gen([filepath], tmp_path / "test.txt")
+    assert (tmp_path / "test.txt").read_text() == "one\n"
+    assert registry.cachestat.hits == {"registry": 1}
+
+
+def test_registry_eviction(tmp_path, registry, monkeypatch):
+    """Least Recently Used Templates Are Dropped."""
+    monkeypatch.setattr(registry, "max_entries", 1)
+    config = Config(template_paths=[TESTDATA], template_registry=True)
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    assert len(registry) == 1
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    assert registry.cachestat.hits == {}
+    assert registry.cachestat.misses == {"registry": 4}
+
+
+def test_registry_cache_path(tmp_path, registry):
+    """Registry With Cache Path."""
+    cache_path = tmp_path / "cache"
+    config = Config(template_paths=[TESTDATA], template_registry=True, cache_path=cache_path)
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / "impl.txt")
+    assert len(tuple(cache_path.glob("*.py"))) == 2
+    assert registry.cachestat.hits == {"registry": 2}
+
+
+def test_registry_threads(tmp_path, registry):
+    """Registry Is Thread-Safe."""
+    copyfile(TESTDATA / "inplace.txt", tmp_path / "inplace.txt")
+    config = Config(template_paths=[TESTDATA], template_registry=True)
+
+    def gen(idx):
+        Makolator(config=config).gen([Path("impl.txt.mako")], tmp_path / f"impl{idx}.txt")
+        return (tmp_path / f"impl{idx}.txt").read_text()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        contents = set(executor.map(gen, range(16)))
+    assert len(contents) == 1
+    assert len(registry) == 2
@@ -0,0 +1,196 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Render Cache Testing."""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import fixture
+
+from makolator import CacheMode, Config, Makolator
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+@fixture
+def cache_path(tmp_path):
+    """Shared Cache Directory."""
+    return tmp_path / "cache"
+
+
+@fixture
+def create_workspace(create_workspace):
+    """Create Workspace With Inplace File And Dynamic Include."""
+
+    def create(path: Path) -> Path:
+        tpl_path = create_workspace(path, "inplace.txt.mako") / "tpl"
+        (tpl_path / "dyn.txt.mako").write_text("<%include file=\"${'leaf.txt.mako'}\"/>\n")
+        (tpl_path / "leaf.txt.mako").write_text("leaf\n")
+        (tpl_path / "outer.txt.mako").write_text(
+            "<%! from pathlib import Path %>"
+            '<% makolator.gen(Path("leaf.txt.mako"), output_filepath.with_name("inner.txt")) %>outer\n'
+        )
+        copyfile(TESTDATA / "inplace.txt", path / "inplace.txt")
+        return path
+
+    return create
+
+
+def _gen(cache_path, name, **kwargs):
+    config = Config(
+        template_paths=[Path("tpl")],
+        cache_path=cache_path,
+        cache_mode=CacheMode.CONTENT,
+        render_cache=True,
+        track=True,
+        **kwargs,
+    )
+    mklt = Makolator(config=config)
+    mklt.gen([Path(f"{name}.txt.mako")], Path("out") / f"{name}.txt")
+    return mklt
+
+
+def test_render_cache(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Second Workspace Gets Outputs From Cache."""
+    monkeypatch.chdir(create_workspace(tmp_path / "one"))
+    mklt = _gen(cache_path, "impl")
+    assert mklt.cachestat.misses["render"] == 1
+    assert mklt.tracker.stat == "1 files. 1 CREATED."
+    text = Path("out/impl.txt").read_text()
+
+    monkeypatch.chdir(create_workspace(tmp_path / "two"))
+    mklt = _gen(cache_path, "impl")
+    assert mklt.cachestat.hits["render"] == 1
+    assert "render" not in mklt.cachestat.misses
+    assert mklt.tracker.stat == "1 files. 1 CREATED."
+    assert Path("out/impl.txt").read_text() == text
+
+    # timestamp is kept on hit
+    os.utime("out/impl.txt", ns=(0, 0))
+    mklt = _gen(cache_path, "impl")
+    assert mklt.cachestat.hits["render"] == 1
+    assert mklt.tracker.stat == "1 files. 1 identical. untouched."
+    assert Path("out/impl.txt").stat().st_mtime_ns == 0
+
+    # template modified
+    with Path("tpl/base.txt.mako").open("a") as file:
+        file.write("modified\n")
+    mklt = _gen(cache_path, "impl")
+    assert mklt.cachestat.misses["render"] == 1
+    assert mklt.tracker.stat == "1 files. 1 UPDATED."
+
+    # configuration
+    mklt = _gen(cache_path, "impl", marker_fill="-")
+    assert mklt.cachestat.misses["render"] == 1
+
+
+def test_render_cache_dynamic(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Dynamically Included Templates Are Verified."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    assert _gen(cache_path, "dyn").cachestat.misses["render"] == 1
+    assert _gen(cache_path, "dyn").cachestat.hits["render"] == 1
+    Path("tpl/leaf.txt.mako").write_text("other leaf\n")
+    assert _gen(cache_path, "dyn").cachestat.misses["render"] == 1
+    assert Path("out/dyn.txt").read_text() == "other leaf\n\n"
+
+
+def test_render_cache_nested(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Renders Creating Further Outputs Are Not Cached."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    assert _gen(cache_path, "outer").tracker.stat == "2 files. 2 CREATED."
+    Path("out/inner.txt").unlink()
+    mklt = _gen(cache_path, "outer")
+    assert mklt.tracker.stat == "2 files. 1 identical. untouched. 1 CREATED."
+    # only the inner render is served from cache
+    assert mklt.cachestat.misses["render"] == 1
+    assert mklt.cachestat.hits["render"] == 1
+    assert Path("out/inner.txt").read_text() == "leaf\n"
+
+
+def test_render_cache_undigestable(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Renders Depending On Undigestable Values Are Not Cached."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    for _ in range(2):
+        config = Config(template_paths=[Path("tpl")], cache_path=cache_path, render_cache=True)
+        mklt = Makolator(config=config)
+        mklt.datamodel.item = object()
+        mklt.gen([Path("impl.txt.mako")], Path("out") / "impl.txt")
+        assert "render" not in mklt.cachestat.hits
+        assert "render" not in mklt.cachestat.misses
+
+
+def test_render_cache_depfile(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Depfiles Are Written On Hits."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    _gen(cache_path, "dyn", depfile=True)
+    depfile = Path("out/dyn.txt.d")
+    text = depfile.read_text()
+    depfile.unlink()
+    assert _gen(cache_path, "dyn", depfile=True).cachestat.hits["render"] == 1
+    assert depfile.read_text() == text
+
+
+def test_render_cache_inplace(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Inplace Outputs Are Cached."""
+    config = Config(
+        template_paths=[Path("tpl")], cache_path=cache_path, cache_mode=CacheMode.CONTENT, render_cache=True, track=True
+    )
+    for workspace in ("one", "two"):
+        monkeypatch.chdir(create_workspace(tmp_path / workspace))
+        mklt = Makolator(config=config)
+        mklt.inplace([Path("inplace.txt.mako")], Path("inplace.txt"))
+        assert mklt.tracker.stat == "1 files. 1 UPDATED."
+    assert mklt.cachestat.hits["render"] == 1
+    assert (tmp_path / "one" / "inplace.txt").read_text() == (tmp_path / "two" / "inplace.txt").read_text()
+
+    mklt = Makolator(config=config)
+    mklt.inplace([Path("inplace.txt.mako")], Path("inplace.txt"))
+    assert mklt.tracker.stat == "1 files. 1 identical. untouched."
+
+
+def test_render_cache_async(tmp_path, cache_path, monkeypatch, create_workspace):
+    """Async Rendering Uses The Cache."""
+    monkeypatch.chdir(create_workspace(tmp_path))
+    _gen(cache_path, "impl")
+    config = Config(
+        template_paths=[Path("tpl")], cache_path=cache_path, cache_mode=CacheMode.CONTENT, render_cache=True
+    )
+    mklt = Makolator(config=config)
+    asyncio.run(mklt.agen([Path("impl.txt.mako")], Path("out") / "impl.txt"))
+    assert mklt.cachestat.hits["render"] == 1
+
+
+def test_render_cache_record_per_render(tmp_path, cache_path):
+    """Outputs Written By Other Threads Do Not Belong To The Current Render."""
+    mklt = Makolator(config=Config(cache_path=cache_path, render_cache=True))
+    with mklt._record(tmp_path / "out.txt") as recording:
+        thread = threading.Thread(target=mklt._write_file, args=(tmp_path / "other.txt", "other"))
+        thread.start()
+        thread.join()
+        mklt._write_file(tmp_path / "inner.txt", "inner")
+    assert recording.outputs == {str(tmp_path / "inner.txt")}
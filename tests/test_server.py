@@ -0,0 +1,173 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Server Testing."""
+
+import socket
+import threading
+import time
+from pathlib import Path
+from shutil import copyfile
+
+from pytest import fixture, mark, raises
+
+from makolator import Config, Makolator, MakolatorError, Server
+from makolator.server import request
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+pytestmark = mark.skipif(not hasattr(socket, "AF_UNIX"), reason="UNIX sockets required")
+
+
+@fixture
+def server(tmp_path):
+    """Running Server."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA]))
+    server = Server(mklt, tmp_path / "makolator.sock")
+    thread = threading.Thread(target=server.serve, kwargs={"timeout": 0.05})
+    thread.start()
+    wait(server.path)
+    yield server
+    if thread.is_alive():
+        request(server.path, {"cmd": "shutdown"})
+    thread.join()
+
+
+def test_server(tmp_path, server):
+    """Gen, Inplace And Clean Via Server."""
+    filepath = tmp_path / "inplace.txt"
+    copyfile(TESTDATA / "inplace.txt", filepath)
+
+    response = request(
+        server.path, {"cmd": "gen", "templates": ["test.txt.mako"], "output": "test.txt", "cwd": str(tmp_path)}
+    )
+    assert response == {"ok": True, "files": [[str(tmp_path / "test.txt"), "CREATED."]], "stat": "1 files. 1 CREATED."}
+
+    response = request(
+        server.path,
+        {"cmd": "inplace", "templates": ["inplace.txt.mako"], "files": ["inplace.txt"], "cwd": str(tmp_path)},
+    )
+    assert response["files"] == [[str(filepath), "UPDATED."]]
+
+    response = request(server.path, {"cmd": "clean", "paths": [str(tmp_path / "test.txt")]})
+    assert response["files"] == [[str(tmp_path / "test.txt"), "identical. untouched."]]
+
+    response = request(server.path, {"cmd": "stat"})
+    assert response["requests"] == 5
+    assert "lookup: 1 hits 1 misses." in response["stat"]
+
+
+def test_server_error(tmp_path, server):
+    """Errors Are Reported."""
+    response = request(server.path, {"cmd": "gen", "templates": ["missing.txt.mako"], "output": str(tmp_path / "a")})
+    assert not response["ok"]
+    assert "None of the templates" in response["error"]
+
+    response = request(server.path, {"cmd": "foo"})
+    assert response == {
+        "ok": False,
+        "error": "'request': unknown cmd 'foo'. Use one of ['gen', 'inplace', 'clean'].",
+        "files": [],
+        "stat": "0 files.",
+    }
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server.path))
+        sock.sendall(b"[]\n{\n")
+        with sock.makefile("rb") as file:
+            assert b"invalid request: request must be an object" in file.readline()
+            assert b"invalid request" in file.readline()
+
+
+def test_server_template_error(tmp_path, server):
+    """Template Runtime Errors Are Reported."""
+    response = request(
+        server.path, {"cmd": "gen", "templates": ["undefined.txt.mako"], "output": "a.txt", "cwd": str(tmp_path)}
+    )
+    assert not response["ok"]
+    assert "'b' is not defined" in response["error"]
+    assert response["files"] == [[str(tmp_path / "a.txt"), "FAILED."]]
+    assert request(server.path, {"cmd": "stat"})["ok"]
+
+
+def test_server_cwd_templates(tmp_path, server):
+    """Templates Are Searched Within The Request Directory."""
+    (tmp_path / "local.txt.mako").write_text("local\n")
+    response = request(
+        server.path, {"cmd": "gen", "templates": ["local.txt.mako"], "output": "local.txt", "cwd": str(tmp_path)}
+    )
+    assert response["ok"], response
+    assert (tmp_path / "local.txt").read_text() == "local\n"
+    assert server.mklt.config.template_paths == [TESTDATA]
+
+    response = request(
+        server.path, {"cmd": "gen", "templates": ["local.txt.mako"], "output": "local.txt", "cwd": str(TESTDATA)}
+    )
+    assert not response["ok"]
+
+
+def test_server_new_templates(tmp_path, server):
+    """Templates Created Between Requests Are Found."""
+    (tmp_path / "a.txt.mako").write_text("a\n")
+    data = {"cmd": "gen", "templates": ["b.txt.mako", "a.txt.mako"], "output": "out.txt", "cwd": str(tmp_path)}
+    assert request(server.path, data)["ok"]
+    assert (tmp_path / "out.txt").read_text() == "a\n"
+
+    (tmp_path / "b.txt.mako").write_text("b\n")
+    assert request(server.path, data)["ok"]
+    assert (tmp_path / "out.txt").read_text() == "b\n"
+
+
+def test_server_running(server):
+    """Second Server On Same Socket."""
+    with raises(MakolatorError, match="Server already running"):
+        Server(Makolator(), server.path).serve()
+
+
+def test_server_stale(tmp_path):
+    """Stale Socket Is Replaced."""
+    path = tmp_path / "makolator.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(path))
+    server = Server(Makolator(), path)
+    thread = threading.Thread(target=server.serve, kwargs={"timeout": 0.05})
+    thread.start()
+    wait(path)
+    request(path, {"cmd": "shutdown"})
+    thread.join()
+    assert not path.exists()
+
+
+def wait(path: Path):
+    """Wait Until Server Is Responding."""
+    while not path.exists() or not is_responding(path):
+        time.sleep(0.01)
+
+
+def is_responding(path: Path) -> bool:
+    """Server Answers."""
+    try:
+        return request(path, {"cmd": "stat"})["ok"]
+    except OSError:
+        return False
@@ -0,0 +1,99 @@
+#
+# MIT License
+#
+# Copyright (c) 2026 nbiotcloud
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Watch Mode Testing."""
+
+from pathlib import Path
+from shutil import copyfile
+
+from makolator import Config, Makolator, Manifest, ManifestJob, Watcher
+
+FILEPATH = Path(__file__)
+TESTDATA = FILEPATH.parent / "testdata"
+
+
+def test_watch(tmp_path, update_file):
+    """Only Affected Jobs Are Re-Run."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    (tpl_path / "base.txt.mako").write_text("base\n${self.body()}")
+    (tpl_path / "child.txt.mako").write_text('<%inherit file="base.txt.mako"/>\nchild\n')
+    (tpl_path / "other.txt.mako").write_text("other\n")
+    copyfile(TESTDATA / "inplace-tpl.txt", tmp_path / "inplace.txt")
+    model = tmp_path / "model.json"
+    model.write_text("{}")
+    jobs = [
+        ManifestJob("gen", [Path("child.txt.mako")], [tmp_path / "child.txt"]),
+        ManifestJob("gen", [Path("other.txt.mako")], [tmp_path / "other.txt"]),
+        ManifestJob("inplace", [], [tmp_path / "inplace.txt"]),
+    ]
+    config = Config(template_paths=[tpl_path], track=True)
+    watcher = Watcher(Makolator(config=config), Manifest(config=config, jobs=jobs), inputs=[model], interval=0)
+
+    watcher.start()
+    assert (tmp_path / "child.txt").read_text() == "base\n\nchild\n"
+    assert watcher.poll() == []
+
+    update_file(tpl_path / "base.txt.mako", "BASE\n${self.body()}")
+    assert watcher.poll() == jobs[:1]
+    assert (tmp_path / "child.txt").read_text() == "BASE\n\nchild\n"
+
+    update_file(tmp_path / "inplace.txt", "\n", append=True)
+    assert watcher.poll() == jobs[2:]
+    assert watcher.poll() == []
+
+    update_file(model, '{"a": 1}')
+    assert watcher.poll() == jobs
+
+    # broken template is reported and watched further
+    update_file(tpl_path / "other.txt.mako", "${")
+    assert watcher.poll() == jobs[1:2]
+    update_file(tpl_path / "other.txt.mako", "OTHER\n")
+    assert watcher.poll() == jobs[1:2]
+    assert (tmp_path / "other.txt").read_text() == "OTHER\n"
+
+
+def test_watch_run(tmp_path):
+    """Run With Limited Iterations."""
+    mklt = Makolator(config=Config(template_paths=[TESTDATA]))
+    jobs = [ManifestJob("gen", [Path("test.txt.mako")], [tmp_path / "test.txt"])]
+    Watcher(mklt, Manifest(jobs=jobs), interval=0).run(iterations=2)
+    assert (tmp_path / "test.txt").exists()
+
+
+def test_watch_new_template(tmp_path):
+    """Templates Appearing In Front Of The Used One Re-Run The Job."""
+    tpl_path = tmp_path / "tpl"
+    tpl_path.mkdir()
+    (tpl_path / "a.txt.mako").write_text("a\n")
+    jobs = [ManifestJob("gen", [Path("b.txt.mako"), Path("a.txt.mako")], [tmp_path / "out.txt"])]
+    config = Config(template_paths=[tpl_path])
+    watcher = Watcher(Makolator(config=config), Manifest(config=config, jobs=jobs), interval=0)
+
+    watcher.start()
+    assert (tmp_path / "out.txt").read_text() == "a\n"
+    assert watcher.poll() == []
+
+    (tpl_path / "b.txt.mako").write_text("b\n")
+    assert watcher.poll() == jobs
+    assert (tmp_path / "out.txt").read_text() == "b\n"